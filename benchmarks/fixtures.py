@@ -0,0 +1,227 @@
+"""Types and payloads shaped like the data the benchmarks are meant to model."""
+
+import dataclasses
+import datetime
+import enum
+import typing
+import uuid
+
+
+class OrderStatus(enum.Enum):
+    PENDING = 1
+    SHIPPED = 2
+    DELIVERED = 3
+
+
+@dataclasses.dataclass
+class Address:
+    street: str
+    city: str
+    postcode: str
+    country: str
+
+
+@dataclasses.dataclass
+class Customer:
+    id: int
+    name: str
+    email: str
+    address: Address
+    tags: typing.List[str]
+
+
+@dataclasses.dataclass
+class LineItem:
+    sku: str
+    quantity: int
+    price: float
+
+
+@dataclasses.dataclass
+class Order:
+    id: uuid.UUID
+    created: datetime.datetime
+    status: OrderStatus
+    customer: Customer
+    items: typing.List[LineItem]
+    shipping_address: typing.Optional[Address] = None
+    notes: typing.Optional[str] = None
+
+
+# A record with 50 fields of assorted scalar types.
+WIDE_FIELD_TYPES = [int, float, str, typing.Optional[str], bool]
+WideRecord = dataclasses.make_dataclass(
+    "WideRecord",
+    [(f"field_{i}", WIDE_FIELD_TYPES[i % len(WIDE_FIELD_TYPES)]) for i in range(50)],
+)
+
+
+@dataclasses.dataclass
+class Series:
+    name: str
+    timestamps: typing.List[int]
+    values: typing.List[float]
+
+
+@dataclasses.dataclass
+class Click:
+    x: int
+    y: int
+    target: str
+
+
+@dataclasses.dataclass
+class Purchase:
+    sku: str
+    amount: float
+    currency: str
+
+
+@dataclasses.dataclass
+class PageView:
+    url: str
+    referrer: typing.Optional[str]
+    duration_ms: int
+
+
+@dataclasses.dataclass
+class Event:
+    session: str
+    payload: typing.Union[Click, Purchase, PageView]
+    value: typing.Union[int, float, str, None]
+
+
+class SlottedPoint:
+    __slots__ = ("x", "y", "z", "label")
+
+    def __init__(self, x: float, y: float, z: float, label: str):
+        self.x = x
+        self.y = y
+        self.z = z
+        self.label = label
+
+
+def _address(i):
+    return {
+        "street": f"{i} Main Street",
+        "city": "Springfield",
+        "postcode": f"{i % 100000:05}",
+        "country": "CA",
+    }
+
+
+def order_values(size):
+    return [
+        {
+            "id": str(uuid.UUID(int=i)),
+            "created": "2019-03-26T12:30:00",
+            "status": "SHIPPED",
+            "customer": {
+                "id": i,
+                "name": f"Customer {i}",
+                "email": f"customer{i}@example.com",
+                "address": _address(i),
+                "tags": ["wholesale", "priority"],
+            },
+            "items": [
+                {"sku": f"SKU-{j}", "quantity": j + 1, "price": 9.99} for j in range(5)
+            ],
+            "shipping_address": _address(i + 1) if i % 2 else None,
+        }
+        for i in range(size)
+    ]
+
+
+def dirty_order_values(size):
+    # Every other order has a quantity that isn't a number in its last item,
+    # as found in feeds that are only partly clean.
+    values = order_values(size)
+    for value in values[::2]:
+        value["items"][-1]["quantity"] = "many"
+    return values
+
+
+@dataclasses.dataclass
+class Comment:
+    author: str
+    text: str
+    replies: typing.List["Comment"]
+
+
+def thread_value(depth):
+    # A thread of replies nested `depth` deep, with a couple of short replies
+    # at each level, as found in long arguments on forums.
+    value = {"author": "a", "text": "First!", "replies": []}
+    for i in range(depth):
+        value = {
+            "author": f"user{i % 7}",
+            "text": "No, you're wrong.",
+            "replies": [value, {"author": "b", "text": "+1", "replies": []}],
+        }
+    return value
+
+
+def _wide_value(field_type, i):
+    if field_type is bool:
+        return i % 2 == 0
+    if field_type is int:
+        return i
+    if field_type is float:
+        return i + 0.5
+    return f"value {i}"
+
+
+def wide_record_values(size):
+    return [
+        {
+            field.name: _wide_value(field.type, i)
+            for field in dataclasses.fields(WideRecord)
+        }
+        for i in range(size)
+    ]
+
+
+def series_values(size):
+    # A single record holding lists of `size` values.
+    return [
+        {
+            "name": "temperature",
+            "timestamps": list(range(size)),
+            "values": [i * 0.25 for i in range(size)],
+        }
+    ]
+
+
+def event_values(size):
+    payloads = [
+        {"x": 10, "y": 20, "target": "button"},
+        {"sku": "SKU-1", "amount": 19.99, "currency": "CAD"},
+        {"url": "/checkout", "referrer": None, "duration_ms": 1200},
+    ]
+    scalars = [1, 2.5, "three", None]
+    return [
+        {
+            "session": f"session-{i}",
+            "payload": payloads[i % len(payloads)],
+            "value": scalars[i % len(scalars)],
+        }
+        for i in range(size)
+    ]
+
+
+def slotted_point_values(size):
+    return [
+        {"x": i * 1.0, "y": i * 2.0, "z": i * 3.0, "label": f"point {i}"}
+        for i in range(size)
+    ]
+
+
+# The name of each fixture with its goal type and a function making a list of
+# `size` unstructured values of it.
+FIXTURES = [
+    ("nested_orders", Order, order_values),
+    ("wide_records", WideRecord, wide_record_values),
+    ("large_lists", Series, series_values),
+    ("union_events", Event, event_values),
+    ("slotted_points", SlottedPoint, slotted_point_values),
+]
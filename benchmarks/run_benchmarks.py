@@ -0,0 +1,201 @@
+"""Benchmarks of structuring and unstructuring realistic payloads.
+
+Run with `make perf-tests`, or directly::
+
+    python benchmarks/run_benchmarks.py -o bench.json --sizes 10,1000,100000
+
+Pass `--tracemalloc` to record the peak memory allocated by each benchmark
+rather than its time, and compare results against a saved baseline with::
+
+    python -m pyperf compare_to baseline.json bench.json --table
+"""
+
+import json
+import os
+import sys
+import typing
+
+import pyperf
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position,wrong-import-order,import-error
+from dataclass_structor import (
+    structure,
+    structure_json,
+    structure_many,
+    unstructure_many,
+    validate,
+)
+from fixtures import (
+    FIXTURES,
+    Comment,
+    Order,
+    Series,
+    dirty_order_values,
+    order_values,
+    series_values,
+    thread_value,
+)
+
+DEFAULT_SIZES = "10,1000"
+PARALLEL_WORKERS = 4
+
+
+def add_cmdline_args(cmd, args):
+    cmd.extend(["--sizes", args.sizes])
+
+
+def bench_structure_many(loops, values, goal_type):
+    range_it = range(loops)
+    t0 = pyperf.perf_counter()
+    for _ in range_it:
+        structure_many(values, goal_type)
+    return pyperf.perf_counter() - t0
+
+
+def bench_structure_many_in_processes(loops, values, goal_type, workers):
+    range_it = range(loops)
+    t0 = pyperf.perf_counter()
+    for _ in range_it:
+        structure_many(values, goal_type, workers=workers)
+    return pyperf.perf_counter() - t0
+
+
+def bench_structure_each(loops, values, goal_type, collect_errors):
+    range_it = range(loops)
+    t0 = pyperf.perf_counter()
+    for _ in range_it:
+        for value in values:
+            try:
+                structure(value, goal_type, collect_errors=collect_errors)
+            except ValueError:
+                pass
+    return pyperf.perf_counter() - t0
+
+
+def bench_validate_each(loops, values, goal_type):
+    range_it = range(loops)
+    t0 = pyperf.perf_counter()
+    for _ in range_it:
+        for value in values:
+            validate(value, goal_type)
+    return pyperf.perf_counter() - t0
+
+
+def bench_structure_json(loops, s, goal_type):
+    range_it = range(loops)
+    t0 = pyperf.perf_counter()
+    for _ in range_it:
+        structure_json(s, goal_type)
+    return pyperf.perf_counter() - t0
+
+
+def bench_loads_and_structure(loops, s, goal_type):
+    range_it = range(loops)
+    t0 = pyperf.perf_counter()
+    for _ in range_it:
+        structure(json.loads(s), goal_type)
+    return pyperf.perf_counter() - t0
+
+
+def bench_unstructure_many(loops, objs):
+    range_it = range(loops)
+    t0 = pyperf.perf_counter()
+    for _ in range_it:
+        unstructure_many(objs)
+    return pyperf.perf_counter() - t0
+
+
+def main():
+    runner = pyperf.Runner(add_cmdline_args=add_cmdline_args)
+    runner.argparser.add_argument(
+        "--sizes",
+        default=DEFAULT_SIZES,
+        help="Comma separated numbers of values in each payload "
+        f"(default: {DEFAULT_SIZES})",
+    )
+    args = runner.parse_args()
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    for name, goal_type, make_values in FIXTURES:
+        for size in sizes:
+            values = make_values(size)
+            objs = structure_many(values, goal_type)
+            runner.bench_time_func(
+                f"structure_{name}_{size}", bench_structure_many, values, goal_type
+            )
+            runner.bench_time_func(
+                f"unstructure_{name}_{size}", bench_unstructure_many, objs
+            )
+
+    # The cost of the failing path, with half of the orders failing deep
+    # within them, when stopping at the first error, collecting every error
+    # and only checking for errors.
+    for size in sizes:
+        values = dirty_order_values(size)
+        runner.bench_time_func(
+            f"structure_dirty_orders_{size}", bench_structure_each, values, Order, False
+        )
+        runner.bench_time_func(
+            f"structure_dirty_orders_{size}_collecting_errors",
+            bench_structure_each,
+            values,
+            Order,
+            True,
+        )
+        runner.bench_time_func(
+            f"validate_dirty_orders_{size}", bench_validate_each, values, Order
+        )
+
+    # Threads nested more deeply than the recursion limit allows are
+    # structured and unstructured again without recursion, so comparing the
+    # time per level of shallow and deep threads shows the cost of that.
+    for size in sizes:
+        value = thread_value(size)
+        runner.bench_time_func(
+            f"structure_thread_{size}_deep",
+            bench_structure_each,
+            [value],
+            Comment,
+            False,
+        )
+        runner.bench_time_func(
+            f"unstructure_thread_{size}_deep",
+            bench_unstructure_many,
+            [structure(value, Comment)],
+        )
+
+    # Lists of scalars, alone and in an object, have no nested values to build
+    # while decoding, so structuring them while decoding JSON should cost no
+    # more than decoding the JSON and then structuring it.
+    for size in sizes:
+        for name, goal_type, s in (
+            ("ints", typing.List[int], json.dumps(list(range(size)))),
+            ("large_lists", Series, json.dumps(series_values(size)[0])),
+        ):
+            runner.bench_time_func(
+                f"structure_json_{name}_{size}", bench_structure_json, s, goal_type
+            )
+            runner.bench_time_func(
+                f"loads_and_structure_{name}_{size}",
+                bench_loads_and_structure,
+                s,
+                goal_type,
+            )
+
+    # Comparing these with the serial structuring shows the payload size at
+    # which the cost of starting processes and pickling values stops
+    # dominating.
+    for size in sizes:
+        runner.bench_time_func(
+            f"structure_nested_orders_{size}_in_{PARALLEL_WORKERS}_processes",
+            bench_structure_many_in_processes,
+            order_values(size),
+            Order,
+            PARALLEL_WORKERS,
+        )
+
+
+if __name__ == "__main__":
+    main()
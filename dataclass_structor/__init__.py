@@ -1,7 +1,80 @@
 """Typed object structure/destructure."""
-from .structure import structure
-from .unstructure import unstructure
+from .structure import (
+    UNSELECTED,
+    StructureErrors,
+    ValidationError,
+    structure,
+    get_structurer,
+    invalidate_type_hints,
+    parse_cache_info,
+    register_case_insensitive_enum,
+    register_structure_hook,
+    register_tagged_union,
+    resolve_type_hints,
+    set_parse_cache_size,
+    structure_many,
+)
+from .aio import astructure_iter
+from .columns import structure_columns, unstructure_columns
+from .compact import compact_type
+from .dedup import Deduplicator
+from .instrumentation import (
+    TypeStats,
+    add_stats_callback,
+    disable_stats,
+    enable_stats,
+    remove_stats_callback,
+    reset_stats,
+    stats,
+)
+from .json_structure import structure_json
+from .json_unstructure import dump_json, unstructure_json
+from .jsonl import IndexedJSONLines, JSONLinesError, iter_structure
+from .lazy import structure_lazy
+from .unstructure import register_unstructure_hook, unstructure, unstructure_many
+from .validate import validate
+from .warmup import register, save_warmup_plan, warmup
 
 __version__ = "0.0.6"
 
-__all__ = [str(structure), str(unstructure)]
+__all__ = [
+    "JSONLinesError",
+    "iter_structure",
+    "IndexedJSONLines",
+    "structure",
+    "get_structurer",
+    "invalidate_type_hints",
+    "register_tagged_union",
+    "register_structure_hook",
+    "register_case_insensitive_enum",
+    "set_parse_cache_size",
+    "parse_cache_info",
+    "resolve_type_hints",
+    "structure_many",
+    "UNSELECTED",
+    "Deduplicator",
+    "compact_type",
+    "validate",
+    "ValidationError",
+    "StructureErrors",
+    "structure_json",
+    "structure_lazy",
+    "astructure_iter",
+    "unstructure",
+    "unstructure_many",
+    "register_unstructure_hook",
+    "unstructure_json",
+    "structure_columns",
+    "unstructure_columns",
+    "dump_json",
+    "register",
+    "warmup",
+    "save_warmup_plan",
+    "TypeStats",
+    "enable_stats",
+    "disable_stats",
+    "reset_stats",
+    "stats",
+    "add_stats_callback",
+    "remove_stats_callback",
+]
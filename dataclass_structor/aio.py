@@ -0,0 +1,144 @@
+import asyncio
+import concurrent.futures
+import functools
+import time
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, List, Optional, Union
+
+from .structure import get_structurer, structure_many
+
+# How often `astructure_iter` gives the event loop a chance to run other tasks.
+YIELD_EVERY = 100
+YIELD_INTERVAL = 0.001
+
+
+async def astructure_iter(  # pylint: disable=too-many-arguments
+    source: Union[AsyncIterable[Any], Iterable[Any]],
+    goal_type: Any,
+    *,
+    yield_every: int = YIELD_EVERY,
+    yield_interval: float = YIELD_INTERVAL,
+    executor: Optional[concurrent.futures.Executor] = None,
+    chunksize: int = 1000,
+) -> AsyncIterator[Any]:
+    """Yields an object for each value of an (async) iterable given the type
+    that each value is to be coerced into.
+
+    Values are structured as they arrive. The event loop is given a chance to
+    run other tasks after every `yield_every` values or `yield_interval`
+    seconds, whichever comes first, so long batches don't block it.
+
+    :param source: An async iterable (or iterable) of values that you would
+        like to structure.
+    :param goal_type: A type that you would like to cast each value into.
+    :param yield_every: The most values to structure before yielding to the
+        event loop.
+    :param yield_interval: The most seconds to spend structuring before
+        yielding to the event loop.
+    :param executor: Structure chunks of values in this thread or process
+        pool rather than in the event loop. The values and goal type must be
+        picklable to use a process pool.
+    :param chunksize: The most values sent to the executor at a time. Fewer
+        are sent once `yield_interval` seconds have passed since the first of
+        them arrived. The next chunk is received while one is structured.
+
+    Usage::
+
+      >>> import dataclass_structor
+      >>> async for guest in dataclass_structor.astructure_iter(rows, Guest):
+      ...     print(guest)
+      Guest(first_name='Bobby Jim')
+    """
+    if executor is not None:
+        async for obj in _astructure_in_executor(
+            source, goal_type, executor, chunksize, yield_interval
+        ):
+            yield obj
+        return
+
+    structurer = get_structurer(goal_type)
+    count = 0
+    deadline = time.monotonic() + yield_interval
+    async for value in _aiter(source):
+        yield structurer(value)
+        count += 1
+        if count >= yield_every or time.monotonic() >= deadline:
+            await asyncio.sleep(0)
+            count = 0
+            deadline = time.monotonic() + yield_interval
+
+
+async def _aiter(
+    source: Union[AsyncIterable[Any], Iterable[Any]],
+) -> AsyncIterator[Any]:
+    if hasattr(source, "__aiter__"):
+        async for value in source:  # type: ignore
+            yield value
+    else:
+        for value in source:  # type: ignore
+            yield value
+
+
+async def _astructure_in_executor(  # pylint: disable=too-many-locals,too-many-branches
+    source: Union[AsyncIterable[Any], Iterable[Any]],
+    goal_type: Any,
+    executor: concurrent.futures.Executor,
+    chunksize: int,
+    flush_interval: float,
+) -> AsyncIterator[Any]:
+    # Structures a chunk of values in the executor while the next chunk is
+    # received. A chunk is sent once it is full or `flush_interval` seconds
+    # after its first value arrived, so values from slow sources aren't held
+    # back waiting for a full chunk.
+    loop = asyncio.get_running_loop()
+    values = _aiter(source)
+    receiving: Optional[asyncio.Future] = None
+    structuring: Optional[asyncio.Future] = None
+    structured: Optional[List[Any]] = None
+    exhausted = False
+    chunk: List[Any] = []
+    deadline = 0.0
+    try:
+        while True:
+            if (
+                structuring is None
+                and chunk
+                and (
+                    exhausted or len(chunk) >= chunksize or time.monotonic() >= deadline
+                )
+            ):
+                structuring = loop.run_in_executor(
+                    executor, functools.partial(structure_many, chunk, goal_type)
+                )
+                chunk = []
+            if receiving is None and not exhausted and len(chunk) < chunksize:
+                receiving = asyncio.ensure_future(values.__anext__())
+            if structured is not None:
+                for obj in structured:
+                    yield obj
+                structured = None
+
+            pending = {f for f in (receiving, structuring) if f is not None}
+            if not pending:
+                return
+            timeout = (
+                deadline - time.monotonic() if chunk and structuring is None else None
+            )
+            done, _ = await asyncio.wait(
+                pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            if receiving is not None and receiving in done:
+                try:
+                    value = receiving.result()
+                except StopAsyncIteration:
+                    exhausted = True
+                else:
+                    if not chunk:
+                        deadline = time.monotonic() + flush_interval
+                    chunk.append(value)
+                receiving = None
+            if structuring is not None and structuring in done:
+                structured = structuring.result()
+                structuring = None
+    finally:
+        if receiving is not None:
+            receiving.cancel()
@@ -0,0 +1,110 @@
+import array
+import operator
+from dataclasses import is_dataclass
+from typing import Any, Dict, List, Mapping, Sequence
+
+from .structure import get_structurer, resolve_type_hints
+from .unstructure import _get_dataclass_field_names, _get_slot_names, unstructure_many
+
+try:
+    import numpy  # type: ignore
+except ImportError:  # pragma: no cover
+    numpy = None  # pylint: disable=invalid-name
+
+
+# The typecodes of the `array.array` used to store columns of each type.
+_ARRAY_TYPECODES = {int: "q", float: "d"}
+
+
+def unstructure_columns(
+    records: Sequence[Any], use_numpy: bool = False
+) -> Dict[str, Any]:
+    """Returns a dict of columns, one for each field, given a list of objects
+    of the same type.
+
+    Columns of `int` or `float` fields are stored in an `array.array` (or a
+    NumPy array if `use_numpy` is set) when all of their values fit, other
+    columns are lists of unstructured values.
+
+    :param records: A list of dataclasses or slotted classes of the same type.
+    :param use_numpy: Store numeric columns in NumPy arrays. Requires NumPy to
+        be installed.
+
+    Usage::
+
+      >>> import dataclass_structor
+      >>> dataclass_structor.unstructure_columns([Point(1, 2.5), Point(2, 3.5)])
+      {'x': array('q', [1, 2]), 'y': array('d', [2.5, 3.5])}
+    """
+    if use_numpy and numpy is None:
+        raise ImportError("NumPy is required to store columns in NumPy arrays")
+    if not records:
+        return {}
+
+    record_type = type(records[0])
+    if is_dataclass(record_type):
+        field_names = _get_dataclass_field_names(record_type)
+    else:
+        field_names = _get_slot_names(record_type)
+    hints = resolve_type_hints(record_type)
+
+    columns = {}
+    for name in field_names:
+        values = list(map(operator.attrgetter(name), records))
+        columns[name] = _to_column(values, hints.get(name), use_numpy)
+    return columns
+
+
+def _to_column(values: List[Any], goal_type: Any, use_numpy: bool) -> Any:
+    typecode = _ARRAY_TYPECODES.get(goal_type)
+    if typecode is not None:
+        try:
+            if use_numpy:
+                return numpy.array(array.array(typecode, values))
+            return array.array(typecode, values)
+        except (OverflowError, TypeError):
+            pass
+    return unstructure_many(values)
+
+
+def structure_columns(
+    columns: Mapping[str, Sequence[Any]], goal_type: Any
+) -> List[Any]:
+    """Returns a list of objects given a dict of columns, one for each field,
+    and the type that each row is to be coerced into.
+
+    Each column is structured in bulk before the objects are built.
+
+    :param columns: A dict of field names to lists, `array.array` or NumPy
+        arrays of values, all of the same length.
+    :param goal_type: A type that you would like each row cast into.
+
+    Usage::
+
+      >>> import dataclass_structor
+      >>> columns = {'x': array('q', [1, 2]), 'y': array('d', [2.5, 3.5])}
+      >>> dataclass_structor.structure_columns(columns, Point)
+      [Point(x=1, y=2.5), Point(x=2, y=3.5)]
+    """
+    names = list(columns)
+    lengths = {len(column) for column in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"Could not structure columns of different lengths {lengths}")
+
+    hints = resolve_type_hints(goal_type)
+    structured_columns = []
+    for name in names:
+        if name not in hints:
+            raise ValueError(f"Could not structure: column {name} into {goal_type}")
+        structured_columns.append(_from_column(columns[name], hints[name]))
+
+    return [goal_type(**dict(zip(names, row))) for row in zip(*structured_columns)]
+
+
+def _from_column(column: Sequence[Any], goal_type: Any) -> List[Any]:
+    if hasattr(column, "tolist"):
+        # `array.array` and NumPy arrays are converted into lists of Python
+        # ints and floats, which may be for fields of any type (e.g. enums).
+        column = column.tolist()  # type: ignore
+    structurer = get_structurer(goal_type)
+    return [structurer(value) for value in column]
@@ -0,0 +1,109 @@
+import dataclasses
+import typing
+import weakref
+from typing import Any, Dict, Union
+
+from .structure import _TYPE_HINTS_ATTRIBUTE, _NoneType, resolve_type_hints
+
+# The generic types whose arguments are made compact, by their `_name`.
+_GENERIC_TYPES_BY_NAME = {
+    "List": typing.List,
+    "Set": typing.Set,
+    "Tuple": typing.Tuple,
+    "Dict": typing.Dict,
+}
+
+
+def compact_type(goal_type: Any) -> Any:
+    """Returns a twin of a dataclass which keeps its fields in `__slots__`
+    rather than in a `__dict__` per instance, using much less memory per
+    object. Dataclasses held by its fields (including in lists, tuples, sets,
+    dicts and optionals) are made compact too.
+
+    The twin has the same name, fields, defaults and methods as the dataclass
+    and can be structured into and unstructured like it. It isn't a subclass
+    of the dataclass, its instances don't compare equal to instances of the
+    dataclass and it can't be pickled. Methods which call `super()` without
+    arguments won't work on it. Dataclasses that inherit from a dataclass
+    without slots still get a `__dict__` from their base.
+
+    :param goal_type: A dataclass.
+
+    Usage::
+
+      >>> import dataclass_structor
+      >>> CompactGuest = dataclass_structor.compact_type(Guest)
+      >>> guest = dataclass_structor.structure({"first_name": "Bobby Jim"}, CompactGuest)
+      >>> guest.__slots__
+      ('first_name',)
+      >>> dataclass_structor.unstructure(guest)
+      {'first_name': 'Bobby Jim'}
+    """
+    if not (isinstance(goal_type, type) and dataclasses.is_dataclass(goal_type)):
+        raise ValueError(f"Could not make a compact type of {goal_type}")
+    return _get_compact_type(goal_type)
+
+
+def _get_compact_type(goal_type: type) -> type:
+    if "__slots__" in vars(goal_type):
+        return goal_type
+    try:
+        return _COMPACT_TYPES[goal_type]
+    except KeyError:
+        pass
+
+    field_names = tuple(f.name for f in dataclasses.fields(goal_type))
+    namespace: Dict[str, Any] = {
+        name: value
+        for name, value in vars(goal_type).items()
+        if name not in field_names
+        and name not in ("__dict__", "__weakref__", _TYPE_HINTS_ATTRIBUTE)
+    }
+    namespace["__slots__"] = field_names
+    if goal_type.__dataclass_params__.frozen:  # type: ignore
+        # The methods made by `dataclasses` for frozen dataclasses refer to the
+        # dataclass, which would keep it from being collected while its twin
+        # is kept in `_COMPACT_TYPES`.
+        namespace["__setattr__"] = _frozen_setattr
+        namespace["__delattr__"] = _frozen_delattr
+    compact = type(goal_type)(goal_type.__name__, goal_type.__bases__, namespace)
+
+    # Registered before its fields are made compact so that dataclasses which
+    # refer to themselves (e.g. trees) are made compact once.
+    _COMPACT_TYPES[goal_type] = compact
+    compact.__annotations__ = {
+        name: _compact_hint(hint)
+        for name, hint in resolve_type_hints(goal_type).items()
+    }
+    return compact
+
+
+# Compact twins keyed by the dataclass they were made from. The twins mustn't
+# refer to the dataclass, so that it can still be collected.
+_COMPACT_TYPES: "weakref.WeakKeyDictionary[type, type]" = weakref.WeakKeyDictionary()
+
+
+def _frozen_setattr(self: Any, name: str, value: Any) -> None:
+    raise dataclasses.FrozenInstanceError(f"cannot assign to field {name!r}")
+
+
+def _frozen_delattr(self: Any, name: str) -> None:
+    raise dataclasses.FrozenInstanceError(f"cannot delete field {name!r}")
+
+
+def _compact_hint(hint: Any) -> Any:
+    if isinstance(hint, type) and dataclasses.is_dataclass(hint):
+        return _get_compact_type(hint)
+    args = getattr(hint, "__args__", None)
+    if not args:
+        return hint
+    if getattr(hint, "__origin__", None) is Union:
+        return Union[tuple(_compact_hint(arg) for arg in args)]  # type: ignore
+    generic_type = _GENERIC_TYPES_BY_NAME.get(getattr(hint, "_name", ""))
+    if generic_type is None:
+        return hint
+    return generic_type[  # type: ignore
+        tuple(
+            arg if arg in (Ellipsis, _NoneType) else _compact_hint(arg) for arg in args
+        )
+    ]
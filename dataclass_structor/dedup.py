@@ -0,0 +1,197 @@
+import dataclasses
+import enum
+import itertools
+import sys
+from typing import Any, Collection, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# The names of the fields of a dataclass, whether the strings of each field are
+# interned, and whether the dataclass is frozen and compared by its fields.
+_ClassPlan = Tuple[Tuple[str, ...], Tuple[bool, ...], bool]
+
+# A list, tuple, dict or dataclass being deduplicated, with an iterator of the
+# values it holds (each with whether its strings are interned) and the values
+# deduplicated so far.
+_Frame = Tuple[Any, Iterator[Tuple[Any, bool]], List[Any]]
+
+# The types of values which can be told apart by their type and value alone,
+# so objects holding them can be shared without swapping in a different value
+# which only compares equal (e.g. `1.0` for `True`).
+_EXACT_TYPES = frozenset([str, int, bool, type(None)])
+
+
+class Deduplicator:
+    """Shares equal strings and frozen objects between structured values to
+    reduce the memory held by large batches of them.
+
+    Strings held by the selected fields of dataclasses (including the strings
+    within lists, tuples and dicts held by those fields) are interned. Frozen
+    dataclasses and tuples are replaced by the first one seen holding the same
+    values of exactly the same types, when those values are strings, ints,
+    floats, bools, `None`, enum members or objects that are shared themselves.
+    Objects holding other values (e.g. decimals or datetimes, which can be
+    equal while holding different values) aren't shared. Use the same
+    deduplicator across batches to share objects between batches, bearing in
+    mind it keeps a reference to every frozen object it has shared.
+
+    :param intern_fields: The names of the fields whose strings should be
+        interned. Defaults to the strings of every field. Interning strings
+        which are rarely repeated (e.g. ids) costs memory rather than saving
+        it, so prefer naming the fields whose strings repeat.
+
+    Usage::
+
+      >>> import dataclass_structor
+      >>> dedup = dataclass_structor.Deduplicator(intern_fields={"status"})
+      >>> orders = dataclass_structor.structure_many(values, Order, dedup=dedup)
+    """
+
+    def __init__(self, intern_fields: Optional[Collection[str]] = None):
+        self.intern_fields = None if intern_fields is None else frozenset(intern_fields)
+        self._shared: Dict[Any, Any] = {}
+        self._shared_ids: Set[int] = set()
+        self._class_plans: Dict[type, Optional[_ClassPlan]] = {}
+
+    def __call__(self, obj: Any) -> Any:
+        """Returns the object with its strings interned and its frozen objects
+        shared, which may be an object seen before. Lists, dicts and
+        dataclasses are updated in place.
+
+        :param obj: A structured object.
+        """
+        intern_strings = self.intern_fields is None
+        try:
+            return self._dedup(obj, intern_strings)
+        except RecursionError:
+            # Whatever was deduplicated before the error is left as it would
+            # be after deduplicating it again.
+            return self._dedup_deep(obj, intern_strings)
+
+    def _dedup(self, obj: Any, intern_strings: bool) -> Any:
+        obj_type = type(obj)
+        if obj_type is str:
+            return sys.intern(obj) if intern_strings else obj
+        if obj_type is list:
+            for i, item in enumerate(obj):
+                obj[i] = self._dedup(item, intern_strings)
+            return obj
+        if obj_type is tuple:
+            deduped = tuple(  # pylint: disable=R1728
+                [self._dedup(i, intern_strings) for i in obj]
+            )
+            return self._share(deduped, deduped)
+        if obj_type is dict:
+            for key, value in obj.items():
+                obj[key] = self._dedup(value, intern_strings)
+            return obj
+
+        class_plan = self._get_class_plan(obj_type)
+        if class_plan is None:
+            return obj
+        names, intern_fields, shared = class_plan
+        for name, intern_field in zip(names, intern_fields):
+            value = getattr(obj, name)
+            deduped = self._dedup(value, intern_field)
+            if deduped is not value:
+                # Frozen dataclasses set their fields the same way.
+                object.__setattr__(obj, name, deduped)
+        return self._share(obj, [getattr(obj, n) for n in names]) if shared else obj
+
+    def _dedup_deep(self, obj: Any, intern_strings: bool) -> Any:
+        # Deduplicates objects nested too deeply for `_dedup`, with a stack of
+        # the containers and objects being deduplicated in place of the call
+        # stack.
+        frame = self._open(obj, intern_strings)
+        if frame is None:
+            return self._dedup(obj, intern_strings)
+        stack = [frame]
+        while True:
+            _, items, deduped = stack[-1]
+            for item, intern_item in items:
+                if item.__class__ is str:
+                    deduped.append(sys.intern(item) if intern_item else item)
+                    continue
+                if item.__class__ not in _EXACT_TYPES:
+                    frame = self._open(item, intern_item)
+                    if frame is not None:
+                        stack.append(frame)
+                        break
+                deduped.append(item)
+            else:
+                obj = self._close(*stack.pop())
+                if not stack:
+                    return obj
+                stack[-1][2].append(obj)
+
+    def _open(self, obj: Any, intern_strings: bool) -> Optional[_Frame]:
+        # Returns the frame for deduplicating the values held by the object, or
+        # `None` when it holds none.
+        obj_type = type(obj)
+        if obj_type in (list, tuple):
+            return obj, zip(obj, itertools.repeat(intern_strings)), []
+        if obj_type is dict:
+            return obj, zip(obj.values(), itertools.repeat(intern_strings)), []
+        class_plan = self._get_class_plan(obj_type)
+        if class_plan is None:
+            return None
+        names, intern_fields, _ = class_plan
+        return obj, zip([getattr(obj, name) for name in names], intern_fields), []
+
+    def _close(self, obj: Any, _items: Any, deduped: List[Any]) -> Any:
+        # Puts the deduplicated values back into the object once they've all
+        # been deduplicated, returning the object or the one it's shared with.
+        obj_type = type(obj)
+        if obj_type is list:
+            obj[:] = deduped
+            return obj
+        if obj_type is tuple:
+            deduped_tuple = tuple(deduped)
+            return self._share(deduped_tuple, deduped_tuple)
+        if obj_type is dict:
+            for key, value in zip(obj, deduped):
+                obj[key] = value
+            return obj
+        names, _, shared = self._class_plans[obj_type]  # type: ignore
+        for name, value in zip(names, deduped):
+            if value is not getattr(obj, name):
+                object.__setattr__(obj, name, value)
+        return self._share(obj, deduped) if shared else obj
+
+    def _share(self, obj: Any, values: Iterable[Any]) -> Any:
+        # Objects are shared by their type and the exact types and values they
+        # hold, so that only objects holding the same values are shared.
+        value_keys: List[Any] = []
+        for value in values:
+            value_type = type(value)
+            if value_type in _EXACT_TYPES or isinstance(value, enum.Enum):
+                value_keys.append((value_type, value))
+            elif value_type is float:
+                # Unlike the floats, their hex tells `0.0` from `-0.0`.
+                value_keys.append((value_type, value.hex()))
+            elif id(value) in self._shared_ids:
+                value_keys.append(id(value))
+            else:
+                return obj
+        shared = self._shared.setdefault((type(obj), tuple(value_keys)), obj)
+        self._shared_ids.add(id(shared))
+        return shared
+
+    def _get_class_plan(self, obj_type: type) -> Optional[_ClassPlan]:
+        try:
+            return self._class_plans[obj_type]
+        except KeyError:
+            pass
+        if not dataclasses.is_dataclass(obj_type):
+            self._class_plans[obj_type] = None
+            return None
+        params = obj_type.__dataclass_params__  # type: ignore
+        names = tuple(f.name for f in dataclasses.fields(obj_type))
+        class_plan = (
+            names,
+            tuple(
+                self.intern_fields is None or name in self.intern_fields
+                for name in names
+            ),
+            params.frozen and params.eq,
+        )
+        self._class_plans[obj_type] = class_plan
+        return class_plan
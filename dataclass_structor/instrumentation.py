@@ -0,0 +1,205 @@
+import dataclasses
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from .json_structure import _cached_compile_json_decoder
+from .lazy import _cached_compile_lazy_structurer
+from .structure import (
+    Structurer,
+    _Failure,
+    _PARSE_CACHES,
+    _STRUCTURER_WRAPPERS,
+    _TYPES_WITH_HINTS,
+    _cached_compile_raising_structurer,
+    clear_structurer_cache,
+)
+from .unstructure import UNSTRUCTURER_CACHE_SIZE, _UNSTRUCTURERS_BY_TYPE
+
+# A callback is called with the goal type, the seconds spent structuring the
+# value and whether the structuring failed after every value that is
+# structured while stats are enabled.
+StatsCallback = Callable[[Any, float, bool], None]
+
+
+@dataclasses.dataclass
+class TypeStats:
+    """Counters for the values structured into a goal type.
+
+    :ivar calls: The number of values structured.
+    :ivar time: The seconds spent structuring them, including the time spent
+        structuring the values nested within them.
+    :ivar failures: The number of values which raised an error or were
+        structured into `None`.
+    :ivar union_attempts: For unions, the number of members attempted.
+    """
+
+    calls: int = 0
+    time: float = 0.0
+    failures: int = 0
+    union_attempts: int = 0
+
+
+def enable_stats() -> None:
+    """Starts counting the values structured into each goal type.
+
+    Structurers are compiled with the counters built in, so the structurers
+    compiled so far are discarded. Values structured in other processes (e.g.
+    by `structure_many` with `workers`) aren't counted.
+
+    Usage::
+
+      >>> import dataclass_structor
+      >>> dataclass_structor.enable_stats()
+      >>> dataclass_structor.structure({"first_name": "Bobby Jim"}, Guest)
+      Guest(first_name='Bobby Jim')
+      >>> dataclass_structor.stats()["types"][Guest]
+      TypeStats(calls=1, time=1.1e-05, failures=0, union_attempts=0)
+    """
+    if _instrument_structurer not in _STRUCTURER_WRAPPERS:
+        _STRUCTURER_WRAPPERS.append(_instrument_structurer)
+        clear_structurer_cache()
+
+
+def disable_stats() -> None:
+    """Stops counting the values structured, leaving the counts so far in
+    place. Structurers are compiled without counters again so that there is no
+    overhead.
+    """
+    if _instrument_structurer in _STRUCTURER_WRAPPERS:
+        _STRUCTURER_WRAPPERS.remove(_instrument_structurer)
+        clear_structurer_cache()
+
+
+def reset_stats() -> None:
+    """Sets the counts of every goal type back to zero."""
+    for type_stats in _TYPE_STATS.values():
+        type_stats.calls = 0
+        type_stats.time = 0.0
+        type_stats.failures = 0
+        type_stats.union_attempts = 0
+
+
+def stats() -> Dict[str, Any]:
+    """Returns a snapshot of the counters for each goal type structured since
+    :func:`enable_stats` was called, and the hits and misses of the caches of
+    compiled structurers and of parsed strings.
+
+    The caches are counted whether or not stats are enabled. Their counts
+    start again whenever the compiled structurers are discarded.
+
+    Usage::
+
+      >>> import dataclass_structor
+      >>> dataclass_structor.stats()
+      {'types': {<class 'Guest'>: TypeStats(calls=1, ...)},
+       'caches': {'structurers': {'hits': 0, 'misses': 3, 'hit_rate': 0.0, ...}}}
+    """
+    return {
+        "types": {
+            goal_type: dataclasses.replace(type_stats)
+            for goal_type, type_stats in _TYPE_STATS.items()
+            if type_stats.calls
+        },
+        "caches": {
+            "structurers": _lru_cache_stats(_cached_compile_raising_structurer),
+            "json_decoders": _lru_cache_stats(_cached_compile_json_decoder),
+            "lazy_structurers": _lru_cache_stats(_cached_compile_lazy_structurer),
+            "type_hints": {"size": len(_TYPES_WITH_HINTS)},
+            "unstructurers": {
+                "size": len(_UNSTRUCTURERS_BY_TYPE),
+                "max_size": UNSTRUCTURER_CACHE_SIZE,
+            },
+            **{
+                f"parsed_{goal_type.__name__}": _lru_cache_stats(parse_cache)
+                for goal_type, parse_cache in _PARSE_CACHES.items()
+            },
+        },
+    }
+
+
+def add_stats_callback(callback: StatsCallback) -> None:
+    """Calls a function after every value is structured while stats are
+    enabled, e.g. to forward timings to a metrics system.
+
+    :param callback: A function called with the goal type, the seconds spent
+        structuring the value and whether the structuring failed.
+
+    Usage::
+
+      >>> import dataclass_structor
+      >>> def record(goal_type, seconds, failed):
+      ...     metrics.timing(f"structure.{goal_type.__name__}", seconds)
+      >>> dataclass_structor.add_stats_callback(record)
+    """
+    _STATS_CALLBACKS.append(callback)
+
+
+def remove_stats_callback(callback: StatsCallback) -> None:
+    """Stops calling a function added with :func:`add_stats_callback`.
+
+    :param callback: The function to stop calling.
+    """
+    _STATS_CALLBACKS.remove(callback)
+
+
+def _lru_cache_stats(cached_function: Any) -> Dict[str, Union[int, float]]:
+    info = cached_function.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "hit_rate": info.hits / lookups if lookups else 0.0,
+        "size": info.currsize,
+        "max_size": info.maxsize,
+    }
+
+
+# The counters for each goal type, kept across calls to `reset_stats` so that
+# the compiled structurers can hold on to them.
+_TYPE_STATS: Dict[Any, TypeStats] = {}
+
+_STATS_CALLBACKS: List[StatsCallback] = []
+
+
+class _ActiveStructurers(threading.local):
+    # The counters of the unions being structured on this thread, innermost
+    # last, with `None` for goal types which aren't unions.
+    def __init__(self):
+        super().__init__()
+        self.union_stats: List[Optional[TypeStats]] = []
+
+
+_ACTIVE_STRUCTURERS = _ActiveStructurers()
+
+
+def _instrument_structurer(goal_type: Any, structurer: Structurer) -> Structurer:
+    try:
+        type_stats = _TYPE_STATS.setdefault(goal_type, TypeStats())
+    except TypeError:  # Unhashable goal types are compiled on every use.
+        return structurer
+    is_union = getattr(goal_type, "__origin__", None) is Union
+
+    def instrumented_structurer(value: Any) -> Any:
+        union_stats = _ACTIVE_STRUCTURERS.union_stats
+        # A structurer called directly by a union is one of its members.
+        if union_stats and union_stats[-1] is not None:
+            union_stats[-1].union_attempts += 1
+        union_stats.append(type_stats if is_union else None)
+        failed = True
+        start = time.perf_counter()
+        try:
+            obj = structurer(value)
+            failed = (obj is None and value is not None) or obj.__class__ is _Failure
+            return obj
+        finally:
+            elapsed = time.perf_counter() - start
+            union_stats.pop()
+            type_stats.calls += 1
+            type_stats.time += elapsed
+            if failed:
+                type_stats.failures += 1
+            for callback in _STATS_CALLBACKS:
+                callback(goal_type, elapsed, failed)
+
+    return instrumented_structurer
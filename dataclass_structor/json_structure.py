@@ -0,0 +1,274 @@
+import functools
+import json
+import json.decoder
+from typing import Any, Callable, Dict, Tuple, Union
+
+from .structure import (
+    STRUCTURER_CACHE_SIZE,
+    Structurer,
+    _NOT_A_FIELD,
+    _STRUCTURE_FAILED,
+    _STRUCTURER_CACHE_DEPENDENTS,
+    _Failure,
+    _get_optional_member,
+    _get_structure_hook,
+    _get_structurer,
+    _is_dict,
+    _is_nested,
+    _is_object_type,
+    _is_sequence,
+    _structure_or_fail,
+    resolve_type_hints,
+)
+
+# A JSON decoder is called with the JSON text and the index of the first
+# character of a value, and returns the structured value with the index of the
+# character after it.
+JSONDecoder = Callable[[str, int], Tuple[Any, int]]
+
+_WHITESPACE = json.decoder.WHITESPACE  # type: ignore
+_RAW_DECODER = json.JSONDecoder()
+
+
+class _DecodeFailure(Exception):
+    # Raised by JSON decoders when a value can't be structured. Decoding stops
+    # at the first failure, so unlike the structurers they raise it rather
+    # than return it. Each container adds its key to the failure as it passes
+    # through.
+    def __init__(self, failure: _Failure):
+        super().__init__(failure)
+        self.failure = failure
+
+
+def structure_json(data: Union[str, bytes], goal_type: Any) -> Any:
+    """Returns object given JSON text and type signature to be coerced into.
+
+    The JSON is decoded guided by the goal type, so the objects, lists and
+    dicts within it are structured as they are decoded rather than decoding
+    the whole document into dicts and lists first.
+
+    Values which can't be structured raise a :class:`ValidationError` with
+    the path of the value, as :func:`structure` does.
+
+    :param data: JSON text, as a str or bytes.
+    :param goal_type: A type that you would like the JSON cast into.
+
+    Usage::
+
+      >>> import dataclass_structor
+      >>> dataclass_structor.structure_json('{"first_name": "Bobby Jim"}', Guest)
+      Guest(first_name='Bobby Jim')
+    """
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode(json.detect_encoding(data), "surrogatepass")
+    if data.startswith("\ufeff"):
+        raise json.JSONDecodeError(
+            "Unexpected UTF-8 BOM (decode using utf-8-sig)", data, 0
+        )
+
+    idx = _WHITESPACE.match(data, 0).end()
+    try:
+        obj, end = _get_json_decoder(goal_type)(data, idx)
+    except _DecodeFailure as ex:
+        raise ex.failure.to_error() from None
+    end = _WHITESPACE.match(data, end).end()
+    if end != len(data):
+        raise json.JSONDecodeError("Extra data", data, end)
+    return obj
+
+
+def _get_json_decoder(goal_type: Any) -> JSONDecoder:
+    try:
+        hash(goal_type)
+    except TypeError:
+        return _compile_json_decoder(goal_type)
+    return _cached_compile_json_decoder(goal_type)
+
+
+def _compile_json_decoder(goal_type: Any) -> JSONDecoder:
+    if _get_structure_hook(goal_type) is not None:
+        return _compile_raw_decoder(goal_type)
+    for condition, compile_decoder in _JSON_DECODER_CONDITION_COMPILER_PAIRS:
+        if condition(goal_type):
+            return compile_decoder(goal_type)
+    return _compile_raw_decoder(goal_type)
+
+
+_cached_compile_json_decoder = functools.lru_cache(maxsize=STRUCTURER_CACHE_SIZE)(
+    _compile_json_decoder
+)
+_STRUCTURER_CACHE_DEPENDENTS.append(_cached_compile_json_decoder.cache_clear)
+
+
+def _skip_whitespace(s: str, idx: int) -> int:
+    return _WHITESPACE.match(s, idx).end()
+
+
+def _compile_raw_decoder(goal_type: Any) -> JSONDecoder:
+    # Decodes the value into dicts and lists, then structures them. This is
+    # used for values which don't contain any objects or lists themselves.
+    raw_decode = _RAW_DECODER.raw_decode
+    structurer: Structurer = _get_structurer(goal_type)
+
+    def decode_raw(s: str, idx: int) -> Tuple[Any, int]:
+        value, end = raw_decode(s, idx)
+        obj = _structure_or_fail(structurer, value, goal_type)
+        if obj.__class__ is _Failure:
+            raise _DecodeFailure(obj)
+        return obj, end
+
+    return decode_raw
+
+
+def _decode_json_array(
+    s: str, idx: int, decode_item: JSONDecoder, append: Callable[[Any], None]
+) -> int:
+    idx = _skip_whitespace(s, idx + 1)
+    if s[idx : idx + 1] == "]":
+        return idx + 1
+    index = 0
+    try:
+        while True:
+            item, idx = decode_item(s, idx)
+            append(item)
+            index += 1
+            idx = _skip_whitespace(s, idx)
+            nextchar = s[idx : idx + 1]
+            if nextchar == "]":
+                return idx + 1
+            if nextchar != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", s, idx)
+            idx = _skip_whitespace(s, idx + 1)
+    except _DecodeFailure as ex:
+        ex.failure.keys.append(index)
+        raise
+
+
+def _decode_json_object(
+    s: str, idx: int, decode_values: Callable[[str], JSONDecoder]
+) -> Tuple[Dict[str, Any], int]:
+    pairs: Dict[str, Any] = {}
+    idx = _skip_whitespace(s, idx + 1)
+    if s[idx : idx + 1] == "}":
+        return pairs, idx + 1
+    while True:
+        if s[idx : idx + 1] != '"':
+            raise json.JSONDecodeError(
+                "Expecting property name enclosed in double quotes", s, idx
+            )
+        key, idx = json.decoder.scanstring(s, idx + 1)  # type: ignore
+        idx = _skip_whitespace(s, idx)
+        if s[idx : idx + 1] != ":":
+            raise json.JSONDecodeError("Expecting ':' delimiter", s, idx)
+        idx = _skip_whitespace(s, idx + 1)
+        try:
+            pairs[key], idx = decode_values(key)(s, idx)
+        except _DecodeFailure as ex:
+            ex.failure.keys.append(key)
+            raise
+        idx = _skip_whitespace(s, idx)
+        nextchar = s[idx : idx + 1]
+        if nextchar == "}":
+            return pairs, idx + 1
+        if nextchar != ",":
+            raise json.JSONDecodeError("Expecting ',' delimiter", s, idx)
+        idx = _skip_whitespace(s, idx + 1)
+
+
+def _compile_sequence_decoder(goal_type: Any) -> JSONDecoder:
+    decode_raw = _compile_raw_decoder(goal_type)
+    item_type = getattr(goal_type, "__args__", (Any,))[0]
+    decode_item = _get_json_decoder(item_type)
+    container = {"List": list, "Set": set, "Tuple": tuple}[getattr(goal_type, "_name")]
+
+    def decode_sequence(s: str, idx: int) -> Tuple[Any, int]:
+        if s[idx : idx + 1] != "[":
+            return decode_raw(s, idx)
+        items: list = []
+        idx = _decode_json_array(s, idx, decode_item, items.append)
+        return items if container is list else container(items), idx
+
+    return decode_sequence
+
+
+def _compile_dict_decoder(goal_type: Any) -> JSONDecoder:
+    decode_raw = _compile_raw_decoder(goal_type)
+    decode_value = _get_json_decoder(getattr(goal_type, "__args__", (str, Any))[1])
+
+    def decode_dict(s: str, idx: int) -> Tuple[Any, int]:
+        if s[idx : idx + 1] != "{":
+            return decode_raw(s, idx)
+        return _decode_json_object(s, idx, lambda key: decode_value)
+
+    return decode_dict
+
+
+def _compile_object_decoder(goal_type: Any) -> JSONDecoder:
+    decode_raw = _compile_raw_decoder(goal_type)
+    # The field decoders are resolved on first use so that types which refer
+    # to themselves (e.g. trees) can be compiled.
+    field_decoders: Dict[str, JSONDecoder] = {}
+
+    def get_field_decoder(key: str) -> JSONDecoder:
+        try:
+            return field_decoders[key]
+        except KeyError:
+            raise _DecodeFailure(_Failure(_NOT_A_FIELD, key, goal_type)) from None
+
+    def decode_object(s: str, idx: int) -> Tuple[Any, int]:
+        if s[idx : idx + 1] != "{":
+            return decode_raw(s, idx)
+        if not field_decoders:
+            for k, v in resolve_type_hints(goal_type).items():
+                field_decoders[k] = _get_json_decoder(v)
+        fields, idx = _decode_json_object(s, idx, get_field_decoder)
+        try:
+            return goal_type(**fields), idx
+        except ValueError as ex:  # e.g. raised by `__post_init__`
+            raise _DecodeFailure(
+                _Failure(_STRUCTURE_FAILED, fields, goal_type, ex)
+            ) from None
+
+    return decode_object
+
+
+def _compile_optional_decoder(goal_type: Any) -> JSONDecoder:
+    decode_member = _get_json_decoder(_get_optional_member(goal_type))
+
+    def decode_optional(s: str, idx: int) -> Tuple[Any, int]:
+        if s.startswith("null", idx):
+            return None, idx + 4
+        return decode_member(s, idx)
+
+    return decode_optional
+
+
+def _has_nested_fields(goal_type: Any) -> bool:
+    if not _is_object_type(goal_type):
+        return False
+    try:
+        hints = resolve_type_hints(goal_type)
+    except (AttributeError, NameError, TypeError):
+        return False
+    return any(_is_nested(hint) for hint in hints.values())
+
+
+def _has_nested_items(goal_type: Any) -> bool:
+    # Whether the items of a list, set or tuple type, or the values of a dict
+    # type, can hold objects or lists. Others are as quick to decode into a
+    # list or dict and structure, and have no intermediate values to save.
+    if _is_dict(goal_type):
+        return _is_nested(getattr(goal_type, "__args__", (str, Any))[1])
+    return _is_nested(getattr(goal_type, "__args__", (Any,))[0])
+
+
+# When compiling a JSON decoder for a goal type the first value in each pair is
+# used as a condition which if true will compile the decoder using the second
+# item in the pair. Goal types which don't match any condition are decoded into
+# dicts and lists and then structured.
+_JSON_DECODER_CONDITION_COMPILER_PAIRS = [
+    (lambda gt: _is_nested(_get_optional_member(gt)), _compile_optional_decoder),
+    (lambda gt: _is_sequence(gt) and _has_nested_items(gt), _compile_sequence_decoder),
+    (lambda gt: _is_dict(gt) and _has_nested_items(gt), _compile_dict_decoder),
+    (_has_nested_fields, _compile_object_decoder),
+]
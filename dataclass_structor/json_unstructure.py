@@ -0,0 +1,165 @@
+import datetime
+import decimal
+import enum
+import functools
+import io
+import json
+import uuid
+from dataclasses import is_dataclass
+from typing import IO, Any, Callable, Dict, Iterable, Tuple
+
+from .unstructure import (
+    Unstructurer,
+    _UNSTRUCTURE_HOOKS,
+    _UNSTRUCTURER_CACHE_DEPENDENTS,
+    _cache_unstructurer,
+    _get_dataclass_field_names,
+    _get_slot_names,
+    _get_unstructure_hook,
+    _get_unstructurer,
+    unstructure,
+)
+
+# The number of characters collected before they are written to the file.
+WRITE_BUFFER_SIZE = 64 * 1024
+
+
+def unstructure_json(value: Any, **kwargs: Any) -> str:
+    """Returns JSON text given a value of a particular type.
+
+    The value is converted following the same rules as :func:`unstructure`
+    while it is encoded, rather than being unstructured into a copy first.
+    Sets are written as JSON arrays. When an unstructure hook is registered
+    for strings, numbers, lists, tuples, dicts or `None` (including their
+    subclasses and bases), which the JSON encoder writes without unstructuring
+    them, the value is unstructured into a copy first so the hook is used.
+
+    :param value: An object that you would like to convert into JSON.
+    :param kwargs: Any other keyword arguments are passed to
+        `json.JSONEncoder` (e.g. `indent` or `sort_keys`).
+
+    Usage::
+
+      >>> import datetime
+      >>> import dataclass_structor
+
+      >>> dataclass_structor.unstructure_json([datetime.date(2018, 9, 5)])
+      '["2018-09-05"]'
+    """
+    encoder = json.JSONEncoder(default=_unstructure_shallow, **kwargs)
+    return encoder.encode(_unstructure_hooked_natives(value))
+
+
+def dump_json(value: Any, fileobj: IO, **kwargs: Any) -> None:
+    """Writes a value of a particular type to a file as JSON text.
+
+    The JSON is written in chunks as the value is walked so the whole document
+    is never held in memory, unless it's unstructured into a copy first as
+    described in :func:`unstructure_json`.
+
+    :param value: An object that you would like to write as JSON.
+    :param fileobj: A file object (text or binary) to write the JSON to.
+    :param kwargs: Any other keyword arguments are passed to
+        `json.JSONEncoder` (e.g. `indent` or `sort_keys`).
+
+    Usage::
+
+      >>> import dataclass_structor
+
+      >>> with open("invite.json", "w") as fileobj:
+      ...     dataclass_structor.dump_json(invite, fileobj)
+    """
+    encoder = json.JSONEncoder(default=_unstructure_shallow, **kwargs)
+    is_binary = isinstance(fileobj, (io.RawIOBase, io.BufferedIOBase))
+    chunks = []
+    chunks_size = 0
+    for chunk in encoder.iterencode(_unstructure_hooked_natives(value)):
+        chunks.append(chunk)
+        chunks_size += len(chunk)
+        if chunks_size >= WRITE_BUFFER_SIZE:
+            _write(fileobj, "".join(chunks), is_binary)
+            chunks = []
+            chunks_size = 0
+    _write(fileobj, "".join(chunks), is_binary)
+
+
+def _write(fileobj: IO, text: str, is_binary: bool) -> None:
+    fileobj.write(text.encode("utf-8") if is_binary else text)
+
+
+def _unstructure_hooked_natives(value: Any) -> Any:
+    # The JSON encoder writes the values it can encode itself (including
+    # instances of subclasses) without calling `default`, so when a hook
+    # applies to any of them the value is unstructured before it's encoded.
+    return unstructure(value) if _has_native_hooks() else value
+
+
+@functools.lru_cache(maxsize=None)
+def _has_native_hooks() -> bool:
+    return any(
+        issubclass(hooked_type, _JSON_NATIVE_TYPES)
+        or any(issubclass(native, hooked_type) for native in _JSON_NATIVE_TYPES)
+        for hooked_type in _UNSTRUCTURE_HOOKS
+    )
+
+
+_UNSTRUCTURER_CACHE_DEPENDENTS.append(_has_native_hooks.cache_clear)
+
+# The types of values which the JSON encoder encodes itself.
+_JSON_NATIVE_TYPES = (str, int, float, list, tuple, dict, type(None))
+
+
+def _unstructure_shallow(value: Any) -> Any:
+    # Used as the `default` of the JSON encoder which calls this for values it
+    # can't encode itself, then encodes whatever is returned.
+    unstructurer = _SHALLOW_UNSTRUCTURERS_BY_TYPE.get(type(value))
+    if unstructurer is None:
+        unstructurer = _compile_shallow_unstructurer(value)
+    return unstructurer(value)
+
+
+def _compile_shallow_unstructurer(value: Any) -> Unstructurer:
+    hook = _get_unstructure_hook(type(value))
+    if hook is not None:
+        _cache_unstructurer(_SHALLOW_UNSTRUCTURERS_BY_TYPE, type(value), hook)
+        return hook
+    for condition, compile_conversion in _SHALLOW_VALUE_CONDITION_CONVERSION_PAIRS:
+        if condition(value):
+            conversion = compile_conversion(value)
+            _cache_unstructurer(_SHALLOW_UNSTRUCTURERS_BY_TYPE, type(value), conversion)
+            return conversion
+
+    raise ValueError(f"Could not unstructure: {value}")
+
+
+# Shallow unstructurers which have been compiled for a given type of value.
+_SHALLOW_UNSTRUCTURERS_BY_TYPE: Dict[type, Unstructurer] = {}
+_UNSTRUCTURER_CACHE_DEPENDENTS.append(_SHALLOW_UNSTRUCTURERS_BY_TYPE.clear)
+
+
+def _compile_shallow_dataclass_unstructurer(value: Any) -> Unstructurer:
+    field_names = _get_dataclass_field_names(type(value))
+    return lambda v: {name: getattr(v, name) for name in field_names}
+
+
+def _compile_shallow_slotted_unstructurer(value: Any) -> Unstructurer:
+    slot_names = _get_slot_names(type(value))
+    return lambda v: {name: getattr(v, name) for name in slot_names}
+
+
+# Like the pairs used by `unstructure` but for the values which the JSON encoder
+# can't encode itself. Objects are converted into dicts of their attributes
+# without unstructuring the attributes, which the JSON encoder will come back
+# for as it encodes the dict. The conditions are called with the value and the
+# compilers are called with the first value of each type.
+_SHALLOW_VALUE_CONDITION_CONVERSION_PAIRS: Iterable[
+    Tuple[Callable[[Any], bool], Callable[[Any], Unstructurer]]
+] = [
+    (
+        lambda v: isinstance(v, (decimal.Decimal, uuid.UUID, enum.Enum, datetime.date)),
+        _get_unstructurer,
+    ),
+    (lambda v: isinstance(v, (set, frozenset)), lambda v: list),
+    (is_dataclass, _compile_shallow_dataclass_unstructurer),
+    (lambda v: hasattr(v, "__slots__"), _compile_shallow_slotted_unstructurer),
+]
@@ -0,0 +1,275 @@
+import array
+import base64
+import json
+import mmap
+import os
+from typing import IO, Any, Dict, Iterator, List, Optional, Union
+
+from .structure import get_structurer
+
+# The size of the chunks read from files that are opened from a path.
+READ_BUFFER_SIZE = 1024 * 1024
+
+
+class JSONLinesError(ValueError):
+    """Raised when a line of a JSON Lines file can't be structured.
+
+    :ivar line_number: The line number (starting from 1) of the line.
+    :ivar line: The contents of the line.
+    """
+
+    def __init__(self, line_number: int, line: Union[str, bytes], message: str):
+        super().__init__(f"Could not structure line {line_number}: {message}")
+        self.line_number = line_number
+        self.line = line
+
+
+def iter_structure(
+    source: Union[str, "os.PathLike[str]", IO],
+    goal_type: Any,
+    skip_errors: bool = False,
+    bad_lines: Optional[List[JSONLinesError]] = None,
+) -> Iterator[Any]:
+    """Yields an object for each line of a JSON Lines file given the type
+    that each line is to be coerced into.
+
+    Lines are read and structured one at a time so only a single line is held
+    in memory. Blank lines are ignored.
+
+    :param source: A path to a JSON Lines file or a file object (text or
+        binary) to read the lines from.
+    :param goal_type: A type that you would like cast each line into.
+    :param skip_errors: Skip lines that can't be decoded or structured rather
+        than raising a :class:`JSONLinesError`.
+    :param bad_lines: A list which :class:`JSONLinesError` for each skipped line
+        are appended to. Implies `skip_errors`.
+
+    Usage::
+
+      >>> import dataclass_structor
+      >>> for guest in dataclass_structor.iter_structure("guests.jsonl", Guest):
+      ...     print(guest)
+      Guest(first_name='Bobby Jim')
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb", buffering=READ_BUFFER_SIZE) as fileobj:
+            yield from _iter_structure_lines(fileobj, goal_type, skip_errors, bad_lines)
+    else:
+        yield from _iter_structure_lines(source, goal_type, skip_errors, bad_lines)
+
+
+def _iter_structure_lines(
+    lines: IO,
+    goal_type: Any,
+    skip_errors: bool,
+    bad_lines: Optional[List[JSONLinesError]],
+) -> Iterator[Any]:
+    structurer = get_structurer(goal_type)
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            obj = structurer(json.loads(line))
+        except (TypeError, ValueError) as ex:
+            error = JSONLinesError(line_number, line, str(ex))
+            if bad_lines is not None:
+                bad_lines.append(error)
+            elif not skip_errors:
+                raise error from ex
+            continue
+        yield obj
+
+
+class IndexedJSONLines:
+    """Random access to the objects in a JSON Lines file, by position or by the
+    value of a key field, structuring only the lines that are looked up.
+
+    The file is memory mapped and the offset of every line is found in a single
+    pass when it is opened, without decoding the lines. With a `key` each line
+    is decoded once more to find its key. With an `index_path` the offsets and
+    keys are saved, and loaded by later readers of the same unchanged file
+    rather than being found again. Blank lines are ignored.
+
+    :param path: A path to a JSON Lines file.
+    :param goal_type: A type that you would like cast each line into.
+    :param key: The name of a field of each line to look lines up by with
+        :meth:`get`. When lines share a key the last one is found.
+    :param index_path: A path to save the index to, or load it from.
+
+    Usage::
+
+      >>> import dataclass_structor
+      >>> with dataclass_structor.IndexedJSONLines("guests.jsonl", Guest) as guests:
+      ...     guests[41]
+      Guest(first_name='Bobby Jim')
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        goal_type: Any,
+        key: Optional[str] = None,
+        index_path: Optional[Union[str, "os.PathLike[str]"]] = None,
+    ):
+        self.goal_type = goal_type
+        self.key = key
+        self._structurer = get_structurer(goal_type)
+        with open(path, "rb") as fileobj:
+            stat = os.fstat(fileobj.fileno())
+            # Empty files can't be mapped.
+            self._mapping: Any = (
+                mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ)
+                if stat.st_size
+                else b""
+            )
+
+        # The file is closed once it's mapped, so only the mapping needs to be
+        # closed when the index can't be found (e.g. a line has no key).
+        try:
+            signature = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "key": key,
+            }
+            index = _load_index(index_path, signature) if index_path else None
+            if index is None:
+                self._offsets = _find_line_offsets(self._mapping)
+                self._keys = self._find_keys() if key is not None else {}
+                if index_path:
+                    _save_index(index_path, signature, self._offsets, self._keys)
+            else:
+                self._offsets, self._keys = index
+        except BaseException:
+            self.close()
+            raise
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, position: Union[int, slice]) -> Any:
+        """Returns the object structured from the line at a position, or a
+        list of the objects structured from the lines in a slice.
+
+        :param position: The position of the line among the lines that aren't
+            blank, starting from 0. Negative positions count from the end.
+        """
+        if isinstance(position, slice):
+            return [self[p] for p in range(*position.indices(len(self)))]
+        start = self._offsets[position]
+        line = self._get_line(start)
+        try:
+            return self._structurer(json.loads(line))
+        except (TypeError, ValueError) as ex:
+            line_number = _find_line_number(self._mapping, start)
+            raise JSONLinesError(line_number, line, str(ex)) from ex
+
+    def __iter__(self) -> Iterator[Any]:
+        for position in range(len(self)):
+            yield self[position]
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Returns the object structured from the line with a key, or the
+        default when there isn't a line with that key.
+
+        :param key: The value of the `key` field of the line.
+        :param default: The value returned when there isn't a line with the key.
+        """
+        if self.key is None:
+            raise ValueError("Could not look up lines by key without a key field")
+        position = self._keys.get(key)
+        if position is None:
+            return default
+        return self[position]
+
+    def close(self) -> None:
+        """Unmaps the file."""
+        if isinstance(self._mapping, mmap.mmap):
+            self._mapping.close()
+
+    def __enter__(self) -> "IndexedJSONLines":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _get_line(self, start: int) -> bytes:
+        end = self._mapping.find(b"\n", start)
+        return self._mapping[start : end if end != -1 else len(self._mapping)]
+
+    def _find_keys(self) -> Dict[Any, int]:
+        keys = {}
+        for position, start in enumerate(self._offsets):
+            line = self._get_line(start)
+            try:
+                keys[json.loads(line)[self.key]] = position
+            except (KeyError, TypeError, ValueError) as ex:
+                line_number = _find_line_number(self._mapping, start)
+                raise JSONLinesError(
+                    line_number, line, f"Could not find key {self.key}"
+                ) from ex
+        return keys
+
+
+def _find_line_offsets(mapping: Any) -> "array.array[int]":
+    offsets = array.array("q")
+    size = len(mapping)
+    find = mapping.find
+    start = 0
+    while start < size:
+        end = find(b"\n", start)
+        if end == -1:
+            end = size
+        # Only lines which start with whitespace need a closer look.
+        if end > start and (
+            mapping[start] not in b" \t\r" or mapping[start:end].strip()
+        ):
+            offsets.append(start)
+        start = end + 1
+    return offsets
+
+
+def _find_line_number(mapping: Any, start: int) -> int:
+    # Counts the lines before an offset with `find` rather than copying the
+    # mapping up to it to count them, which would need as much memory.
+    line_number = 1
+    find = mapping.find
+    end = find(b"\n", 0, start)
+    while end != -1:
+        line_number += 1
+        end = find(b"\n", end + 1, start)
+    return line_number
+
+
+def _save_index(
+    index_path: Union[str, "os.PathLike[str]"],
+    signature: Dict[str, Any],
+    offsets: "array.array[int]",
+    keys: Dict[Any, int],
+) -> None:
+    index = {
+        **signature,
+        "offsets": base64.b64encode(offsets.tobytes()).decode("ascii"),
+        "keys": list(keys.items()),
+    }
+    temporary_path = f"{os.fspath(index_path)}.{os.getpid()}"
+    with open(temporary_path, "w", encoding="utf-8") as index_file:
+        json.dump(index, index_file)
+    os.replace(temporary_path, index_path)
+
+
+def _load_index(
+    index_path: Union[str, "os.PathLike[str]"], signature: Dict[str, Any]
+) -> Optional[tuple]:
+    # Returns the saved offsets and keys, or None when there isn't an index
+    # for the file as it is now.
+    try:
+        with open(index_path, encoding="utf-8") as index_file:
+            index = json.load(index_file)
+        if any(index.get(name) != value for name, value in signature.items()):
+            return None
+        offsets = array.array("q")
+        offsets.frombytes(base64.b64decode(index["offsets"]))
+        keys = dict(index["keys"])
+    except (OSError, KeyError, TypeError, ValueError):
+        return None
+    return offsets, keys
@@ -0,0 +1,259 @@
+import dataclasses
+import functools
+import types
+from typing import Any, Dict, Optional
+
+from .structure import (
+    STRUCTURER_CACHE_SIZE,
+    Structurer,
+    _FAILURE_COUNT,
+    _NOT_A_FIELD,
+    _STRUCTURE_FAILED,
+    _STRUCTURER_CACHE_DEPENDENTS,
+    _Failure,
+    _find_failure,
+    _get_optional_member,
+    _get_structure_hook,
+    _get_structurer,
+    _is_nested,
+    _structure_or_fail,
+    resolve_type_hints,
+)
+
+# The slot of lazy dataclasses which holds the values of the fields that
+# haven't been structured yet.
+_UNSTRUCTURED_VALUES = "__dataclass_structor_unstructured__"
+
+# Returned by `dict.get` when another thread has structured a field first.
+_MISSING = object()
+
+
+def structure_lazy(value: Any, goal_type: Any) -> Any:
+    """Returns object given a value and type signature to be coerced into,
+    deferring the structuring of nested fields until they are accessed.
+
+    Dataclasses are returned as an instance of a subclass of the goal type
+    whose fields holding objects, lists, sets, tuples or dicts are structured
+    the first time they are accessed and then kept. Fields holding other
+    types are structured straight away. Lists of dataclasses hold lazy
+    dataclasses. Other goal types are structured as :func:`structure` would.
+
+    Since the fields are assigned without calling `__init__`, the
+    `__post_init__` of the dataclass is not called. Accessing a field whose
+    value can't be structured raises a :class:`ValidationError` with the path
+    from the lazy dataclass, and accessing it again retries. Lazy dataclasses
+    are pickled and copied as instances of the goal type, structuring their
+    remaining fields. The subclass of a dataclass with slots holds its lazy
+    fields in a `__dict__`. Fields can be accessed for the first time from
+    several threads at once, which may each structure the value, but all of
+    them get the same object.
+
+    :param value: A dict or list composed of primitive type (str, int, float)
+        or a primitive type.
+    :param goal_type: A type that you would like cast `value` into.
+
+    Usage::
+
+      >>> import dataclass_structor
+      >>> invite = dataclass_structor.structure_lazy(value, Invite)
+      >>> invite.guests  # The guests are only structured now.
+      [Guest(first_name='Bobby Jim')]
+    """
+    return _structure_or_raise(_get_lazy_structurer(goal_type), value, goal_type)
+
+
+def _structure_or_raise(
+    structurer: Structurer, value: Any, goal_type: Any, key: Optional[str] = None
+) -> Any:
+    obj = _structure_or_fail(structurer, value, goal_type)
+    if obj.__class__ is _Failure:
+        if key is not None:
+            obj.keys.append(key)
+        raise obj.to_error()
+    return obj
+
+
+def _get_lazy_structurer(goal_type: Any) -> Structurer:
+    # Like `_get_structurer`, returns a structurer which returns a `_Failure`
+    # rather than raising an error.
+    try:
+        hash(goal_type)
+    except TypeError:
+        return _compile_lazy_structurer(goal_type)
+    return _cached_compile_lazy_structurer(goal_type)
+
+
+def _compile_lazy_structurer(goal_type: Any) -> Structurer:
+    optional_member = _get_optional_member(goal_type)
+    if optional_member is not None:
+        member_structurer = _get_lazy_structurer(optional_member)
+        return lambda value: None if value is None else member_structurer(value)
+    if getattr(goal_type, "_name", None) == "List":
+        item_structurer = _get_lazy_structurer(
+            getattr(goal_type, "__args__", (Any,))[0]
+        )
+
+        def structure_lazy_list(value: Any) -> Any:
+            failures = _FAILURE_COUNT.count
+            obj = [item_structurer(v) for v in value]
+            if _FAILURE_COUNT.count != failures and _Failure in map(type, obj):
+                return _find_failure(enumerate(obj))
+            return obj
+
+        return structure_lazy_list
+    if (
+        isinstance(goal_type, type)
+        and dataclasses.is_dataclass(goal_type)
+        and _get_structure_hook(goal_type) is None
+    ):
+        return _compile_lazy_object_structurer(goal_type)
+    return _get_structurer(goal_type)
+
+
+_cached_compile_lazy_structurer = functools.lru_cache(maxsize=STRUCTURER_CACHE_SIZE)(
+    _compile_lazy_structurer
+)
+_STRUCTURER_CACHE_DEPENDENTS.append(_cached_compile_lazy_structurer.cache_clear)
+
+
+class _LazyField:
+    """A descriptor which structures the value of a field on first access."""
+
+    def __init__(self, name: str, goal_type: Any):
+        self.name = name
+        self.goal_type = goal_type
+        self.structurer: Optional[Structurer] = None
+
+    def __get__(self, obj: Any, objtype: Any = None) -> Any:
+        if obj is None:
+            return self
+        attributes = obj.__dict__
+        try:
+            return attributes[self.name]
+        except KeyError:
+            pass
+        if self.structurer is None:
+            self.structurer = _get_lazy_structurer(self.goal_type)
+        unstructured_values = getattr(obj, _UNSTRUCTURED_VALUES)
+        unstructured_value = unstructured_values.get(self.name, _MISSING)
+        if unstructured_value is _MISSING:
+            # Another thread structured the field since it was looked up.
+            return attributes[self.name]
+        # The value is only dropped once it has been structured, so that
+        # accessing the field again after an error raises the error again. If
+        # threads race to structure it, the first object assigned is kept.
+        value = attributes.setdefault(
+            self.name,
+            _structure_or_raise(
+                self.structurer, unstructured_value, self.goal_type, self.name
+            ),
+        )
+        unstructured_values.pop(self.name, None)
+        return value
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        obj.__dict__[self.name] = value
+        getattr(obj, _UNSTRUCTURED_VALUES).pop(self.name, None)
+
+
+def _compile_lazy_object_structurer(goal_type: Any) -> Structurer:
+    hints = resolve_type_hints(goal_type)
+    fields = dataclasses.fields(goal_type)
+    lazy_names = frozenset(f.name for f in fields if _is_nested(hints[f.name]))
+    eager_structurers = {
+        f.name: _get_structurer(hints[f.name])
+        for f in fields
+        if f.name not in lazy_names
+    }
+    # The fields kept in `__slots__` (e.g. of compact types) rather than in the
+    # `__dict__` of the instance, which are assigned one by one.
+    slot_names = frozenset(
+        name
+        for name in eager_structurers
+        if isinstance(getattr(goal_type, name, None), types.MemberDescriptorType)
+    )
+    defaults: Dict[str, Any] = {}
+    default_factories = {}
+    for field in fields:
+        if field.default is not dataclasses.MISSING:
+            defaults[field.name] = field.default
+        elif field.default_factory is not dataclasses.MISSING:  # type: ignore
+            default_factories[field.name] = field.default_factory  # type: ignore
+    field_names = frozenset(f.name for f in fields)
+    lazy_type = _make_lazy_type(goal_type, {name: hints[name] for name in lazy_names})
+
+    def structure_lazy_object(value: Dict[str, Any]) -> Any:
+        if not isinstance(value, dict):
+            return _Failure(_STRUCTURE_FAILED, value, goal_type)
+        attributes = dict(defaults)
+        for name, default_factory in default_factories.items():
+            attributes[name] = default_factory()
+        unstructured_values = {}
+        for k, v in value.items():
+            if k in lazy_names:
+                attributes.pop(k, None)
+                unstructured_values[k] = v
+                continue
+            eager_structurer = eager_structurers.get(k)
+            if eager_structurer is None:
+                obj: Any = _Failure(_NOT_A_FIELD, v, goal_type)
+            else:
+                obj = eager_structurer(v)
+            if obj.__class__ is _Failure:
+                obj.keys.append(k)
+                return obj
+            attributes[k] = obj
+        missing = field_names - attributes.keys() - unstructured_values.keys()
+        if missing:
+            raise TypeError(f"{goal_type} missing required fields {sorted(missing)}")
+        obj = object.__new__(lazy_type)
+        object.__setattr__(obj, _UNSTRUCTURED_VALUES, unstructured_values)
+        for name in slot_names:
+            object.__setattr__(obj, name, attributes.pop(name))
+        obj.__dict__.update(attributes)
+        return obj
+
+    return lambda value: None if value is None else structure_lazy_object(value)
+
+
+def _make_lazy_type(goal_type: Any, lazy_hints: Dict[str, Any]) -> type:
+    # Makes a subclass of the dataclass with a descriptor for each lazy field
+    # which compares equal to instances of the dataclass. The subclass keeps
+    # the unstructured values in a slot, out of `vars()` of the instance, and
+    # has a `__dict__` for the lazy fields even when the dataclass has slots.
+    field_names = tuple(f.name for f in dataclasses.fields(goal_type))
+
+    def __eq__(self, other):
+        if other.__class__ not in (self.__class__, goal_type):
+            return NotImplemented
+        return all(getattr(self, n) == getattr(other, n) for n in field_names)
+
+    def __reduce__(self):
+        # The subclass can't be found by its name, so it's pickled as the
+        # dataclass.
+        return _restore, (goal_type, {n: getattr(self, n) for n in field_names})
+
+    namespace: Dict[str, Any] = {
+        name: _LazyField(name, hint) for name, hint in lazy_hints.items()
+    }
+    namespace["__slots__"] = (
+        (_UNSTRUCTURED_VALUES,)
+        if goal_type.__dictoffset__
+        else (_UNSTRUCTURED_VALUES, "__dict__")
+    )
+    namespace["__qualname__"] = goal_type.__qualname__
+    namespace["__module__"] = goal_type.__module__
+    namespace["__hash__"] = goal_type.__hash__
+    namespace["__reduce__"] = __reduce__
+    if goal_type.__dataclass_params__.eq:
+        namespace["__eq__"] = __eq__
+    return type(goal_type.__name__, (goal_type,), namespace)
+
+
+def _restore(goal_type: Any, attributes: Dict[str, Any]) -> Any:
+    # Creates an instance of the dataclass from its fields without calling
+    # `__init__`, like the lazy dataclass it was pickled from.
+    obj = object.__new__(goal_type)
+    for name, value in attributes.items():
+        object.__setattr__(obj, name, value)
+    return obj
@@ -1,14 +1,27 @@
+# pylint: disable=too-many-lines
+import collections
+import concurrent.futures
+import dataclasses
 import decimal
 import datetime
 import enum
+import functools
+import inspect
+import itertools
+import threading
+import typing
 import uuid
+import weakref
 from typing import (
     get_type_hints,
     Any,
     Callable,
+    Deque,
     Dict,
+    Generator,
     List,
     Iterable,
+    Iterator,
     Optional,
     Set,
     Tuple,
@@ -17,16 +30,47 @@ from typing import (
     Union,
 )
 
+from .dedup import Deduplicator
 
 T = TypeVar("T")  # pylint: disable=invalid-name
 
+Structurer = Callable[[Any], Any]
 
-def structure(value: Any, goal_type: Any) -> Any:
+# The maximum number of goal types which will have their compiled structurer
+# kept around. The least recently used structurers are discarded first.
+STRUCTURER_CACHE_SIZE = 1024
+
+# The default number of values sent to each process at a time when structuring
+# values in parallel.
+PARALLEL_CHUNK_SIZE = 10_000
+
+# The number of chunks per process which are sent ahead of the objects taken
+# when structuring values in parallel.
+PARALLEL_CHUNKS_PER_WORKER = 2
+
+
+def structure(
+    value: Any,
+    goal_type: Any,
+    *,
+    dedup: Union[bool, Deduplicator] = False,
+    fields: Any = None,
+    collect_errors: bool = False,
+) -> Any:
     """Returns object given a value and type signature to be coerced into.
 
     :param value: A dict or list composed of primitive type (str, int, float)
         or a primitive type.
     :param goal_type: A type that you would like cast `value` into.
+    :param dedup: Intern the strings of the object and share its equal frozen
+        dataclasses and tuples. Pass a :class:`Deduplicator` to only intern
+        the strings of some fields, or to share objects across calls.
+    :param fields: Only structure these fields of the object, as described in
+        :func:`get_structurer`.
+    :param collect_errors: When the value can't be structured, raise a
+        :class:`StructureErrors` holding every error in the value (including
+        missing fields) rather than a :class:`ValidationError` for the first
+        one. Can't be combined with `fields`.
 
     Usage::
 
@@ -35,11 +79,498 @@ def structure(value: Any, goal_type: Any) -> Any:
       >>> dataclass_structor.structure('2018-10-02', datetime.date)
       datetime.datetime(2018, 10, 2)
     """
-    if value is None:
-        return value
-    if hasattr(goal_type, "__origin__") and goal_type.__origin__ is Union:
-        return _structure_union(value, goal_type.__args__)
-    return _structure_value(value, goal_type)
+    if not collect_errors:
+        obj = get_structurer(goal_type, fields=fields)(value)
+    elif fields is not None:
+        raise ValueError("Could not collect the errors of selected fields")
+    else:
+        try:
+            obj = get_structurer(goal_type)(value)
+        except (TypeError, ValidationError) as ex:
+            # Only values which fail are walked a second time, to find the
+            # errors after the first. Constructors raise a `TypeError` for
+            # missing fields, which are found as errors with their path.
+            errors = [
+                error
+                for collect_errors_of in _ERROR_COLLECTORS
+                for error in collect_errors_of(value, goal_type)
+            ]
+            if not errors and isinstance(ex, TypeError):
+                raise
+            raise StructureErrors(errors or [ex]) from ex
+    if dedup:
+        return _get_deduplicator(dedup)(obj)
+    return obj
+
+
+def structure_many(  # pylint: disable=too-many-arguments
+    values: Iterable[Any],
+    goal_type: Any,
+    as_generator: bool = False,
+    workers: Optional[int] = None,
+    chunksize: int = PARALLEL_CHUNK_SIZE,
+    *,
+    dedup: Union[bool, Deduplicator] = False,
+    fields: Any = None,
+) -> Union[List[Any], Iterator[Any]]:
+    """Returns a list of objects given an iterable of values which are all to
+    be coerced into the same type.
+
+    The structurer for the goal type is looked up once for the whole batch
+    rather than once per value.
+
+    :param values: An iterable of values that you would like to structure.
+    :param goal_type: A type that you would like to cast each value into.
+    :param as_generator: Return a generator which structures each value as it
+        is consumed rather than a list.
+    :param workers: Structure the values in this many processes. The values
+        are sent to the processes in chunks, reading only two chunks per
+        process ahead of the objects taken, and the objects are returned in
+        the same order as the values. Both the values and the goal type must
+        be picklable.
+    :param chunksize: The number of values sent to a process at a time.
+    :param dedup: Intern the strings of the objects and share equal frozen
+        dataclasses and tuples between them. Pass a :class:`Deduplicator` to
+        only intern the strings of some fields, or to share objects across
+        batches.
+    :param fields: Only structure these fields of the objects, as described
+        in :func:`get_structurer`.
+
+    Usage::
+
+      >>> import datetime
+      >>> import dataclass_structor
+      >>> dataclass_structor.structure_many(['2018-10-02'], datetime.date)
+      [datetime.date(2018, 10, 2)]
+    """
+    projection = None if fields is None else _get_projection(fields)
+    if workers is not None and workers > 1:
+        structured: Iterator[Any] = _structure_many_in_processes(
+            values, goal_type, workers, chunksize, fields
+        )
+    else:
+        if not as_generator and not dedup:
+            structurer = _get_structurer(goal_type, projection)
+            failures = _FAILURE_COUNT.count
+            objs: List[Any] = []
+            append = objs.append
+            for value in values:
+                try:
+                    append(structurer(value))
+                except RecursionError as ex:
+                    append(_structure_deep(value, goal_type, projection, ex))
+            if _FAILURE_COUNT.count != failures and _Failure in map(type, objs):
+                raise _find_failure(enumerate(objs)).to_error()
+            return objs
+        structured = _structure_each(values, goal_type, projection)
+
+    if dedup:
+        structured = map(_get_deduplicator(dedup), structured)
+    if as_generator:
+        return structured
+    return list(structured)
+
+
+def _get_deduplicator(dedup: Union[bool, Deduplicator]) -> Deduplicator:
+    return dedup if isinstance(dedup, Deduplicator) else Deduplicator()
+
+
+def _structure_each(
+    values: Iterable[Any],
+    goal_type: Any,
+    projection: Optional["Projection"],
+    start: int = 0,
+) -> Iterator[Any]:
+    # Yields the object structured from each value, raising the error of the
+    # first value which can't be structured with its index (counted from
+    # `start`) at the front of its path.
+    structurer = _get_structurer(goal_type, projection)
+    for index, value in enumerate(values, start):
+        obj = _structure_or_fail(structurer, value, goal_type, projection)
+        if obj.__class__ is _Failure:
+            obj.keys.append(index)
+            raise obj.to_error()
+        yield obj
+
+
+def _structure_many_in_processes(
+    values: Iterable[Any], goal_type: Any, workers: int, chunksize: int, fields: Any
+) -> Iterator[Any]:
+    values_iter = iter(values)
+    chunks = iter(lambda: list(itertools.islice(values_iter, chunksize)), [])
+    # Each chunk is sent with the index of its first value, so that errors
+    # have the index of the value within all of the values.
+    starts = itertools.count(0, chunksize)
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_structure_worker,
+        initargs=(goal_type, fields),
+    ) as executor:
+        # Only a few chunks per process are read ahead of the objects yielded,
+        # so that values are read and objects kept only as they are needed.
+        pending: Deque[concurrent.futures.Future] = collections.deque(
+            executor.submit(_structure_chunk, start, chunk)
+            for chunk, start in zip(
+                itertools.islice(chunks, PARALLEL_CHUNKS_PER_WORKER * workers), starts
+            )
+        )
+        while pending:
+            structured_chunk = pending.popleft().result()
+            chunk = next(chunks, None)
+            if chunk is not None:
+                pending.append(executor.submit(_structure_chunk, next(starts), chunk))
+            yield from structured_chunk
+
+
+# The goal type and projection used by worker processes of `structure_many`,
+# which are set once when each process starts rather than sending the goal
+# type with every chunk.
+_WORKER_GOAL: Optional[Tuple[Any, Optional["Projection"]]] = None
+
+
+def _init_structure_worker(goal_type: Any, fields: Any) -> None:
+    global _WORKER_GOAL  # pylint: disable=global-statement
+    _WORKER_GOAL = (goal_type, None if fields is None else _get_projection(fields))
+
+
+def _structure_chunk(start: int, values: List[Any]) -> List[Any]:
+    assert _WORKER_GOAL is not None
+    goal_type, projection = _WORKER_GOAL
+    return list(_structure_each(values, goal_type, projection, start))
+
+
+def get_structurer(goal_type: Any, *, fields: Any = None) -> Structurer:
+    """Returns a function that structures values into the given type.
+
+    The function is compiled once per goal type and then cached so that
+    structuring many values into the same type only pays for the conversions
+    themselves. It raises a :class:`ValidationError` with the path to the
+    first part of a value that can't be structured. Values nested too deeply
+    to be structured recursively (e.g. long threads of replies) are
+    structured again without recursion, unless fields are selected.
+
+    Objects can be structured from some of their fields (and some of the
+    fields of objects nested within them) by selecting the fields. Keys of
+    the value which aren't selected are ignored without being converted, even
+    when they aren't fields. Fields which aren't selected are left with their
+    default or, when they have none, `UNSELECTED`.
+
+    :param goal_type: A type that you would like values cast into.
+    :param fields: The fields to structure, as a collection of field names or
+        dotted paths (e.g. `{"total", "customer.id"}`), or as a dict of field
+        names to `True` or the fields to structure of the objects they hold
+        (e.g. `{"total": True, "customer": {"id"}}`). Fields holding optional
+        objects, or lists, sets, tuples and dicts of objects, select the
+        fields of those objects. Defaults to every field.
+
+    Usage::
+
+      >>> import datetime
+      >>> import dataclass_structor
+      >>> structure_date = dataclass_structor.get_structurer(datetime.date)
+      >>> structure_date('2018-10-02')
+      datetime.date(2018, 10, 2)
+      >>> structure_id = dataclass_structor.get_structurer(Order, fields={"id"})
+      >>> structure_id({"id": "1", "customer": {"name": "Bobby Jim"}})
+      Order(id='1', customer=UNSELECTED)
+    """
+    projection = None if fields is None else _get_projection(fields)
+    try:
+        hash(goal_type)
+    except TypeError:
+        return _compile_raising_structurer(goal_type, projection)
+    return _cached_compile_raising_structurer(goal_type, projection)
+
+
+def clear_structurer_cache() -> None:
+    """Discards all of the compiled structurers."""
+    _cached_compile_structurer.cache_clear()
+    for clear_cache in _STRUCTURER_CACHE_DEPENDENTS:
+        clear_cache()
+
+
+# Functions which discard caches that hold on to compiled structurers. These are
+# called whenever the compiled structurers are discarded.
+_STRUCTURER_CACHE_DEPENDENTS: List[Callable[[], None]] = []
+
+
+# Functions which are called with a value and goal type and return every error
+# in the value (e.g. `validate`, which builds on this module).
+_ERROR_COLLECTORS: List[Callable[[Any, Any], List["ValidationError"]]] = []
+
+
+class ValidationError(ValueError):
+    """An error found in a value by :func:`validate`, or raised by
+    :func:`structure` for the first error in a value. It's created with the
+    path and message of the error.
+
+    :ivar path: A JSON pointer to the part of the value that couldn't be
+        structured (e.g. `/guests/0/first_name`), or `""` for the value itself.
+    :ivar message: Why that part couldn't be structured.
+    """
+
+    # The path and message are kept in `args` rather than set by `__init__`
+    # so that creating the error is cheap and it can be pickled.
+    @property
+    def path(self) -> str:
+        return self.args[0]
+
+    @property
+    def message(self) -> str:
+        return self.args[1]
+
+    def __str__(self) -> str:
+        return f"{self.path}: {self.message}" if self.path else self.message
+
+
+class StructureErrors(ValueError):
+    """Raised by :func:`structure` with `collect_errors` when a value can't be
+    structured. It's created with the list of errors.
+
+    :ivar errors: A :class:`ValidationError` for each error in the value.
+    """
+
+    @property
+    def errors(self) -> List[ValidationError]:
+        return self.args[0]
+
+    def __str__(self) -> str:
+        return "; ".join(str(error) for error in self.errors)
+
+
+def _to_json_pointer(keys: Iterable[Any]) -> str:
+    return "".join("/" + str(key).replace("~", "~0").replace("/", "~1") for key in keys)
+
+
+# The messages of failures, which are formatted with the value, its type, the
+# goal type and the error that caused the failure (if any).
+_STRUCTURE_FAILED = (
+    "Could not structure: %(value)s of type %(value_type)s into %(goal_type)s"
+)
+_CONVERT_FAILED = (
+    "Could not convert %(value)s of type %(value_type)s into a %(goal_type)s."
+)
+_ENUM_FAILED = (
+    "Could not convert %(value)s of type %(value_type)s into a %(goal_type)s enum."
+)
+_NOT_A_FIELD = "Not a field of %(goal_type)s"
+_HOOK_FAILED = "%(error)s"
+
+
+class _FailureCount(threading.local):
+    # The number of failures made on this thread. Containers compare it before
+    # and after structuring their items, so they only look for a failure among
+    # their items when one may be there.
+    count = 0
+
+
+_FAILURE_COUNT = _FailureCount()
+
+
+class _Failure:
+    # Returned by compiled structurers in place of an object when a value
+    # can't be structured. Returning it through each level of nesting is much
+    # cheaper than raising and catching errors, and its message is only
+    # formatted when it's raised.
+    __slots__ = ("message_format", "value", "goal_type", "error", "keys")
+
+    def __init__(
+        self,
+        message_format: str,
+        value: Any,
+        goal_type: Any,
+        error: Optional[Exception] = None,
+    ):
+        self.message_format = message_format
+        self.value = value
+        self.goal_type = goal_type
+        self.error = error
+        # The keys and indexes that lead to the value, innermost first so that
+        # each container can append its own.
+        self.keys: List[Any] = []
+        _FAILURE_COUNT.count += 1
+
+    @property
+    def message(self) -> str:
+        return self.message_format % {
+            "value": self.value,
+            "value_type": type(self.value),
+            "goal_type": self.goal_type,
+            "error": self.error,
+        }
+
+    def to_error(self) -> ValidationError:
+        path = _to_json_pointer(reversed(self.keys)) if self.keys else ""
+        error = ValidationError(path, self.message)
+        error.__cause__ = self.error
+        error.__suppress_context__ = True
+        return error
+
+
+def _find_failure(keyed_items: Iterable[Tuple[Any, Any]]) -> _Failure:
+    # Returns the first failure of the items of a container which holds one,
+    # with its key added to the path of the failure.
+    key, failure = next(
+        (key, item) for key, item in keyed_items if item.__class__ is _Failure
+    )
+    failure.keys.append(key)
+    return failure
+
+
+def _get_structurer(
+    goal_type: Any, projection: Optional["Projection"] = None
+) -> Structurer:
+    # Returns the structurer that `get_structurer` builds on, which returns a
+    # `_Failure` rather than raising an error. Structurers use these for the
+    # values they hold.
+    if projection is not None:
+        return _get_projected_structurer(goal_type, projection)
+    try:
+        hash(goal_type)
+    except TypeError:
+        return _compile_structurer(goal_type)
+    return _cached_compile_structurer(goal_type)
+
+
+def _compile_raising_structurer(
+    goal_type: Any, projection: Optional["Projection"]
+) -> Structurer:
+    structurer = _get_structurer(goal_type, projection)
+
+    def structure_or_raise(value: Any) -> Any:
+        obj = _structure_or_fail(structurer, value, goal_type, projection)
+        if obj.__class__ is _Failure:
+            raise obj.to_error()
+        return obj
+
+    return structure_or_raise
+
+
+_cached_compile_raising_structurer = functools.lru_cache(maxsize=STRUCTURER_CACHE_SIZE)(
+    _compile_raising_structurer
+)
+_STRUCTURER_CACHE_DEPENDENTS.append(_cached_compile_raising_structurer.cache_clear)
+
+# Functions which are called with each goal type that a structurer is compiled
+# for.
+_STRUCTURER_COMPILE_LISTENERS: List[Callable[[Any], None]] = []
+
+
+# Functions which are called with each goal type and the structurer compiled for
+# it, and return the structurer to use in its place (e.g. to instrument it).
+_STRUCTURER_WRAPPERS: List[Callable[[Any, Structurer], Structurer]] = []
+
+
+def _compile_structurer(goal_type: Any) -> Structurer:
+    for listener in _STRUCTURER_COMPILE_LISTENERS:
+        listener(goal_type)
+    structurer = _compile_goal_type_structurer(goal_type)
+    for wrap in _STRUCTURER_WRAPPERS:
+        structurer = wrap(goal_type, structurer)
+    return structurer
+
+
+def _compile_goal_type_structurer(goal_type: Any) -> Structurer:
+    hook = _get_structure_hook(goal_type)
+    if hook is not None:
+        return _compile_hook_structurer(goal_type, hook)
+    if getattr(goal_type, "__origin__", None) is Union:
+        return _compile_union_structurer(goal_type)
+    if _is_literal(goal_type):
+        return _compile_literal_structurer(goal_type)
+    if goal_type is Any or isinstance(goal_type, TypeVar):
+        return _structure_any
+    return _compile_value_structurer(goal_type)
+
+
+_cached_compile_structurer = functools.lru_cache(maxsize=STRUCTURER_CACHE_SIZE)(
+    _compile_structurer
+)
+
+
+StructureHook = Callable[[Any, Any], Any]
+
+
+def register_structure_hook(goal_type: Any, hook: StructureHook) -> None:
+    """Structures values into a type, and any subclass of it, with a function
+    rather than the built-in conversions.
+
+    The hook for a goal type is looked up once, when its structurer is
+    compiled, so custom types are structured as quickly as built-in ones.
+    Hooks registered for a subclass take precedence over hooks registered for
+    its bases.
+
+    :param goal_type: The type that the hook structures values into.
+    :param hook: A function called with the value (which is never `None`) and
+        the goal type, returning the structured value. It should raise a
+        `ValueError` when the value can't be structured.
+
+    Usage::
+
+      >>> import ipaddress
+      >>> import dataclass_structor
+      >>> dataclass_structor.register_structure_hook(
+      ...     ipaddress.IPv4Address, lambda value, goal_type: goal_type(value)
+      ... )
+      >>> dataclass_structor.structure("127.0.0.1", ipaddress.IPv4Address)
+      IPv4Address('127.0.0.1')
+    """
+    _STRUCTURE_HOOKS[goal_type] = hook
+    clear_structurer_cache()
+
+
+# Hooks that have been registered with `register_structure_hook`.
+_STRUCTURE_HOOKS: Dict[Any, StructureHook] = {}
+
+
+def _get_structure_hook(goal_type: Any) -> Optional[StructureHook]:
+    if not _STRUCTURE_HOOKS:
+        return None
+    try:
+        hook = _STRUCTURE_HOOKS.get(goal_type)
+    except TypeError:  # Unhashable goal types can't have hooks.
+        return None
+    if hook is None and isinstance(goal_type, type):
+        for base in goal_type.__mro__[1:]:
+            hook = _STRUCTURE_HOOKS.get(base)
+            if hook is not None:
+                break
+    return hook
+
+
+def _compile_hook_structurer(goal_type: Any, hook: StructureHook) -> Structurer:
+    def structure_with_hook(value: Any) -> Any:
+        if value is None:
+            return None
+        try:
+            return hook(value, goal_type)
+        except ValueError as ex:
+            return _Failure(_HOOK_FAILED, value, goal_type, ex)
+
+    return structure_with_hook
+
+
+def _structure_any(value: Any) -> Any:
+    return value
+
+
+# `typing.Literal` is only available from Python 3.8.
+_Literal = getattr(typing, "Literal", None)  # pylint: disable=invalid-name
+
+
+def _is_literal(goal_type: Any) -> bool:
+    return _Literal is not None and getattr(goal_type, "__origin__", None) is _Literal
+
+
+def _compile_literal_structurer(goal_type: Any) -> Structurer:
+    literal_values = goal_type.__args__
+
+    def structure_literal(value: Any) -> Any:
+        if value is None or value in literal_values:
+            return value
+        return _Failure(_STRUCTURE_FAILED, value, goal_type)
+
+    return structure_literal
 
 
 _STRUCTURE_UNION_TYPE_PRIORITY = (
@@ -55,41 +586,276 @@ _STRUCTURE_UNION_TYPE_PRIORITY = (
 )
 
 
-def _structure_union(value: Any, union_types: Tuple[Type[T]]) -> Optional[T]:
-    results = {}
+_NoneType = type(None)
+
+
+def _union_type_priority(a_type: Any) -> int:
+    try:
+        return _STRUCTURE_UNION_TYPE_PRIORITY.index(a_type)
+    except ValueError:
+        return len(_STRUCTURE_UNION_TYPE_PRIORITY)
+
+
+def register_tagged_union(
+    union_type: Any, tag_field: str, tag_map: Optional[Dict[Any, Any]] = None
+) -> None:
+    """Structures dicts into the member of a union named by a tag field rather
+    than attempting every member of the union.
+
+    :param union_type: The `Union` of types which share a tag field.
+    :param tag_field: The key of the dict that holds the tag.
+    :param tag_map: A dict of tag values to members of the union. When not
+        given it is built from the `Literal` type hints of the tag field.
+
+    Usage::
+
+      >>> import dataclass_structor
+      >>> dataclass_structor.register_tagged_union(
+      ...     typing.Union[Cat, Dog], "kind", {"cat": Cat, "dog": Dog}
+      ... )
+    """
+    if tag_map is None:
+        tag_map = _get_literal_tag_map(union_type.__args__, tag_field)
+        if tag_map is None:
+            raise ValueError(
+                f"Could not find distinct Literal tags for {tag_field} in {union_type}"
+            )
+    _UNION_TAGS[union_type] = (tag_field, tag_map)
+    clear_structurer_cache()
+
+
+# Unions that have been registered with `register_tagged_union`.
+_UNION_TAGS: Dict[Any, Tuple[str, Dict[Any, Any]]] = {}
+
+
+def _get_literal_tag_map(
+    union_types: Tuple[Any, ...], tag_field: str
+) -> Optional[Dict[Any, Any]]:
+    tag_map: Dict[Any, Any] = {}
     for a_type in union_types:
+        if a_type is _NoneType:
+            continue
         try:
-            results[a_type] = structure(value, a_type)
-        except ValueError:
-            pass
+            tag_type: Any = resolve_type_hints(a_type).get(tag_field)
+        except (AttributeError, NameError, TypeError):
+            return None
+        if not _is_literal(tag_type):
+            return None
+        for tag in tag_type.__args__:
+            if tag in tag_map:
+                return None
+            tag_map[tag] = a_type
+    return tag_map
+
 
-    for a_type in _STRUCTURE_UNION_TYPE_PRIORITY:
-        if a_type in results:
-            return results[a_type]
+def _get_union_tag(union_type: Any) -> Optional[Tuple[str, Dict[Any, Any]]]:
+    if union_type in _UNION_TAGS:
+        return _UNION_TAGS[union_type]
+    try:
+        candidate_fields = resolve_type_hints(union_type.__args__[0])
+    except (AttributeError, NameError, TypeError):
+        return None
+    for tag_field, tag_type in candidate_fields.items():
+        if _is_literal(tag_type):
+            tag_map = _get_literal_tag_map(union_type.__args__, tag_field)
+            if tag_map is not None:
+                return tag_field, tag_map
     return None
 
 
+def _get_structurable_value_types(goal_type: Any) -> Tuple[type, ...]:
+    if _is_literal(goal_type):
+        return tuple(type(v) for v in goal_type.__args__)
+    if (
+        goal_type is Any
+        or isinstance(goal_type, TypeVar)
+        or _get_structure_hook(goal_type) is not None
+    ):
+        return (object,)
+    return tuple(value_type for value_type, _ in _compile_conversion_pairs(goal_type))
+
+
+def _compile_union_members(
+    union_type: Any, get_member: Callable[[Any], T]
+) -> Callable[[Any], Tuple[T, ...]]:
+    # Returns a function which returns the members of a union to attempt for
+    # a value that isn't `None`, each made by `get_member` from its type.
+    # Members are attempted in priority order so that the first member that
+    # can hold the value wins. Types that aren't in the priority list are
+    # attempted last in the order they were declared. Only the members with a
+    # conversion for the type of the value are attempted, or only the member
+    # named by the tag of a dict when the union is tagged.
+    member_pairs = tuple(
+        (_get_structurable_value_types(a_type), get_member(a_type))
+        for a_type in sorted(union_type.__args__, key=_union_type_priority)
+        if a_type is not _NoneType
+    )
+    members_by_value_type: Dict[type, Tuple[T, ...]] = {}
+
+    union_tag = _get_union_tag(union_type)
+    tag_field = union_tag[0] if union_tag else None
+    tagged_members: Dict[Any, Tuple[T, ...]] = (
+        {tag: (get_member(a_type),) for tag, a_type in union_tag[1].items()}
+        if union_tag
+        else {}
+    )
+
+    def get_members(value: Any) -> Tuple[T, ...]:
+        value_type = type(value)
+        members: Optional[Tuple[T, ...]]
+        if tag_field is not None and value_type is dict:
+            try:
+                members = tagged_members.get(value.get(tag_field))
+            except TypeError:  # The tag isn't hashable
+                members = None
+            if members is not None:
+                return members
+        members = members_by_value_type.get(value_type)
+        if members is None:
+            members = tuple(
+                member
+                for value_types, member in member_pairs
+                if issubclass(value_type, value_types)
+            )
+            members_by_value_type[value_type] = members
+        return members
+
+    return get_members
+
+
+def _compile_union_structurer(union_type: Any) -> Structurer:
+    get_member_structurers = _compile_union_members(union_type, _get_structurer)
+
+    def structure_union(value: Any) -> Any:
+        if value is None:
+            return None
+        for member_structurer in get_member_structurers(value):
+            obj = member_structurer(value)
+            if obj.__class__ is not _Failure:
+                return obj
+        return None
+
+    return structure_union
+
+
+def resolve_type_hints(goal_type: Any) -> Dict[str, Any]:
+    """Returns the type hints used to structure the fields of a type.
+
+    The hints are taken from the type itself or, when it has none (e.g. a
+    slotted class), from its constructor. They are resolved once per type and
+    cached until :func:`invalidate_type_hints` is called.
+
+    :param goal_type: A class whose field types you would like.
+
+    Usage::
+
+      >>> import dataclass_structor
+      >>> dataclass_structor.resolve_type_hints(Guest)
+      {'first_name': typing.Optional[str]}
+    """
+    try:
+        return goal_type.__dict__[_TYPE_HINTS_ATTRIBUTE]
+    except (AttributeError, KeyError):
+        pass
+    hints = _get_types_from_object_or_its_constructor(goal_type)
+    if isinstance(goal_type, type):
+        try:
+            setattr(goal_type, _TYPE_HINTS_ATTRIBUTE, hints)
+        except TypeError:
+            # Attributes can't be set on built-in and extension types.
+            return hints
+        _TYPES_WITH_HINTS.add(goal_type)
+    return hints
+
+
+def invalidate_type_hints(goal_type: Any = None) -> None:
+    """Discards cached type hints for a type, or for every type if no type is
+    given. Compiled structurers are discarded as well since they were built
+    from the cached hints.
+
+    :param goal_type: The type whose hints should be resolved again.
+    """
+    for cached_type in list(_TYPES_WITH_HINTS) if goal_type is None else [goal_type]:
+        if isinstance(cached_type, type) and _TYPE_HINTS_ATTRIBUTE in vars(cached_type):
+            delattr(cached_type, _TYPE_HINTS_ATTRIBUTE)
+            _TYPES_WITH_HINTS.discard(cached_type)
+    clear_structurer_cache()
+
+
+# The class attribute holding the type hints resolved for a class. They're kept
+# on the class itself rather than in a mapping keyed by the class, since the
+# hints of a class which refers to itself (e.g. a tree) refer to the class, and
+# only a reference cycle through the class can still be collected.
+_TYPE_HINTS_ATTRIBUTE = "__dataclass_structor_type_hints__"
+
+# The classes holding cached type hints. The classes are weakly referenced so
+# that classes created at runtime can still be collected.
+_TYPES_WITH_HINTS: "weakref.WeakSet[type]" = weakref.WeakSet()
+
+
 def _get_types_from_object_or_its_constructor(goal_type):
     own_hints = get_type_hints(goal_type)
     if own_hints:
         return own_hints
-    return get_type_hints(goal_type.__init__)
+    constructor_hints = get_type_hints(goal_type.__init__)
+    constructor_hints.pop("return", None)
+    return constructor_hints
 
 
-def _try_structure_object(value: Any, goal_type: Any) -> Any:
+def _get_field_structurers(goal_type: Any) -> Dict[str, Structurer]:
     try:
-        return goal_type(
-            **{
-                k: structure(v, _get_types_from_object_or_its_constructor(goal_type)[k])
-                for k, v in value.items()
-            }
-        )
-    except (KeyError, ValueError):
-        pass
-    if issubclass(goal_type, dict):
-        dict_value_type = goal_type.__args__[1]
-        return {k: structure(v, dict_value_type) for k, v in value.items()}
-    return None
+        hints = resolve_type_hints(goal_type)
+    except TypeError:
+        return {}
+    return {k: _get_structurer(v) for k, v in hints.items()}
+
+
+def _compile_object_structurer(goal_type: Any) -> Optional[Structurer]:
+    if goal_type is dict or getattr(goal_type, "__origin__", None) is dict:
+        dict_value_type = getattr(goal_type, "__args__", (str, Any))[1]
+        dict_value_structurer = _get_structurer(dict_value_type)
+
+        def structure_dict(value: Dict[Any, Any]) -> Any:
+            failures = _FAILURE_COUNT.count
+            obj = {k: dict_value_structurer(v) for k, v in value.items()}
+            if _FAILURE_COUNT.count != failures and _Failure in map(type, obj.values()):
+                return _find_failure(obj.items())
+            return obj
+
+        return structure_dict
+
+    if (
+        goal_type in _SCALAR_GOAL_TYPES
+        or _is_enum(goal_type)
+        or getattr(goal_type, "_name", None) in ("List", "Set", "Tuple")
+    ):
+        return None
+
+    # The field structurers are resolved on first use rather than here so that
+    # types which refer to themselves (e.g. trees) can be compiled.
+    field_structurers: Optional[Dict[str, Structurer]] = None
+
+    def structure_object(value: Dict[str, Any]) -> Any:
+        nonlocal field_structurers
+        if field_structurers is None:
+            field_structurers = _get_field_structurers(goal_type)
+        fields = {}
+        for key, field_value in value.items():
+            field_structurer = field_structurers.get(key)
+            if field_structurer is None:
+                obj: Any = _Failure(_NOT_A_FIELD, field_value, goal_type)
+            else:
+                obj = field_structurer(field_value)
+            if obj.__class__ is _Failure:
+                obj.keys.append(key)
+                return obj
+            fields[key] = obj
+        try:
+            return goal_type(**fields)
+        except ValueError as ex:  # e.g. raised by `__post_init__`
+            return _Failure(_STRUCTURE_FAILED, value, goal_type, ex)
+
+    return structure_object
 
 
 def _try_convert_string_to_decimal(value):
@@ -109,86 +875,752 @@ _STRUCTURE_STR_GOAL_TYPE_TO_CONVERSION_MAP: Dict[Type, Callable] = {
 }
 
 
-def _try_structure_str(value: str, goal_type: Any) -> Any:
+# Goal types which are never structured from a dict.
+_SCALAR_GOAL_TYPES = frozenset([str, bool, *_STRUCTURE_STR_GOAL_TYPE_TO_CONVERSION_MAP])
+
+
+def set_parse_cache_size(goal_type: Any, maxsize: int) -> None:
+    """Keeps the values most recently parsed from strings into a type, so
+    that strings repeated across many values (e.g. timestamps or ids) are only
+    parsed once. The values are shared between the objects structured from
+    the same string, which is safe since these types are immutable.
+
+    :param goal_type: One of `datetime.datetime`, `datetime.date`,
+        `uuid.UUID`, `decimal.Decimal`, `int` or `float`.
+    :param maxsize: The most parsed values to keep. The least recently used
+        are discarded first. `0` stops caching them.
+
+    Usage::
+
+      >>> import uuid
+      >>> import dataclass_structor
+      >>> dataclass_structor.set_parse_cache_size(uuid.UUID, 10_000)
+    """
     conversion = _STRUCTURE_STR_GOAL_TYPE_TO_CONVERSION_MAP.get(goal_type)
+    if conversion is None:
+        raise ValueError(f"Could not cache strings parsed into {goal_type}")
+    if maxsize > 0:
+        _PARSE_CACHES[goal_type] = functools.lru_cache(maxsize=maxsize)(conversion)
+    else:
+        _PARSE_CACHES.pop(goal_type, None)
+    clear_structurer_cache()
+
+
+def parse_cache_info() -> Dict[Any, Any]:
+    """Returns the hits, misses and sizes of the caches of parsed strings set
+    up with :func:`set_parse_cache_size`, keyed by their type.
+
+    Usage::
+
+      >>> import dataclass_structor
+      >>> dataclass_structor.parse_cache_info()
+      {<class 'uuid.UUID'>: CacheInfo(hits=9000, misses=1000, maxsize=10000, currsize=1000)}
+    """
+    return {
+        goal_type: parse_cache.cache_info()  # type: ignore
+        for goal_type, parse_cache in _PARSE_CACHES.items()
+    }
+
+
+# The cached conversions of strings set up with `set_parse_cache_size`.
+_PARSE_CACHES: Dict[Any, Callable] = {}
+
+
+def _compile_str_structurer(goal_type: Any) -> Structurer:
+    conversion = _PARSE_CACHES.get(
+        goal_type, _STRUCTURE_STR_GOAL_TYPE_TO_CONVERSION_MAP.get(goal_type)
+    )
     if conversion:
-        try:
-            return conversion(value)
-        except ValueError as ex:
-            raise ValueError(
-                f"Could not convert {value} of type {type(value)} into a {goal_type}."
-            ) from ex
 
-    if hasattr(goal_type, "mro") and enum.Enum in goal_type.mro():
-        if value in goal_type.__members__:
-            return goal_type[value]
+        def structure_str(value: str) -> Any:
+            try:
+                return conversion(value)  # type: ignore
+            except ValueError as ex:
+                return _Failure(_CONVERT_FAILED, value, goal_type, ex)
+
+        return structure_str
+
+    if _is_enum(goal_type):
+        return _get_enum_structurer(goal_type)
+    return _structure_any
+
+
+def _is_enum(goal_type: Any) -> bool:
+    return isinstance(goal_type, type) and issubclass(goal_type, enum.Enum)
+
+
+def register_case_insensitive_enum(enum_type: Type[enum.Enum]) -> None:
+    """Structures strings into the members of an enum whose name or value
+    match the string when case is ignored.
+
+    :param enum_type: The enum to look up members of without regard to case.
+
+    Usage::
+
+      >>> import dataclass_structor
+      >>> dataclass_structor.register_case_insensitive_enum(SoundsEnum)
+      >>> dataclass_structor.structure("Meow", SoundsEnum)
+      <SoundsEnum.CAT: 'meow'>
+    """
+    _CASE_INSENSITIVE_ENUMS.add(enum_type)
+    clear_structurer_cache()
+
+
+# Enums that have been registered with `register_case_insensitive_enum`.
+_CASE_INSENSITIVE_ENUMS: Set[Any] = set()
+
+
+def _compile_enum_structurer(goal_type: Any) -> Structurer:
+    # Members are looked up by name, or failing that by value, in a single
+    # dict. Names win when a name is also the value of another member.
+    members: Dict[Any, Any] = {}
+    for member in goal_type.__members__.values():
         try:
-            return getattr(str, goal_type)
-        except TypeError as ex:
-            raise ValueError(
-                f"Could not convert {value} of type {type(value)} into a {goal_type} enum."
-            ) from ex
-    return value
+            members.setdefault(member.value, member)
+        except TypeError:  # Unhashable values can only be looked up by name.
+            pass
+    members.update(goal_type.__members__)
+    bool_members = frozenset(
+        member
+        for member in goal_type.__members__.values()
+        if isinstance(member.value, bool)
+    )
+
+    folded_members: Dict[str, Any] = {}
+    if goal_type in _CASE_INSENSITIVE_ENUMS:
+        for key, member in members.items():
+            if isinstance(key, str):
+                folded_members.setdefault(key.casefold(), member)
+
+    def structure_enum(value: Any) -> Any:
+        # Only called with strs, ints, floats and bools which are always
+        # hashable. Floats which equal an int value (e.g. `2.0` for `2`) find
+        # its member, but bools only find members whose value is a bool and
+        # the other way around, even though `True == 1`.
+        member = members.get(value)
+        if member is not None and (
+            value.__class__ is str
+            or (value.__class__ is bool) is (member in bool_members)
+        ):
+            return member
+        if folded_members and isinstance(value, str):
+            member = folded_members.get(value.casefold())
+            if member is not None:
+                return member
+        return _Failure(_ENUM_FAILED, value, goal_type)
+
+    return structure_enum
+
+
+# The enum structurer is shared by the str, int and float conversions.
+_get_enum_structurer = functools.lru_cache(maxsize=STRUCTURER_CACHE_SIZE)(
+    _compile_enum_structurer
+)
+_STRUCTURER_CACHE_DEPENDENTS.append(_get_enum_structurer.cache_clear)
+
+
+def _is_object_type(goal_type: Any) -> bool:
+    # Whether the goal type is a class which is structured from a dict of its
+    # fields (e.g. a dataclass or a slotted class).
+    return (
+        isinstance(goal_type, type)
+        and goal_type not in _SCALAR_GOAL_TYPES
+        and not _is_enum(goal_type)
+        and not issubclass(goal_type, (dict, list, set, tuple))
+    )
+
+
+def _get_optional_member(goal_type: Any) -> Any:
+    if getattr(goal_type, "__origin__", None) is not Union:
+        return None
+    members = [a_type for a_type in goal_type.__args__ if a_type is not _NoneType]
+    if len(members) != 1:
+        return None
+    return members[0]
 
 
-def _try_structure_int(value: int, goal_type: Any) -> Union[int, decimal.Decimal, str]:
+def _is_sequence(goal_type: Any) -> bool:
+    return getattr(goal_type, "_name", None) in ("List", "Set") or (
+        getattr(goal_type, "_name", None) == "Tuple"
+        and len(getattr(goal_type, "__args__", ())) == 2
+        and goal_type.__args__[1] is Ellipsis
+    )
+
+
+def _is_dict(goal_type: Any) -> bool:
+    return goal_type is dict or getattr(goal_type, "__origin__", None) is dict
+
+
+def _is_nested(goal_type: Any) -> bool:
+    # Whether values of the goal type can hold objects or lists.
+    member = _get_optional_member(goal_type)
+    if member is not None:
+        goal_type = member
+    return _is_sequence(goal_type) or _is_dict(goal_type) or _is_object_type(goal_type)
+
+
+def _compile_int_structurer(goal_type: Any) -> Structurer:
     if goal_type == decimal.Decimal:
-        return decimal.Decimal(value)
+        return decimal.Decimal
     if goal_type == str:
-        return str(value)
-    return value
+        return str
+    if _is_enum(goal_type):
+        return _get_enum_structurer(goal_type)
+    return _structure_any
 
 
-def _try_structure_float(
-    value: float, goal_type: Any
-) -> Union[float, decimal.Decimal, None]:
+def _compile_float_structurer(goal_type: Any) -> Optional[Structurer]:
     if goal_type == decimal.Decimal:
-        return decimal.Decimal(value)
+        return decimal.Decimal
     if goal_type == float:
-        return value
+        return _structure_any
+    if _is_enum(goal_type):
+        return _get_enum_structurer(goal_type)
     return None
 
 
-def _try_structure_list(value: List[Any], goal_type: Any) -> List[Any]:
-    list_content_type = goal_type.__args__[0]
-    return [structure(v, list_content_type) for v in value]
+def _compile_list_structurer(goal_type: Any) -> Optional[Structurer]:
+    if getattr(goal_type, "_name", None) != "List":
+        return None
+    list_content_structurer = _get_structurer(getattr(goal_type, "__args__", (Any,))[0])
+
+    def structure_list(value: Any) -> Any:
+        failures = _FAILURE_COUNT.count
+        obj = [list_content_structurer(v) for v in value]
+        if _FAILURE_COUNT.count != failures and _Failure in map(type, obj):
+            return _find_failure(enumerate(obj))
+        return obj
+
+    return structure_list
 
 
-def _try_structure_set(value: Set[Any], goal_type: Any) -> Set:
-    set_content_type = goal_type.__args__[0]
-    return set(structure(v, set_content_type) for v in value)
+def _compile_set_structurer(goal_type: Any) -> Optional[Structurer]:
+    if getattr(goal_type, "_name", None) != "Set":
+        return None
+    set_content_structurer = _get_structurer(getattr(goal_type, "__args__", (Any,))[0])
 
+    def structure_set(value: Any) -> Any:
+        failures = _FAILURE_COUNT.count
+        items = [set_content_structurer(v) for v in value]
+        if _FAILURE_COUNT.count != failures and _Failure in map(type, items):
+            return _find_failure(enumerate(items))
+        return set(items)
 
-def _try_structure_tuple(value: Tuple[Any], goal_type: Any) -> Tuple:
-    tuple_content_types = goal_type.__args__
-    return tuple(structure(value[i], t) for i, t in enumerate(tuple_content_types))
+    return structure_set
 
 
-# When structuring values the first value in each pair is used as a condition
-# which if true will attempt to structure the value using the second item in
-# the pair. Both items in the pair will be called with the value as the first
-# argument and the "goal type" as the second argument.
+def _compile_tuple_structurer(goal_type: Any) -> Optional[Structurer]:
+    if getattr(goal_type, "_name", None) != "Tuple":
+        return None
+    tuple_content_types: Tuple[Any, ...] = getattr(goal_type, "__args__", ())
+    if len(tuple_content_types) == 2 and tuple_content_types[1] is Ellipsis:
+        tuple_item_structurer = _get_structurer(tuple_content_types[0])
+
+        def structure_tuple(value: Any) -> Any:
+            failures = _FAILURE_COUNT.count
+            obj = tuple(  # pylint: disable=R1728
+                [tuple_item_structurer(v) for v in value]
+            )
+            if _FAILURE_COUNT.count != failures and _Failure in map(type, obj):
+                return _find_failure(enumerate(obj))
+            return obj
+
+        return structure_tuple
+
+    tuple_content_structurers = tuple(_get_structurer(t) for t in tuple_content_types)
+
+    def structure_fixed_tuple(value: Any) -> Any:
+        failures = _FAILURE_COUNT.count
+        obj = tuple(  # pylint: disable=R1728
+            [s(value[i]) for i, s in enumerate(tuple_content_structurers)]
+        )
+        if _FAILURE_COUNT.count != failures and _Failure in map(type, obj):
+            return _find_failure(enumerate(obj))
+        return obj
+
+    return structure_fixed_tuple
+
+
+# When compiling a structurer for a goal type, the first value in each pair is
+# the type of value that the conversion applies to and the second value is
+# called with the goal type to compile the conversion (or `None` when the
+# conversion doesn't apply to the goal type). Conversions are called with the
+# value and may return `None` to hand off to the next applicable conversion.
 # The order of this list of pairs denotes what order values will be structured
 # by.
-_STRUCTURE_VALUE_CONDITION_CONVERSION_PAIRS: Iterable[Tuple[Callable, Callable]] = [
-    (lambda v, gt: isinstance(v, dict), _try_structure_object),
-    (lambda v, gt: getattr(gt, "_name", None) == "Tuple", _try_structure_tuple),
-    (lambda v, gt: getattr(gt, "_name", None) == "Set", _try_structure_set),
-    (lambda v, gt: getattr(gt, "_name", None) == "List", _try_structure_list),
-    (lambda v, gt: isinstance(v, float), _try_structure_float),
-    (lambda v, gt: isinstance(v, int), _try_structure_int),
-    (lambda v, gt: isinstance(v, str), _try_structure_str),
+_STRUCTURE_VALUE_TYPE_CONVERSION_COMPILER_PAIRS: Iterable[
+    Tuple[type, Callable[[Any], Optional[Structurer]]]
+] = [
+    (dict, _compile_object_structurer),
+    (object, _compile_tuple_structurer),
+    (object, _compile_set_structurer),
+    (object, _compile_list_structurer),
+    (float, _compile_float_structurer),
+    (int, _compile_int_structurer),
+    (str, _compile_str_structurer),
 ]
 
 
-def _structure_value(value: Any, goal_type: Type[T]) -> T:
-    for condition, conversion in _STRUCTURE_VALUE_CONDITION_CONVERSION_PAIRS:
-        if condition(value, goal_type):
-            # This could be a good place for PEP 572 the assignment operator
-            # but since Python 3.7 is a target we shall do without.
-            obj = conversion(value, goal_type)
+def _compile_conversion_pairs(goal_type: Any) -> List[Tuple[type, Structurer]]:
+    compiler_pairs = _STRUCTURE_VALUE_TYPE_CONVERSION_COMPILER_PAIRS
+    conversion_pairs: List[Tuple[type, Structurer]] = []
+    for value_type, compile_conversion in compiler_pairs:
+        conversion = compile_conversion(goal_type)
+        if conversion is not None:
+            conversion_pairs.append((value_type, conversion))
+    return conversion_pairs
+
+
+def _compile_value_structurer(goal_type: Any) -> Structurer:
+    conversion_pairs = _compile_conversion_pairs(goal_type)
+    conversions_by_value_type: Dict[type, Tuple[Structurer, ...]] = {}
+
+    def structure_value(value: Any) -> Any:
+        if value is None:
+            return None
+        value_type = type(value)
+        conversions = conversions_by_value_type.get(value_type)
+        if conversions is None:
+            conversions = conversions_by_value_type[value_type] = tuple(
+                conversion
+                for a_type, conversion in conversion_pairs
+                if issubclass(value_type, a_type)
+            )
+        for conversion in conversions:
+            obj = conversion(value)
             if obj is not None:
                 return obj
-    raise ValueError(
-        f"Could not structure: {value} of type {type(value)} into {goal_type}"
+        return _Failure(_STRUCTURE_FAILED, value, goal_type)
+
+    return structure_value
+
+
+# Structures the value it's called with, yielding each nested value that it
+# needs structured along with the deep structurer for it, and being sent back
+# the structured value.
+_DeepStructurer = Callable[[Any], Generator[Tuple[Any, Any], Any, Any]]
+
+
+def _structure_or_fail(
+    structurer: Structurer,
+    value: Any,
+    goal_type: Any,
+    projection: Optional["Projection"] = None,
+) -> Any:
+    # Returns the object or `_Failure` that a structurer returns for a value,
+    # structuring values nested too deeply for it with `_structure_deep`.
+    try:
+        return structurer(value)
+    except RecursionError as ex:
+        return _structure_deep(value, goal_type, projection, ex)
+
+
+def _structure_deep(
+    value: Any,
+    goal_type: Any,
+    projection: Optional["Projection"],
+    error: RecursionError,
+) -> Any:
+    # Structures a value which is nested too deeply for the compiled
+    # structurers, which recurse once or more per level of nesting. Values of
+    # goal types which can hold themselves (e.g. trees) are structured by deep
+    # structurers, with a stack of them in place of the call stack, and every
+    # other value by its compiled structurer. The error is raised again for
+    # values which can't be nested that deeply (e.g. a hook which recursed too
+    # deeply) and for selected fields.
+    deep_structurer = (
+        None if projection is not None else _get_deep_structurer(goal_type)
+    )
+    if deep_structurer is None:
+        raise error
+    stack = [deep_structurer(value)]
+    obj = None
+    while stack:
+        try:
+            deep_structurer, value = stack[-1].send(obj)
+        except StopIteration as ex:
+            stack.pop()
+            obj = ex.value
+        else:
+            stack.append(deep_structurer(value))
+            obj = None
+    return obj
+
+
+def _get_deep_structurer(goal_type: Any) -> Optional[_DeepStructurer]:
+    try:
+        hash(goal_type)
+    except TypeError:
+        return _compile_deep_structurer(goal_type)
+    return _cached_compile_deep_structurer(goal_type)
+
+
+def _compile_deep_structurer(goal_type: Any) -> Optional[_DeepStructurer]:
+    # Mirrors `_compile_goal_type_structurer`, returning `None` for goal types
+    # whose values can only be nested as deeply as the type itself.
+    if not _can_nest_without_limit(goal_type):
+        return None
+    if getattr(goal_type, "__origin__", None) is Union:
+        return _compile_deep_union_structurer(goal_type)
+    if _is_dict(goal_type):
+        return _compile_deep_dict_structurer(goal_type)
+    if getattr(goal_type, "_name", None) in ("List", "Set", "Tuple"):
+        return _compile_deep_sequence_structurer(goal_type)
+    return _compile_deep_object_structurer(goal_type)
+
+
+_cached_compile_deep_structurer = functools.lru_cache(maxsize=STRUCTURER_CACHE_SIZE)(
+    _compile_deep_structurer
+)
+_STRUCTURER_CACHE_DEPENDENTS.append(_cached_compile_deep_structurer.cache_clear)
+
+
+def _get_nested_goal_types(goal_type: Any) -> Tuple[Any, ...]:
+    # The goal types of the values held by values of the goal type.
+    if _get_structure_hook(goal_type) is not None or _is_literal(goal_type):
+        return ()
+    if getattr(goal_type, "__origin__", None) is Union:
+        union_tag = _get_union_tag(goal_type)
+        return goal_type.__args__ + (tuple(union_tag[1].values()) if union_tag else ())
+    if _is_dict(goal_type):
+        return (getattr(goal_type, "__args__", (str, Any))[1],)
+    if getattr(goal_type, "_name", None) in ("List", "Set", "Tuple"):
+        return tuple(t for t in getattr(goal_type, "__args__", ()) if t is not Ellipsis)
+    if (
+        goal_type is Any
+        or isinstance(goal_type, TypeVar)
+        or goal_type in _SCALAR_GOAL_TYPES
+        or _is_enum(goal_type)
+    ):
+        return ()
+    try:
+        hints = resolve_type_hints(goal_type)
+    except (AttributeError, NameError, TypeError):
+        hints = {}
+    return tuple(hints.values())
+
+
+def _can_nest_without_limit(goal_type: Any) -> bool:
+    # Whether a goal type which holds itself can be reached from the goal type
+    # through the types of the values it holds, found by walking them depth
+    # first until one of the types being walked is reached again.
+    walking = {id(goal_type)}
+    walked = set()
+    stack = [(goal_type, iter(_get_nested_goal_types(goal_type)))]
+    while stack:
+        a_type, nested_types = stack[-1]
+        for nested_type in nested_types:
+            if id(nested_type) in walking:
+                return True
+            if id(nested_type) not in walked:
+                walking.add(id(nested_type))
+                stack.append((nested_type, iter(_get_nested_goal_types(nested_type))))
+                break
+        else:
+            stack.pop()
+            walking.remove(id(a_type))
+            walked.add(id(a_type))
+    return False
+
+
+def _compile_deep_union_structurer(union_type: Any) -> _DeepStructurer:
+    # Mirrors `_compile_union_structurer`, with the members attempted in the
+    # same order.
+    get_members = _compile_union_members(
+        union_type,
+        lambda a_type: (_get_structurer(a_type), _get_deep_structurer(a_type)),
+    )
+
+    def structure_union(value: Any) -> Any:
+        if value is None:
+            return None
+        for member_structurer, deep_member_structurer in get_members(value):
+            if deep_member_structurer is None:
+                obj = member_structurer(value)
+            else:
+                obj = yield deep_member_structurer, value
+            if obj.__class__ is not _Failure:
+                return obj
+        return None
+
+    return structure_union
+
+
+def _compile_deep_dict_structurer(goal_type: Any) -> _DeepStructurer:
+    structurer = _get_structurer(goal_type)
+    deep_value_structurer = _get_deep_structurer(goal_type.__args__[1])
+
+    def structure_dict(value: Any) -> Any:
+        if not isinstance(value, dict):
+            return structurer(value)
+        obj = {}
+        for key, item in value.items():
+            item_obj = yield deep_value_structurer, item
+            if item_obj.__class__ is _Failure:
+                item_obj.keys.append(key)
+                return item_obj
+            obj[key] = item_obj
+        return obj
+
+    return structure_dict
+
+
+def _compile_deep_sequence_structurer(goal_type: Any) -> _DeepStructurer:
+    # Lists, sets and tuples are structured from any value, like their compiled
+    # structurers.
+    item_types = goal_type.__args__
+    name = getattr(goal_type, "_name")
+    if name == "Tuple" and not (len(item_types) == 2 and item_types[1] is Ellipsis):
+        return _compile_deep_fixed_tuple_structurer(item_types)
+    container_type = {"List": list, "Set": set, "Tuple": tuple}[name]
+    deep_item_structurer = _get_deep_structurer(item_types[0])
+
+    def structure_sequence(value: Any) -> Any:
+        if value is None:
+            return None
+        items = []
+        for i, item in enumerate(value):
+            obj = yield deep_item_structurer, item
+            if obj.__class__ is _Failure:
+                obj.keys.append(i)
+                return obj
+            items.append(obj)
+        return items if container_type is list else container_type(items)
+
+    return structure_sequence
+
+
+def _compile_deep_fixed_tuple_structurer(
+    item_types: Tuple[Any, ...],
+) -> _DeepStructurer:
+    item_pairs = tuple(
+        (_get_structurer(t), _get_deep_structurer(t)) for t in item_types
+    )
+
+    def structure_fixed_tuple(value: Any) -> Any:
+        if value is None:
+            return None
+        items = []
+        for i, (item_structurer, deep_item_structurer) in enumerate(item_pairs):
+            if deep_item_structurer is None:
+                obj = item_structurer(value[i])
+            else:
+                obj = yield deep_item_structurer, value[i]
+            if obj.__class__ is _Failure:
+                obj.keys.append(i)
+                return obj
+            items.append(obj)
+        return tuple(items)
+
+    return structure_fixed_tuple
+
+
+def _compile_deep_object_structurer(goal_type: Any) -> _DeepStructurer:
+    structurer = _get_structurer(goal_type)
+    # The fields are resolved on first use, like the compiled object
+    # structurer, so that types which refer to themselves can be compiled.
+    field_pairs: Optional[Dict[str, Tuple[Structurer, Any]]] = None
+
+    def structure_object(value: Any) -> Any:
+        nonlocal field_pairs
+        if not isinstance(value, dict):
+            return structurer(value)
+        if field_pairs is None:
+            field_pairs = {
+                name: (_get_structurer(hint), _get_deep_structurer(hint))
+                for name, hint in resolve_type_hints(goal_type).items()
+            }
+        fields = {}
+        for key, field_value in value.items():
+            field_pair = field_pairs.get(key)
+            if field_pair is None:
+                obj: Any = _Failure(_NOT_A_FIELD, field_value, goal_type)
+            elif field_pair[1] is None:
+                obj = field_pair[0](field_value)
+            else:
+                obj = yield field_pair[1], field_value
+            if obj.__class__ is _Failure:
+                obj.keys.append(key)
+                return obj
+            fields[key] = obj
+        try:
+            return goal_type(**fields)
+        except ValueError as ex:  # e.g. raised by `__post_init__`
+            return _Failure(_STRUCTURE_FAILED, value, goal_type, ex)
+
+    return structure_object
+
+
+class _Unselected:
+    def __repr__(self) -> str:
+        return "UNSELECTED"
+
+    def __reduce__(self) -> str:
+        return "UNSELECTED"
+
+
+# The value of the fields without defaults which weren't selected to be
+# structured.
+UNSELECTED: Any = _Unselected()
+
+# The fields selected to be structured as sorted pairs of each field name and
+# either `True` for the whole field or the fields selected within it.
+Projection = Tuple[Tuple[str, Any], ...]
+
+
+def _get_projection(fields: Any) -> Projection:
+    selected: Dict[str, Any] = {}
+    _add_to_projection(selected, fields)
+    return _freeze_projection(selected)
+
+
+def _add_to_projection(selected: Dict[str, Any], fields: Any) -> None:
+    if isinstance(fields, str):
+        fields = (fields,)
+    items = fields.items() if isinstance(fields, dict) else ((f, True) for f in fields)
+    for path, nested in items:
+        if not nested:
+            continue
+        name, _, nested_path = path.partition(".")
+        if nested_path:
+            nested = {nested_path: nested}
+        if nested is True or selected.get(name) is True:
+            selected[name] = True
+        else:
+            _add_to_projection(selected.setdefault(name, {}), nested)
+
+
+def _freeze_projection(selected: Dict[str, Any]) -> Projection:
+    return tuple(
+        sorted(
+            (name, True if nested is True else _freeze_projection(nested))
+            for name, nested in selected.items()
+        )
+    )
+
+
+def _compile_projected_structurer(goal_type: Any, projection: Projection) -> Structurer:
+    member = _get_optional_member(goal_type)
+    if member is not None:
+        return _compile_projected_structurer(member, projection)
+    if _get_structure_hook(goal_type) is None:
+        if _is_object_type(goal_type):
+            return _compile_projected_object_structurer(goal_type, projection)
+        if _is_sequence(goal_type) or _is_dict(goal_type):
+            return _compile_projected_container_structurer(goal_type, projection)
+    raise ValueError(f"Could not select fields of {goal_type}")
+
+
+_cached_compile_projected_structurer = functools.lru_cache(
+    maxsize=STRUCTURER_CACHE_SIZE
+)(_compile_projected_structurer)
+_STRUCTURER_CACHE_DEPENDENTS.append(_cached_compile_projected_structurer.cache_clear)
+
+
+def _get_projected_structurer(goal_type: Any, projection: Projection) -> Structurer:
+    try:
+        hash(goal_type)
+    except TypeError:
+        return _compile_projected_structurer(goal_type, projection)
+    return _cached_compile_projected_structurer(goal_type, projection)
+
+
+def _compile_projected_object_structurer(
+    goal_type: Any, projection: Projection
+) -> Structurer:
+    hints = resolve_type_hints(goal_type)
+    field_structurers: Dict[str, Structurer] = {}
+    for name, nested in projection:
+        if name not in hints:
+            raise ValueError(
+                f"Could not select {name} which isn't a field of {goal_type}"
+            )
+        field_structurers[name] = (
+            _get_structurer(hints[name])
+            if nested is True
+            else _compile_projected_structurer(hints[name], nested)
+        )
+    unselected_fields = {
+        name: UNSELECTED
+        for name in _get_required_fields(goal_type)
+        if name not in field_structurers
+    }
+
+    def structure_projected_object(value: Any) -> Any:
+        if value is None:
+            return None
+        if not isinstance(value, dict):
+            return _Failure(_STRUCTURE_FAILED, value, goal_type)
+        fields = {}
+        for key, field_structurer in field_structurers.items():
+            if key in value:
+                obj = field_structurer(value[key])
+                if obj.__class__ is _Failure:
+                    obj.keys.append(key)
+                    return obj
+                fields[key] = obj
+        try:
+            return goal_type(**fields, **unselected_fields)
+        except ValueError as ex:  # e.g. raised by `__post_init__`
+            return _Failure(_STRUCTURE_FAILED, value, goal_type, ex)
+
+    return structure_projected_object
+
+
+def _compile_projected_container_structurer(
+    goal_type: Any, projection: Projection
+) -> Structurer:
+    if _is_dict(goal_type):
+        dict_value_type = getattr(goal_type, "__args__", (str, Any))[1]
+        dict_value_structurer = _compile_projected_structurer(
+            dict_value_type, projection
+        )
+
+        def structure_projected_dict(value: Any) -> Any:
+            if value is None:
+                return None
+            failures = _FAILURE_COUNT.count
+            obj = {k: dict_value_structurer(v) for k, v in value.items()}
+            if _FAILURE_COUNT.count != failures and _Failure in map(type, obj.values()):
+                return _find_failure(obj.items())
+            return obj
+
+        return structure_projected_dict
+
+    container_type = {"List": list, "Set": set, "Tuple": tuple}[
+        getattr(goal_type, "_name")
+    ]
+    item_type = getattr(goal_type, "__args__", (Any,))[0]
+    item_structurer = _compile_projected_structurer(item_type, projection)
+
+    def structure_projected_sequence(value: Any) -> Any:
+        if value is None:
+            return None
+        failures = _FAILURE_COUNT.count
+        items = [item_structurer(v) for v in value]
+        if _FAILURE_COUNT.count != failures and _Failure in map(type, items):
+            return _find_failure(enumerate(items))
+        return container_type(items)
+
+    return structure_projected_sequence
+
+
+def _get_required_fields(goal_type: Any) -> Tuple[str, ...]:
+    # The names of the fields that have to be passed to the constructor.
+    if dataclasses.is_dataclass(goal_type):
+        return tuple(
+            f.name
+            for f in dataclasses.fields(goal_type)
+            if f.init
+            and f.default is dataclasses.MISSING
+            and f.default_factory is dataclasses.MISSING  # type: ignore
+        )
+    try:
+        parameters = inspect.signature(goal_type).parameters.values()
+    except (TypeError, ValueError):
+        return ()
+    return tuple(
+        p.name
+        for p in parameters
+        if p.default is p.empty and p.kind in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY)
     )
@@ -1,15 +1,26 @@
 import decimal
 import datetime
 import enum
+import operator
 import uuid
+import weakref
 from dataclasses import fields, is_dataclass
-from typing import Any, Callable, Iterable, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+Unstructurer = Callable[[Any], Any]
+
+# The maximum number of types of values which will have their unstructurer
+# kept around. Every unstructurer is discarded once there are this many.
+UNSTRUCTURER_CACHE_SIZE = 1024
 
 
 def unstructure(value: Any) -> Any:
     """Returns dictionary, composed of simple types, given a value of a
     particular type.
 
+    Values nested too deeply to be unstructured recursively (e.g. long
+    threads of replies) are unstructured again without recursion.
+
     :param value: An object that you would like to convert into a serializable
         object.
 
@@ -21,41 +32,345 @@ def unstructure(value: Any) -> Any:
       >>> dataclass_structor.unstructure(datetime.date(2018, 9, 5))
       "2018-09-05"
     """
-    for condition, conversion in _UNSTRUCTURE_VALUE_CONDITION_CONVERSION_PAIRS:
+    unstructurer = _UNSTRUCTURERS_BY_TYPE.get(type(value))
+    if unstructurer is None:
+        unstructurer = _compile_unstructurer(value)
+    try:
+        return unstructurer(value)
+    except RecursionError as ex:
+        return _unstructure_deep(value, ex)
+
+
+def _unstructure(value: Any) -> Any:
+    # Unstructures the values held by containers and objects, without falling
+    # back to `_unstructure_deep` at every level of nesting.
+    unstructurer = _UNSTRUCTURERS_BY_TYPE.get(type(value))
+    if unstructurer is None:
+        unstructurer = _compile_unstructurer(value)
+    return unstructurer(value)
+
+
+def unstructure_many(
+    values: Iterable[Any], as_generator: bool = False
+) -> Union[List[Any], Iterator[Any]]:
+    """Returns a list of unstructured values given an iterable of values,
+    usually all of the same type.
+
+    The unstructurer is only looked up again when the type of the value
+    changes from the one before it.
+
+    :param values: An iterable of objects that you would like to convert into
+        serializable objects.
+    :param as_generator: Return a generator which unstructures each value as
+        it is consumed rather than a list.
+
+    Usage::
+
+      >>> import datetime
+      >>> import dataclass_structor
+
+      >>> dataclass_structor.unstructure_many([datetime.date(2018, 9, 5)])
+      ["2018-09-05"]
+    """
+    if as_generator:
+        return _iter_unstructure(values)
+    unstructured: List[Any] = []
+    append = unstructured.append
+    value_type: Optional[type] = None
+    unstructurer: Unstructurer = _unstructure_as_is
+    for value in values:
+        if type(value) is not value_type:  # pylint: disable=unidiomatic-typecheck
+            value_type = type(value)
+            unstructurer = _get_unstructurer(value)
+        try:
+            append(unstructurer(value))
+        except RecursionError as ex:
+            append(_unstructure_deep(value, ex))
+    return unstructured
+
+
+def _iter_unstructure(values: Iterable[Any]) -> Iterator[Any]:
+    value_type: Optional[type] = None
+    unstructurer: Unstructurer = _unstructure_as_is
+    for value in values:
+        if type(value) is not value_type:  # pylint: disable=unidiomatic-typecheck
+            value_type = type(value)
+            unstructurer = _get_unstructurer(value)
+        try:
+            obj = unstructurer(value)
+        except RecursionError as ex:
+            obj = _unstructure_deep(value, ex)
+        yield obj
+
+
+def _get_unstructurer(value: Any) -> Unstructurer:
+    unstructurer = _UNSTRUCTURERS_BY_TYPE.get(type(value))
+    if unstructurer is None:
+        unstructurer = _compile_unstructurer(value)
+    return unstructurer
+
+
+def _compile_unstructurer(value: Any) -> Unstructurer:
+    value_type = type(value)
+    hook = _get_unstructure_hook(value_type)
+    if hook is not None:
+        _cache_unstructurer(_UNSTRUCTURERS_BY_TYPE, value_type, hook)
+        return hook
+    for condition, compile_conversion in _UNSTRUCTURE_VALUE_CONDITION_CONVERSION_PAIRS:
         if condition(value):
-            return conversion(value)
+            conversion = compile_conversion(value_type)
+            _cache_unstructurer(_UNSTRUCTURERS_BY_TYPE, value_type, conversion)
+            return conversion
 
     raise ValueError(f"Could not unstructure: {value}")
 
 
-_UNSTRUCTURE_VALUE_CONDITION_CONVERSION_PAIRS: Iterable[Tuple[Callable, Callable]] = [
-    (lambda v: v is None, lambda v: v),
-    (lambda v: isinstance(v, str), lambda v: v),
-    (lambda v: isinstance(v, float), lambda v: v),
-    (lambda v: isinstance(v, int), lambda v: v),
-    (lambda v: isinstance(v, decimal.Decimal), str),  # `str` is a constructor here
-    (lambda v: isinstance(v, uuid.UUID), str),
-    (lambda v: isinstance(v, enum.Enum), lambda v: v.name),
+def register_unstructure_hook(value_type: type, hook: Unstructurer) -> None:
+    """Unstructures values of a type, and of any subclass of it, with a
+    function rather than the built-in conversions.
+
+    The hook for each type of value is looked up once, when the first value of
+    that type is unstructured, so custom types are unstructured as quickly as
+    built-in ones. Hooks registered for a subclass take precedence over hooks
+    registered for its bases.
+
+    :param value_type: The type of the values that the hook unstructures.
+    :param hook: A function called with the value, returning it unstructured.
+
+    Usage::
+
+      >>> import pathlib
+      >>> import dataclass_structor
+      >>> dataclass_structor.register_unstructure_hook(pathlib.PurePath, str)
+      >>> dataclass_structor.unstructure(pathlib.Path("/tmp"))
+      '/tmp'
+    """
+    _UNSTRUCTURE_HOOKS[value_type] = hook
+    _UNSTRUCTURERS_BY_TYPE.clear()
+    for clear_cache in _UNSTRUCTURER_CACHE_DEPENDENTS:
+        clear_cache()
+
+
+# Hooks that have been registered with `register_unstructure_hook`.
+_UNSTRUCTURE_HOOKS: Dict[type, Unstructurer] = {}
+
+# Functions which discard caches that hold on to compiled unstructurers. These
+# are called whenever an unstructure hook is registered.
+_UNSTRUCTURER_CACHE_DEPENDENTS: List[Callable[[], None]] = []
+
+
+def _get_unstructure_hook(value_type: type) -> Optional[Unstructurer]:
+    if not _UNSTRUCTURE_HOOKS:
+        return None
+    for base in value_type.__mro__:
+        hook = _UNSTRUCTURE_HOOKS.get(base)
+        if hook is not None:
+            return hook
+    return None
+
+
+# Unstructurers which have been compiled for a given type of value. Values of a
+# type which isn't in here yet are matched against the conditions below.
+_UNSTRUCTURERS_BY_TYPE: Dict[type, Unstructurer] = {}
+
+
+def _cache_unstructurer(
+    cache: Dict[type, Unstructurer], value_type: type, unstructurer: Unstructurer
+) -> None:
+    # The types are kept in a plain dict, which is much quicker to look up
+    # than a `weakref.WeakKeyDictionary`, so it's emptied when it's full to
+    # keep it from holding on to every class made at runtime.
+    if len(cache) >= UNSTRUCTURER_CACHE_SIZE:
+        cache.clear()
+    cache[value_type] = unstructurer
+
+
+def _always(conversion: Unstructurer) -> Callable[[type], Unstructurer]:
+    return lambda value_type: conversion
+
+
+def _unstructure_as_is(value: Any) -> Any:
+    return value
+
+
+def _unstructure_list(value: list) -> list:
+    return [_unstructure(i) for i in value]
+
+
+def _unstructure_tuple(value: tuple) -> tuple:
+    return tuple([_unstructure(i) for i in value])  # pylint: disable=R1728
+
+
+def _unstructure_set(value: set) -> set:
+    return set([_unstructure(i) for i in value])  # pylint: disable=R1718
+
+
+def _unstructure_dict(value: dict) -> dict:
+    return {k: _unstructure(v) for k, v in value.items()}
+
+
+def _get_dataclass_field_names(value_type: type) -> Tuple[str, ...]:
+    return tuple(f.name for f in fields(value_type))
+
+
+def _get_slot_names(value_type: type) -> Tuple[str, ...]:
+    slots = value_type.__slots__  # type: ignore
+    return (slots,) if isinstance(slots, str) else tuple(slots)
+
+
+def _compile_dataclass_unstructurer(value_type: type) -> Unstructurer:
+    return _compile_fields_unstructurer(_get_dataclass_field_names(value_type))
+
+
+def _compile_slotted_unstructurer(value_type: type) -> Unstructurer:
+    return _compile_fields_unstructurer(_get_slot_names(value_type))
+
+
+def _compile_fields_unstructurer(field_names: Tuple[str, ...]) -> Unstructurer:
+    def unstructure_fields(v: Any) -> Dict[str, Any]:
+        return {name: _unstructure(getattr(v, name)) for name in field_names}
+
+    _FIELD_NAMES_BY_UNSTRUCTURER[unstructure_fields] = field_names
+    return unstructure_fields
+
+
+# The names of the fields read by the unstructurers of dataclasses and slotted
+# classes, so that `_unstructure_deep` can read the fields itself. They're
+# kept for as long as the unstructurers are.
+_FIELD_NAMES_BY_UNSTRUCTURER: (
+    "weakref.WeakKeyDictionary[Unstructurer, Tuple[str, ...]]"
+) = weakref.WeakKeyDictionary()
+
+# The sequences built by the unstructurers of sequences.
+_SEQUENCE_TYPES_BY_UNSTRUCTURER: Dict[Unstructurer, type] = {
+    _unstructure_list: list,
+    _unstructure_tuple: tuple,
+    _unstructure_set: set,
+}
+
+
+def _unstructure_deep(value: Any, error: RecursionError) -> Any:
+    # Unstructures a value which is nested too deeply for the unstructurers of
+    # containers and objects, which recurse for each level of nesting. The
+    # containers and objects being unstructured are kept on a stack in place
+    # of the call stack, and every other value is unstructured by its
+    # unstructurer. The error is raised again when the value isn't a container
+    # or an object (e.g. a hook recursed too deeply).
+    frame = _get_deep_frame(value, _get_unstructurer(value))
+    if frame is None:
+        raise error
+    stack = [frame]
+    while True:
+        items, unstructured, keys, sequence_type = stack[-1]
+        for item in items:
+            unstructurer = _get_unstructurer(item)
+            if unstructurer is _unstructure_as_is:
+                unstructured.append(item)
+                continue
+            frame = _get_deep_frame(item, unstructurer)
+            if frame is not None:
+                stack.append(frame)
+                break
+            unstructured.append(unstructurer(item))
+        else:
+            stack.pop()
+            if keys is not None:
+                obj: Any = dict(zip(keys, unstructured))
+            elif sequence_type is list:
+                obj = unstructured
+            else:
+                obj = sequence_type(unstructured)
+            if not stack:
+                return obj
+            stack[-1][1].append(obj)
+
+
+# A container or object being unstructured by `_unstructure_deep`, made of an
+# iterator of the values it holds, the values unstructured so far, and the
+# keys of the values (for dicts and objects) or the type of sequence to build.
+_DeepFrame = Tuple[Iterator[Any], List[Any], Optional[Tuple[Any, ...]], type]
+
+
+def _get_deep_frame(value: Any, unstructurer: Unstructurer) -> Optional[_DeepFrame]:
+    sequence_type = _SEQUENCE_TYPES_BY_UNSTRUCTURER.get(unstructurer)
+    if sequence_type is not None:
+        return iter(value), [], None, sequence_type
+    if unstructurer is _unstructure_dict:
+        return iter(value.values()), [], tuple(value), dict
+    field_names = _FIELD_NAMES_BY_UNSTRUCTURER.get(unstructurer)
+    if field_names is not None:
+        return (
+            iter([getattr(value, name) for name in field_names]),
+            [],
+            field_names,
+            dict,
+        )
+    return None
+
+
+def _compile_class_unstructurer(value_type: type) -> None:
+    # Compiles the unstructurer for a dataclass or slotted class before any of
+    # its values are unstructured. Classes which subclass another type that is
+    # unstructured are left to be matched against the conditions below.
+    if value_type in _UNSTRUCTURERS_BY_TYPE:
+        return
+    hook = _get_unstructure_hook(value_type)
+    if hook is not None:
+        _cache_unstructurer(_UNSTRUCTURERS_BY_TYPE, value_type, hook)
+        return
+    if issubclass(value_type, _NON_CLASS_UNSTRUCTURE_TYPES):
+        return
+    if is_dataclass(value_type):
+        unstructurer = _compile_dataclass_unstructurer(value_type)
+    elif hasattr(value_type, "__slots__"):
+        unstructurer = _compile_slotted_unstructurer(value_type)
+    else:
+        return
+    _cache_unstructurer(_UNSTRUCTURERS_BY_TYPE, value_type, unstructurer)
+
+
+_NON_CLASS_UNSTRUCTURE_TYPES = (
+    str,
+    float,
+    int,
+    decimal.Decimal,
+    uuid.UUID,
+    enum.Enum,
+    datetime.date,
+    list,
+    tuple,
+    set,
+    dict,
+)
+
+
+# When unstructuring a value of a type that hasn't been seen before the first
+# value in each pair is used as a condition which if true will compile the
+# conversion for that type of value using the second item in the pair. The
+# condition is called with the value and the compiler is called with the type
+# of the value.
+# The order of this list of pairs denotes what order values will be
+# unstructured by.
+_UNSTRUCTURE_VALUE_CONDITION_CONVERSION_PAIRS: Iterable[
+    Tuple[Callable[[Any], bool], Callable[[type], Unstructurer]]
+] = [
+    (lambda v: v is None, _always(_unstructure_as_is)),
+    (lambda v: isinstance(v, str), _always(_unstructure_as_is)),
+    (lambda v: isinstance(v, float), _always(_unstructure_as_is)),
+    (lambda v: isinstance(v, int), _always(_unstructure_as_is)),
+    # `str` is a constructor here
+    (lambda v: isinstance(v, decimal.Decimal), _always(str)),
+    (lambda v: isinstance(v, uuid.UUID), _always(str)),
+    # `_name_` is the plain attribute behind the `name` property of members.
+    (lambda v: isinstance(v, enum.Enum), _always(operator.attrgetter("_name_"))),
     (
         lambda v: isinstance(v, (datetime.datetime, datetime.date)),
-        lambda v: v.isoformat(),
-    ),
-    (lambda v: isinstance(v, list), lambda v: [unstructure(i) for i in v]),
-    (lambda v: isinstance(v, tuple), lambda v: tuple([unstructure(i) for i in v])),
-    (
-        lambda v: isinstance(v, set),
-        lambda v: set([unstructure(i) for i in v]),  # pylint: disable=R1718
-    ),
-    (
-        lambda v: isinstance(v, dict),
-        lambda value: {k: unstructure(v) for k, v in value.items()},
-    ),
-    (
-        is_dataclass,
-        lambda v: {f.name: unstructure(getattr(v, f.name)) for f in fields(v)},
-    ),
-    (
-        lambda v: hasattr(v, "__slots__"),
-        lambda v: {f: unstructure(getattr(v, f)) for f in v.__slots__},
+        lambda value_type: value_type.isoformat,  # type: ignore
     ),
+    (lambda v: isinstance(v, list), _always(_unstructure_list)),
+    (lambda v: isinstance(v, tuple), _always(_unstructure_tuple)),
+    (lambda v: isinstance(v, set), _always(_unstructure_set)),
+    (lambda v: isinstance(v, dict), _always(_unstructure_dict)),
+    (is_dataclass, _compile_dataclass_unstructurer),
+    (lambda v: hasattr(v, "__slots__"), _compile_slotted_unstructurer),
 ]
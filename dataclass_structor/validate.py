@@ -0,0 +1,246 @@
+import functools
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar, Union
+
+from .structure import (
+    STRUCTURER_CACHE_SIZE,
+    ValidationError,
+    _ERROR_COLLECTORS,
+    _Failure,
+    _STRUCTURER_CACHE_DEPENDENTS,
+    _compile_union_members,
+    _get_required_fields,
+    _get_structure_hook,
+    _get_structurer,
+    _is_dict,
+    _is_literal,
+    _is_object_type,
+    _to_json_pointer,
+    resolve_type_hints,
+)
+
+# The errors found in a value, each made of the keys and indexes that lead to
+# the error from the value and a message, or `None` when there are none. The
+# keys are innermost first so that each container can append its own key.
+_Errors = Optional[List[Tuple[List[Any], str]]]
+
+Validator = Callable[[Any], _Errors]
+
+
+def validate(value: Any, goal_type: Any) -> List[ValidationError]:
+    """Returns the errors that structuring a value into a type would run into,
+    without building the objects. An empty list means the value can be
+    structured, so `not validate(value, goal_type)` checks a value cheaply.
+
+    Every error in the value is found rather than only the first. Values that
+    :func:`structure` would quietly replace with `None` (e.g. values which no
+    member of a `Union` can take) are errors too.
+
+    :param value: A dict or list composed of primitive type (str, int, float)
+        or a primitive type.
+    :param goal_type: A type that you would like to cast `value` into.
+
+    Usage::
+
+      >>> import dataclass_structor
+      >>> errors = dataclass_structor.validate({"first_name": "Bobby Jim", "age": 2}, Guest)
+      >>> errors[0].path, errors[0].message
+      ('/age', "Not a field of <class 'Guest'>")
+    """
+    errors = _get_validator(goal_type)(value)
+    if not errors:
+        return []
+    return [
+        ValidationError(_to_json_pointer(reversed(keys)), message)
+        for keys, message in errors
+    ]
+
+
+def _get_validator(goal_type: Any) -> Validator:
+    try:
+        hash(goal_type)
+    except TypeError:
+        return _compile_validator(goal_type)
+    return _cached_compile_validator(goal_type)
+
+
+def _compile_validator(goal_type: Any) -> Validator:
+    # Mirrors `_compile_goal_type_structurer`. Hooks and literals can only be
+    # checked by structuring the value, which is cheap for literals.
+    if _get_structure_hook(goal_type) is not None or _is_literal(goal_type):
+        return _compile_structurer_validator(goal_type)
+    if getattr(goal_type, "__origin__", None) is Union:
+        return _compile_union_validator(goal_type)
+    if goal_type is Any or isinstance(goal_type, TypeVar):
+        return _validate_any
+    return _compile_value_validator(goal_type)
+
+
+_cached_compile_validator = functools.lru_cache(maxsize=STRUCTURER_CACHE_SIZE)(
+    _compile_validator
+)
+_STRUCTURER_CACHE_DEPENDENTS.append(_cached_compile_validator.cache_clear)
+
+
+def _validate_any(_value: Any) -> _Errors:
+    return None
+
+
+def _compile_structurer_validator(goal_type: Any) -> Validator:
+    # Scalars are checked by converting them since parsing them is the only
+    # way to know whether they can be parsed.
+    structurer = _get_structurer(goal_type)
+
+    def validate_with_structurer(value: Any) -> _Errors:
+        try:
+            obj = structurer(value)
+        except (TypeError, ValueError) as ex:
+            return [([], str(ex))]
+        if obj.__class__ is _Failure:
+            return [(obj.keys, obj.message)]
+        return None
+
+    return validate_with_structurer
+
+
+def _compile_value_validator(goal_type: Any) -> Validator:
+    validate_with_structurer = _compile_structurer_validator(goal_type)
+    container_types: Tuple[type, ...] = ()
+    container_validator: Optional[Validator] = None
+    if _is_object_type(goal_type):
+        container_types = (dict,)
+        container_validator = _compile_object_validator(goal_type)
+    elif _is_dict(goal_type):
+        container_types = (dict,)
+        container_validator = _compile_dict_validator(goal_type)
+    elif getattr(goal_type, "_name", None) in ("List", "Set", "Tuple"):
+        container_types = (list, tuple, set, frozenset)
+        container_validator = _compile_sequence_validator(goal_type)
+    if container_validator is None:
+        return validate_with_structurer
+
+    def validate_value(value: Any) -> _Errors:
+        if isinstance(value, container_types):
+            return container_validator(value)  # type: ignore
+        return validate_with_structurer(value)
+
+    return validate_value
+
+
+def _add_errors(errors: _Errors, key: Any, item_errors: List) -> List:
+    # Adds the errors of an item held by a container under its key.
+    for keys, _ in item_errors:
+        keys.append(key)
+    if errors is None:
+        return item_errors
+    errors.extend(item_errors)
+    return errors
+
+
+def _validate_items(
+    keyed_items: Iterable[Tuple[Any, Any]], validator: Validator
+) -> _Errors:
+    errors: _Errors = None
+    for key, item in keyed_items:
+        item_errors = validator(item)
+        if item_errors:
+            errors = _add_errors(errors, key, item_errors)
+    return errors
+
+
+def _compile_dict_validator(goal_type: Any) -> Validator:
+    dict_value_validator = _get_validator(getattr(goal_type, "__args__", (str, Any))[1])
+    return lambda value: _validate_items(value.items(), dict_value_validator)
+
+
+def _compile_sequence_validator(goal_type: Any) -> Optional[Validator]:
+    content_types: Tuple[Any, ...] = getattr(goal_type, "__args__", (Any,))
+    if getattr(goal_type, "_name", None) != "Tuple" or (
+        len(content_types) == 2 and content_types[1] is Ellipsis
+    ):
+        item_validator = _get_validator(content_types[0])
+        return lambda value: _validate_items(enumerate(value), item_validator)
+    if not content_types:
+        return None
+
+    item_validators = tuple(_get_validator(t) for t in content_types)
+
+    def validate_tuple(value: Any) -> _Errors:
+        if isinstance(value, (set, frozenset)):
+            return [([], f"Could not structure: {value} into {goal_type}")]
+        if len(value) < len(item_validators):
+            return [([], f"Expected {len(item_validators)} items for {goal_type}")]
+        errors: _Errors = None
+        for i, item_validator in enumerate(item_validators):
+            item_errors = item_validator(value[i])
+            if item_errors:
+                errors = _add_errors(errors, i, item_errors)
+        return errors
+
+    return validate_tuple
+
+
+def _compile_object_validator(goal_type: Any) -> Validator:
+    # The field validators are resolved on first use rather than here so that
+    # types which refer to themselves (e.g. trees) can be compiled.
+    field_validators: Optional[Dict[str, Validator]] = None
+    required_fields: Tuple[str, ...] = ()
+
+    def validate_object(value: Dict[str, Any]) -> _Errors:
+        nonlocal field_validators, required_fields
+        if field_validators is None:
+            field_validators = _get_field_validators(goal_type)
+            required_fields = _get_required_fields(goal_type)
+        errors: _Errors = None
+        for key, field_value in value.items():
+            field_validator = field_validators.get(key)
+            if field_validator is None:
+                field_errors: _Errors = [([], f"Not a field of {goal_type}")]
+            else:
+                field_errors = field_validator(field_value)
+            if field_errors:
+                errors = _add_errors(errors, key, field_errors)
+        for name in required_fields:
+            if name not in value:
+                if errors is None:
+                    errors = []
+                errors.append(([name], f"Missing a required field of {goal_type}"))
+        return errors
+
+    return validate_object
+
+
+def _get_field_validators(goal_type: Any) -> Dict[str, Validator]:
+    try:
+        hints = resolve_type_hints(goal_type)
+    except TypeError:
+        return {}
+    return {k: _get_validator(v) for k, v in hints.items()}
+
+
+def _compile_union_validator(union_type: Any) -> Validator:
+    # Mirrors `_compile_union_structurer`, with the value valid when any of
+    # the members that are attempted has no errors. When only one member is
+    # attempted (e.g. the member named by a tag), its errors are returned.
+    get_member_validators = _compile_union_members(union_type, _get_validator)
+
+    def validate_union(value: Any) -> _Errors:
+        if value is None:
+            return None
+        member_validators = get_member_validators(value)
+        for member_validator in member_validators:
+            errors = member_validator(value)
+            if not errors:
+                return None
+            if len(member_validators) == 1:
+                return errors
+        return [
+            (
+                [],
+                f"Could not structure: {value} of type {type(value)} into {union_type}",
+            )
+        ]
+
+    return validate_union
+
+
+_ERROR_COLLECTORS.append(validate)
@@ -0,0 +1,198 @@
+import hashlib
+import json
+import os
+import sys
+import weakref
+from typing import Any, Iterator, List, Optional, Set, Union
+
+from .structure import (
+    _STRUCTURER_COMPILE_LISTENERS,
+    _is_literal,
+    _is_object_type,
+    get_structurer,
+    resolve_type_hints,
+)
+from .unstructure import _compile_class_unstructurer
+
+# The name of the file within the cache directory which holds the warm-up plan.
+PLAN_FILE_NAME = "dataclass_structor-plan.json"
+
+# Types registered to be compiled by `warmup`, in the order they were registered.
+_REGISTERED_TYPES: List[Any] = []
+
+# Dataclasses and other classes structured from dicts that a structurer has been
+# compiled for in this process. These are written to the warm-up plan so the next
+# process can compile them up front.
+_COMPILED_CLASSES: "weakref.WeakSet[type]" = weakref.WeakSet()
+
+
+def _record_compiled_class(goal_type: Any) -> None:
+    if (
+        _is_object_type(goal_type)
+        and goal_type.__module__ != "builtins"
+        and "<locals>" not in goal_type.__qualname__
+    ):
+        _COMPILED_CLASSES.add(goal_type)
+
+
+_STRUCTURER_COMPILE_LISTENERS.append(_record_compiled_class)
+
+
+def register(*goal_types: Any) -> Any:
+    """Registers types to have their structurers and unstructurers compiled
+    by :func:`warmup`. Returns the first type so that it can be used as a
+    class decorator.
+
+    :param goal_types: Types that values will be structured into.
+
+    Usage::
+
+      >>> import dataclass_structor
+      >>> @dataclass_structor.register
+      ... @dataclasses.dataclass
+      ... class Guest:
+      ...     first_name: str
+    """
+    for goal_type in goal_types:
+        if goal_type not in _REGISTERED_TYPES:
+            _REGISTERED_TYPES.append(goal_type)
+    return goal_types[0] if goal_types else None
+
+
+def warmup(cache_dir: Optional[Union[str, "os.PathLike[str]"]] = None) -> None:
+    """Compiles the structurers and unstructurers of the registered types and
+    of every type nested within them, and resolves their type hints, so that
+    the first values structured don't pay for it.
+
+    With a `cache_dir` the classes listed in the warm-up plan saved by an
+    earlier process are compiled as well, and the plan is then saved again.
+    Classes which have changed since the plan was saved, or whose modules
+    haven't been imported, are left out. The plan never imports modules.
+
+    :param cache_dir: A directory to load the warm-up plan from and save it to.
+
+    Usage::
+
+      >>> import dataclass_structor
+      >>> dataclass_structor.register(Invite, Guest)
+      >>> dataclass_structor.warmup("/var/cache/my_service")
+    """
+    goal_types = list(_REGISTERED_TYPES)
+    if cache_dir is not None:
+        goal_types.extend(_load_plan(cache_dir))
+
+    seen: Set[int] = set()
+    for goal_type in goal_types:
+        _warm_type(goal_type, seen)
+
+    if cache_dir is not None:
+        save_warmup_plan(cache_dir)
+
+
+def save_warmup_plan(cache_dir: Union[str, "os.PathLike[str]"]) -> None:
+    """Saves a warm-up plan listing the classes that structurers have been
+    compiled for in this process, along with a fingerprint of each of their
+    schemas, for :func:`warmup` to load in the next process.
+
+    :param cache_dir: The directory to save the plan to.
+
+    Usage::
+
+      >>> import atexit
+      >>> import dataclass_structor
+      >>> atexit.register(dataclass_structor.save_warmup_plan, "/var/cache/my_service")
+    """
+    classes = [*_REGISTERED_TYPES, *_COMPILED_CLASSES]
+    plan = []
+    seen = set()
+    for goal_type in classes:
+        if not isinstance(goal_type, type) or goal_type in seen:
+            continue
+        seen.add(goal_type)
+        plan.append(
+            {
+                "module": goal_type.__module__,
+                "qualname": goal_type.__qualname__,
+                "fingerprint": _fingerprint(goal_type),
+            }
+        )
+
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, PLAN_FILE_NAME)
+    temporary_path = f"{path}.{os.getpid()}"
+    with open(temporary_path, "w", encoding="utf-8") as plan_file:
+        json.dump(plan, plan_file, indent=1)
+    os.replace(temporary_path, path)
+
+
+def _load_plan(cache_dir: Union[str, "os.PathLike[str]"]) -> Iterator[type]:
+    plan_path = os.path.join(cache_dir, PLAN_FILE_NAME)
+    try:
+        with open(plan_path, encoding="utf-8") as plan_file:
+            plan = json.load(plan_file)
+    except (OSError, ValueError):
+        return
+    for entry in plan:
+        # Only modules which have already been imported are looked in, so that
+        # the plan file can't cause any module to be imported.
+        try:
+            goal_type: Any = sys.modules.get(entry["module"])
+            if goal_type is None:
+                continue
+            for name in entry["qualname"].split("."):
+                goal_type = getattr(goal_type, name)
+        except (AttributeError, KeyError, TypeError):
+            continue
+        if isinstance(goal_type, type) and _fingerprint(goal_type) == entry.get(
+            "fingerprint"
+        ):
+            yield goal_type
+
+
+def _fingerprint(goal_type: type) -> str:
+    # A hash of the annotations of the class, its bases and their constructors.
+    # It changes whenever a field is added, removed or has its type changed.
+    schema = []
+    for klass in goal_type.__mro__:
+        attributes = vars(klass)
+        constructor = attributes.get("__init__")
+        schema.append(
+            (
+                klass.__module__,
+                klass.__qualname__,
+                _annotations_schema(attributes.get("__annotations__")),
+                _annotations_schema(getattr(constructor, "__annotations__", None)),
+                repr(attributes.get("__slots__")),
+            )
+        )
+    return hashlib.sha256(repr(schema).encode("utf-8")).hexdigest()
+
+
+def _annotations_schema(annotations: Any) -> List[Any]:
+    if not isinstance(annotations, dict):
+        return []
+    return [
+        (name, hint if isinstance(hint, str) else repr(hint))
+        for name, hint in annotations.items()
+    ]
+
+
+def _warm_type(goal_type: Any, seen: Set[int]) -> None:
+    if id(goal_type) in seen:
+        return
+    seen.add(id(goal_type))
+
+    get_structurer(goal_type)
+    if _is_literal(goal_type):
+        return
+    for arg in getattr(goal_type, "__args__", None) or ():
+        if arg is not Ellipsis:
+            _warm_type(arg, seen)
+    if _is_object_type(goal_type):
+        _compile_class_unstructurer(goal_type)
+        try:
+            hints = resolve_type_hints(goal_type)
+        except (AttributeError, NameError, TypeError):
+            return
+        for hint in hints.values():
+            _warm_type(hint, seen)
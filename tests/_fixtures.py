@@ -35,3 +35,11 @@ class SlottedGuest:
 
     def __eq__(self, other):
         return self.first_name == other.first_name
+
+
+@dataclasses.dataclass
+class Line:
+    """A dataclass to test errors in lists of objects"""
+
+    sku: str
+    quantity: int
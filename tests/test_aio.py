@@ -0,0 +1,111 @@
+import asyncio
+import concurrent.futures
+import time
+import unittest.mock
+
+from dataclass_structor import aio, astructure_iter, structure_many
+
+from ._fixtures import DataClassGuest as Guest
+
+
+async def _values(count):
+    for i in range(count):
+        yield {"first_name": str(i)}
+
+
+async def _collect(async_iterable):
+    return [obj async for obj in async_iterable]
+
+
+def test_astructure_iter__async_iterable():
+    result = asyncio.run(_collect(astructure_iter(_values(3), Guest)))
+    assert result == [Guest("0"), Guest("1"), Guest("2")]
+
+
+def test_astructure_iter__iterable():
+    result = asyncio.run(_collect(astructure_iter(["1", "2"], int)))
+    assert result == [1, 2]
+
+
+def test_astructure_iter__yields_to_the_event_loop():
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(len(structured))
+            await asyncio.sleep(0)
+
+    structured = []
+
+    async def main():
+        task = asyncio.ensure_future(ticker())
+        async for obj in astructure_iter(_values(10), Guest, yield_every=2):
+            structured.append(obj)
+        task.cancel()
+
+    asyncio.run(main())
+    assert len(structured) == 10
+    assert len(ticks) >= 5
+
+
+def test_astructure_iter__executor():
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        result = asyncio.run(
+            _collect(astructure_iter(_values(5), Guest, executor=executor, chunksize=2))
+        )
+    assert result == [Guest(str(i)) for i in range(5)]
+
+
+def test_astructure_iter__executor_flushes_partial_chunks():
+    sent = []
+
+    async def slow_values():
+        for i in range(5):
+            sent.append(i)
+            yield str(i)
+            await asyncio.sleep(0.05)
+
+    async def first(async_iterable):
+        async for obj in async_iterable:
+            return obj, len(sent)
+        return None
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        obj, sent_count = asyncio.run(
+            first(
+                astructure_iter(
+                    slow_values(), int, executor=executor, yield_interval=0.01
+                )
+            )
+        )
+    # The first value is structured without waiting for the chunk of 1000 to
+    # fill up.
+    assert obj == 0
+    assert sent_count < 5
+
+
+def test_astructure_iter__executor_receives_while_structuring():
+    received = []
+
+    async def values():
+        for i in range(4):
+            received.append(i)
+            yield str(i)
+
+    def slow_structure_many(values, goal_type):
+        time.sleep(0.05)
+        return structure_many(values, goal_type)
+
+    async def first(async_iterable):
+        async for obj in async_iterable:
+            return obj, len(received)
+        return None
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        with unittest.mock.patch.object(aio, "structure_many", slow_structure_many):
+            obj, received_count = asyncio.run(
+                first(astructure_iter(values(), int, executor=executor, chunksize=2))
+            )
+    # The second chunk was received while the first was structured.
+    assert obj == 0
+    assert received_count == 4
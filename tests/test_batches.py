@@ -0,0 +1,65 @@
+import types
+import typing
+
+from dataclass_structor import structure_many, unstructure_many
+
+from ._fixtures import DataClassGuest as Guest, SoundsEnum
+
+
+def test_structure_many__dataclasses():
+    values = [{"first_name": "Bobby Jim"}, {"first_name": None}, {}]
+    expected = [Guest("Bobby Jim"), Guest(None), Guest()]
+    assert structure_many(values, Guest) == expected
+
+
+def test_structure_many__as_generator():
+    result = structure_many(iter(["1", 2]), typing.Optional[int], as_generator=True)
+    assert isinstance(result, types.GeneratorType)
+    assert list(result) == [1, 2]
+
+
+def test_unstructure_many__dataclasses():
+    values = [Guest("Bobby Jim"), Guest(None)]
+    expected = [{"first_name": "Bobby Jim"}, {"first_name": None}]
+    assert unstructure_many(values) == expected
+
+
+def test_unstructure_many__mixed_types():
+    values = [Guest("Bobby Jim"), SoundsEnum.CAT, None, Guest()]
+    expected = [{"first_name": "Bobby Jim"}, "CAT", None, {"first_name": None}]
+    assert unstructure_many(values) == expected
+
+
+def test_unstructure_many__as_generator():
+    result = unstructure_many(iter([SoundsEnum.DOG]), as_generator=True)
+    assert isinstance(result, types.GeneratorType)
+    assert list(result) == ["DOG"]
+
+
+def test_structure_many__workers():
+    values = [{"first_name": str(i)} for i in range(25)]
+    expected = [Guest(str(i)) for i in range(25)]
+    assert structure_many(values, Guest, workers=2, chunksize=4) == expected
+
+
+def test_structure_many__workers_as_generator():
+    result = structure_many(
+        iter(["1", "2", "3"]), int, as_generator=True, workers=2, chunksize=2
+    )
+    assert list(result) == [1, 2, 3]
+
+
+def test_structure_many__workers_read_values_as_needed():
+    taken = []
+
+    def values():
+        for i in range(1000):
+            taken.append(i)
+            yield str(i)
+
+    result = structure_many(values(), int, as_generator=True, workers=2, chunksize=2)
+    assert next(result) == 0
+    # Two chunks per process are sent ahead, and one more once the first is
+    # taken.
+    assert len(taken) == 10
+    assert list(result) == list(range(1, 1000))
@@ -0,0 +1,88 @@
+import array
+import dataclasses
+import datetime
+import typing
+
+import pytest  # pylint: disable=import-error
+
+from dataclass_structor import structure_columns, unstructure_columns
+
+from ._fixtures import AnimalEnum, SlottedGuest
+
+
+@dataclasses.dataclass
+class Reading:
+    sensor: str
+    count: int
+    value: float
+    taken: datetime.date
+    note: typing.Optional[int] = None
+
+
+READINGS = [
+    Reading("a", 1, 2.5, datetime.date(2018, 8, 28)),
+    Reading("b", 2, 3.5, datetime.date(2018, 8, 29), note=1),
+]
+
+
+def test_unstructure_columns__dataclasses():
+    columns = unstructure_columns(READINGS)
+    assert columns == {
+        "sensor": ["a", "b"],
+        "count": array.array("q", [1, 2]),
+        "value": array.array("d", [2.5, 3.5]),
+        "taken": ["2018-08-28", "2018-08-29"],
+        "note": [None, 1],
+    }
+
+
+def test_unstructure_columns__values_that_dont_fit_an_array():
+    readings = [Reading("a", 2**70, 1.0, datetime.date(2018, 8, 28))]
+    assert unstructure_columns(readings)["count"] == [2**70]
+
+
+def test_unstructure_columns__slotted_classes():
+    columns = unstructure_columns([SlottedGuest("Bobby Jim"), SlottedGuest()])
+    assert columns == {"first_name": ["Bobby Jim", None]}
+
+
+def test_unstructure_columns__empty():
+    assert not unstructure_columns([])
+
+
+def test_structure_columns__round_trip():
+    assert structure_columns(unstructure_columns(READINGS), Reading) == READINGS
+
+
+@dataclasses.dataclass
+class Sighting:
+    animal: AnimalEnum
+    count: float
+
+
+def test_structure_columns__arrays_are_structured():
+    columns = {"animal": array.array("q", [1, 2]), "count": array.array("q", [3, 4])}
+    assert structure_columns(columns, Sighting) == [
+        Sighting(AnimalEnum.ANT, 3),
+        Sighting(AnimalEnum.BEE, 4),
+    ]
+    with pytest.raises(ValueError):
+        structure_columns({"animal": array.array("q", [9])}, Sighting)
+
+
+def test_structure_columns__different_lengths():
+    with pytest.raises(ValueError):
+        structure_columns({"sensor": ["a"], "count": []}, Reading)
+
+
+def test_structure_columns__unknown_column():
+    with pytest.raises(ValueError):
+        structure_columns({"colour": ["red"]}, Reading)
+
+
+def test_columns__numpy():
+    numpy = pytest.importorskip("numpy")
+    columns = unstructure_columns(READINGS, use_numpy=True)
+    assert isinstance(columns["count"], numpy.ndarray)
+    assert columns["count"].tolist() == [1, 2]
+    assert structure_columns(columns, Reading) == READINGS
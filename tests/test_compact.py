@@ -0,0 +1,91 @@
+import dataclasses
+import gc
+import typing
+import weakref
+
+import pytest
+
+from dataclass_structor import compact_type, structure, unstructure, unstructure_json
+
+from ._fixtures import DataClassGuest
+
+
+@dataclasses.dataclass
+class CompactInvite:
+    guests: typing.List[DataClassGuest]
+    host: typing.Optional[DataClassGuest] = None
+    seats: int = 2
+
+    def guest_count(self):
+        return len(self.guests)
+
+
+@dataclasses.dataclass(frozen=True)
+class Node:
+    name: str
+    children: typing.Tuple["Node", ...] = ()
+
+
+def test_compact_type__structure_and_unstructure():
+    compact = compact_type(CompactInvite)
+    value = {"guests": [{"first_name": "Bobby Jim"}], "host": {"first_name": "Jo"}}
+    invite = structure(value, compact)
+
+    assert invite.__class__ is compact
+    assert invite.__class__.__name__ == "CompactInvite"
+    assert not hasattr(invite, "__dict__")
+    assert not hasattr(invite.guests[0], "__dict__")
+    assert not hasattr(invite.host, "__dict__")
+    assert invite.seats == 2
+    assert invite.guest_count() == 1
+    assert unstructure(invite) == {**value, "seats": 2}
+    assert unstructure(invite) == unstructure(structure(value, CompactInvite))
+
+
+def test_compact_type__json():
+    invite = structure({"guests": []}, compact_type(CompactInvite))
+    assert unstructure_json(invite) == '{"guests": [], "host": null, "seats": 2}'
+
+
+def test_compact_type__is_cached():
+    assert compact_type(CompactInvite) is compact_type(CompactInvite)
+
+
+def test_compact_type__recursive_frozen():
+    compact = compact_type(Node)
+    node = structure({"name": "a", "children": [{"name": "b"}]}, compact)
+
+    assert node.children[0].__class__ is compact
+    assert node == compact("a", (compact("b"),))
+    assert hash(node) == hash(compact("a", (compact("b"),)))
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        node.name = "c"
+
+
+def test_compact_type__not_a_dataclass():
+    with pytest.raises(ValueError):
+        compact_type(int)
+
+
+def _slotted_dataclass():
+    @dataclasses.dataclass
+    class Slotted:
+        __slots__ = ("name",)
+        name: str
+
+    return Slotted
+
+
+def test_compact_type__dataclasses_can_be_collected():
+    for make_dataclass in (
+        lambda: dataclasses.make_dataclass("Dynamic", [("name", str)]),
+        lambda: dataclasses.make_dataclass("Frozen", [("name", str)], frozen=True),
+        _slotted_dataclass,
+    ):
+        dataclass = make_dataclass()
+        compact = compact_type(dataclass)
+        assert compact("a").name == "a"
+        dataclass_ref = weakref.ref(dataclass)
+        del dataclass, compact
+        gc.collect()
+        assert dataclass_ref() is None
@@ -0,0 +1,125 @@
+import dataclasses
+import datetime
+import decimal
+import typing
+
+from dataclass_structor import Deduplicator, structure, structure_many
+
+
+@dataclasses.dataclass(frozen=True)
+class Country:
+    code: str
+    name: str
+
+
+@dataclasses.dataclass
+class Shipment:
+    status: str
+    note: str
+    country: Country
+    tags: typing.Tuple[str, ...]
+
+
+def _values():
+    return [
+        {
+            "status": "".join(["SHIP", "PED"]),
+            "note": "".join(["fra", "gile"]),
+            "country": {"code": "CA", "name": "Canada"},
+            "tags": ["a", "b"],
+        }
+        for _ in range(3)
+    ]
+
+
+def test_dedup__shares_frozen_objects_and_interns_strings():
+    first, second, third = structure_many(_values(), Shipment, dedup=True)
+    assert first == second == third
+    assert first.country is second.country is third.country
+    assert first.tags is second.tags
+    assert first.status is second.status
+    assert first.note is second.note
+
+
+def test_dedup__selected_fields():
+    dedup = Deduplicator(intern_fields={"status"})
+    first, second, _ = structure_many(_values(), Shipment, dedup=dedup)
+    assert first.status is second.status
+    assert first.note is not second.note
+
+
+def test_dedup__across_calls():
+    dedup = Deduplicator()
+    first = structure(_values()[0], Shipment, dedup=dedup)
+    second = structure(_values()[0], Shipment, dedup=dedup)
+    assert first.country is second.country
+
+
+def test_dedup__generator():
+    objs = list(structure_many(_values(), Shipment, as_generator=True, dedup=True))
+    assert objs[0].country is objs[2].country
+
+
+def test_dedup__off_by_default():
+    first, second, _ = structure_many(_values(), Shipment)
+    assert first.country is not second.country
+    assert first.status is not second.status
+
+
+def test_dedup__unhashable_values():
+    goal_type = typing.List[typing.List[typing.List[str]]]
+    assert structure([[["x"]]], goal_type, dedup=True) == [[["x"]]]
+
+
+@dataclasses.dataclass(frozen=True)
+class Price:
+    amount: typing.Any
+
+
+def test_dedup__only_shares_values_of_the_same_type_and_value():
+    amounts = [
+        decimal.Decimal("1.00"),
+        decimal.Decimal("1.0"),
+        True,
+        1,
+        1.0,
+        -0.0,
+        0.0,
+        datetime.datetime(
+            2020, 1, 1, 1, tzinfo=datetime.timezone(datetime.timedelta(hours=1))
+        ),
+        datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc),
+    ]
+    prices = Deduplicator()([Price(amount) for amount in amounts])
+    for price, amount in zip(prices, amounts):
+        assert type(price.amount) is type(amount)
+        assert repr(price.amount) == repr(amount)
+    tuples = Deduplicator()([(1.0,), (1,), (True,), (1,)])
+    assert [repr(t[0]) for t in tuples] == ["1.0", "1", "True", "1"]
+    assert tuples[1] is tuples[3]
+
+
+def test_dedup__shares_nested_frozen_objects():
+    first, second = Deduplicator()([Price((Price(1), "a")), Price((Price(1), "a"))])
+    assert first is second
+    first, second = Deduplicator()([Price((Price([1]), "a")), Price((Price([1]), "a"))])
+    assert first is not second
+
+
+@dataclasses.dataclass
+class Reply:
+    text: str
+    replies: typing.List["Reply"]
+
+
+def test_dedup__deeply_nested_values():
+    value = {"text": "leaf", "replies": []}
+    for _ in range(10_000):
+        value = {"text": "".join(["re", "ply"]), "replies": [value]}
+    reply, other = structure_many(
+        [value, {"text": "reply", "replies": []}], Reply, dedup=True
+    )
+    assert reply.text is other.text
+    for _ in range(10_000):
+        reply = reply.replies[0]
+    assert reply.text == "leaf"
@@ -0,0 +1,107 @@
+import dataclasses
+import typing
+
+import pytest
+
+from dataclass_structor import (
+    ValidationError,
+    get_structurer,
+    structure,
+    structure_many,
+    unstructure,
+    unstructure_many,
+)
+
+DEPTH = 10_000
+
+
+@dataclasses.dataclass
+class Comment:
+    text: str
+    replies: typing.List["Comment"]
+    votes: typing.Dict[str, "Comment"] = dataclasses.field(default_factory=dict)
+
+
+@dataclasses.dataclass
+class Manager:
+    name: str
+    boss: typing.Optional["Manager"] = None
+    cover: typing.Tuple[int, typing.Optional["Manager"]] = (0, None)
+
+
+def _thread(depth):
+    value = {"text": "leaf", "replies": []}
+    for i in range(depth):
+        value = {"text": str(i), "replies": [value], "votes": {}}
+    return value
+
+
+def _chain(depth):
+    value = None
+    for i in range(depth):
+        value = (
+            {"name": str(i), "cover": [i, value]}
+            if i % 2
+            else {"name": str(i), "boss": value}
+        )
+    return value
+
+
+def _thread_depth(comment):
+    depth = 0
+    while comment.replies:
+        comment = comment.replies[0]
+        depth += 1
+    assert comment.text == "leaf"
+    return depth
+
+
+def test_deep_nesting__structure():
+    assert _thread_depth(structure(_thread(DEPTH), Comment)) == DEPTH
+    manager = structure(_chain(DEPTH), Manager)
+    depth = 1
+    while manager.boss or manager.cover[1]:
+        manager = manager.boss or manager.cover[1]
+        depth += 1
+    assert depth == DEPTH
+    assert manager.name == "0"
+
+
+def test_deep_nesting__structure_many_and_get_structurer():
+    comments = structure_many([_thread(3), _thread(DEPTH)], Comment)
+    assert [_thread_depth(c) for c in comments] == [3, DEPTH]
+    assert _thread_depth(get_structurer(Comment)(_thread(DEPTH))) == DEPTH
+
+
+def test_deep_nesting__errors():
+    value = _thread(DEPTH)
+    value["replies"][0]["votes"]["up"] = {"text": "a", "replies": [], "colour": "red"}
+    with pytest.raises(ValidationError) as exinfo:
+        structure(value, Comment)
+    assert exinfo.value.path == "/replies/0/votes/up/colour"
+
+    value = _thread(DEPTH)
+    reply = value
+    for _ in range(DEPTH):
+        reply = reply["replies"][0]
+    reply["replies"] = 5
+    with pytest.raises(TypeError):
+        structure(value, Comment)
+
+
+def test_deep_nesting__unstructure():
+    value = _thread(DEPTH)
+    unstructured = unstructure(structure(value, Comment))
+    for _ in range(DEPTH):
+        assert unstructured.keys() == value.keys()
+        unstructured = unstructured["replies"][0]
+    assert unstructured == {"text": "leaf", "replies": [], "votes": {}}
+
+    nested: typing.Any = "leaf"
+    for i in range(DEPTH):
+        nested = [({"a": nested}, {i})]
+    for unstructured in unstructure_many([nested, nested]):
+        for i in reversed(range(DEPTH)):
+            assert unstructured[0][1] == {i}
+            unstructured = unstructured[0][0]["a"]
+        assert unstructured == "leaf"
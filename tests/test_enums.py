@@ -1,4 +1,14 @@
-from dataclass_structor import structure, unstructure
+import enum
+
+import pytest
+
+from dataclass_structor import (
+    register_case_insensitive_enum,
+    structure,
+    structure_many,
+    unstructure,
+)
+from dataclass_structor.structure import _CASE_INSENSITIVE_ENUMS, clear_structurer_cache
 from ._fixtures import AnimalEnum as Animal, SoundsEnum as Sounds
 
 
@@ -16,3 +26,63 @@ def test_unstructure__sounds():
 
 def test_structure__sounds():
     assert structure("DOG", Sounds) == Sounds.DOG
+
+
+def test_structure__sounds_by_value():
+    assert structure("meow", Sounds) == Sounds.CAT
+
+
+def test_structure__animal_by_int_value():
+    assert structure(2, Animal) == Animal.BEE
+    assert structure_many([1, "CAT", 4.0], Animal) == [
+        Animal.ANT,
+        Animal.CAT,
+        Animal.DOG,
+    ]
+    with pytest.raises(ValueError):
+        structure(2.5, Animal)
+
+
+class Answer(enum.Enum):
+    YES = True
+    NO = False
+
+
+def test_structure__bools_only_structure_into_bool_values():
+    with pytest.raises(ValueError):
+        structure(True, Animal)
+    assert structure(True, Answer) == Answer.YES
+    assert structure("NO", Answer) == Answer.NO
+    with pytest.raises(ValueError):
+        structure(1, Answer)
+
+
+def test_structure__bad_int__int_enum():
+    with pytest.raises(ValueError) as ex:
+        structure(5, Animal)
+    assert str(ex.value) == (
+        "Could not convert 5 of type <class 'int'> into a <enum 'AnimalEnum'> enum."
+    )
+
+
+class Precedence(enum.Enum):
+    """An enum where the name of one member is the value of another"""
+
+    ONE = "TWO"
+    TWO = "ONE"
+
+
+def test_structure__names_before_values():
+    assert structure("ONE", Precedence) == Precedence.ONE
+
+
+def test_structure__case_insensitive():
+    with pytest.raises(ValueError):
+        structure("Meow", Sounds)
+    register_case_insensitive_enum(Sounds)
+    try:
+        assert structure("Meow", Sounds) == Sounds.CAT
+        assert structure("dOg", Sounds) == Sounds.DOG
+    finally:
+        _CASE_INSENSITIVE_ENUMS.clear()
+        clear_structurer_cache()
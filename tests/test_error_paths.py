@@ -0,0 +1,120 @@
+import dataclasses
+import pickle
+import typing
+
+import pytest
+
+from dataclass_structor import (
+    StructureErrors,
+    ValidationError,
+    register_structure_hook,
+    structure,
+    structure_many,
+)
+from dataclass_structor.structure import _STRUCTURE_HOOKS, clear_structurer_cache
+
+from ._fixtures import Line
+
+
+@dataclasses.dataclass
+class Order:
+    lines: typing.List[Line]
+    notes: typing.Dict[str, typing.Set[int]] = dataclasses.field(default_factory=dict)
+    code: typing.Union[int, Line, None] = None
+
+
+def test_error_paths__first_error():
+    value = {"lines": [{"sku": "a", "quantity": 1}, {"sku": "b", "quantity": "many"}]}
+    with pytest.raises(ValidationError) as exinfo:
+        structure(value, Order)
+    assert exinfo.value.path == "/lines/1/quantity"
+    assert exinfo.value.message == (
+        "Could not convert many of type <class 'str'> into a <class 'int'>."
+    )
+    assert str(exinfo.value) == f"/lines/1/quantity: {exinfo.value.message}"
+    assert isinstance(exinfo.value.__cause__, ValueError)
+
+
+def test_error_paths__containers_and_unknown_fields():
+    with pytest.raises(ValidationError) as exinfo:
+        structure({"lines": [], "notes": {"a/b": ["x"]}}, Order)
+    assert exinfo.value.path == "/notes/a~1b/0"
+
+    with pytest.raises(ValidationError) as exinfo:
+        structure({"lines": [{"sku": "a", "colour": "red"}]}, Order)
+    assert exinfo.value.path == "/lines/0/colour"
+    assert exinfo.value.message == f"Not a field of {Line}"
+
+
+def test_error_paths__union_members_that_fail():
+    assert structure({"sku": "a", "quantity": 1}, Order.__annotations__["code"]) == (
+        Line("a", 1)
+    )
+    order = structure({"lines": [], "code": {"sku": "a", "quantity": "x"}}, Order)
+    assert order.code is None
+
+
+def test_error_paths__structure_many():
+    values = [{"lines": []}, {"lines": [{"sku": "a", "quantity": "x"}]}]
+    for kwargs in [
+        {},
+        {"as_generator": True},
+        {"dedup": True},
+        {"workers": 2, "chunksize": 1},
+    ]:
+        with pytest.raises(ValidationError) as exinfo:
+            list(structure_many(values, Order, **kwargs))
+        assert exinfo.value.path == "/1/lines/0/quantity"
+
+
+def test_error_paths__collect_errors():
+    value = {
+        "lines": [{"sku": "a", "quantity": "x"}, {"quantity": 1, "colour": "red"}],
+        "notes": {"a": ["y"]},
+    }
+    with pytest.raises(StructureErrors) as exinfo:
+        structure(value, Order, collect_errors=True)
+    assert [error.path for error in exinfo.value.errors] == [
+        "/lines/0/quantity",
+        "/lines/1/colour",
+        "/lines/1/sku",
+        "/notes/a/0",
+    ]
+    assert str(exinfo.value).startswith("/lines/0/quantity: Could not convert x")
+
+    assert structure({"lines": []}, Order, collect_errors=True) == Order([])
+    with pytest.raises(ValueError):
+        structure(value, Order, collect_errors=True, fields={"lines"})
+
+
+def test_error_paths__hook_errors():
+    def structure_sku(value, goal_type):
+        raise ValueError(f"Bad sku {value}")
+
+    register_structure_hook(Line, structure_sku)
+    try:
+        with pytest.raises(ValidationError) as exinfo:
+            structure({"lines": ["b"]}, Order)
+        assert exinfo.value.path == "/lines/0"
+        assert exinfo.value.message == "Bad sku b"
+    finally:
+        _STRUCTURE_HOOKS.clear()
+        clear_structurer_cache()
+
+
+def test_error_paths__errors_pickle():
+    error = pickle.loads(pickle.dumps(ValidationError("/a", "Bad")))
+    assert (error.path, error.message) == ("/a", "Bad")
+    errors = pickle.loads(pickle.dumps(StructureErrors([error])))
+    assert str(errors) == "/a: Bad"
+
+
+def test_error_paths__collect_errors_of_missing_fields():
+    value = {"lines": [{"quantity": 1}, {"sku": "a", "quantity": "x"}]}
+    with pytest.raises(StructureErrors) as exinfo:
+        structure(value, Order, collect_errors=True)
+    assert [error.path for error in exinfo.value.errors] == [
+        "/lines/0/sku",
+        "/lines/1/quantity",
+    ]
+    assert exinfo.value.errors[0].message == f"Missing a required field of {Line}"
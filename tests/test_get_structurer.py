@@ -0,0 +1,65 @@
+import dataclasses
+import datetime
+import typing
+
+from dataclass_structor import get_structurer, structure
+from dataclass_structor.structure import clear_structurer_cache
+
+from ._fixtures import DataClassGuest as Guest
+
+
+@dataclasses.dataclass
+class Comment:
+    text: str
+    replies: typing.List["Comment"]
+
+
+def test_get_structurer__is_cached():
+    assert get_structurer(Guest) is get_structurer(Guest)
+    assert get_structurer(typing.List[Guest]) is get_structurer(typing.List[Guest])
+
+
+def test_get_structurer__cache_can_be_cleared():
+    structurer = get_structurer(Guest)
+    clear_structurer_cache()
+    assert get_structurer(Guest) is not structurer
+
+
+def test_get_structurer__primative():
+    structure_date = get_structurer(datetime.date)
+    assert structure_date("2018-08-28") == datetime.date(2018, 8, 28)
+    assert structure_date(None) is None
+
+
+def test_get_structurer__dataclass():
+    structure_guest = get_structurer(Guest)
+    assert structure_guest({"first_name": "Bobby Jim"}) == Guest("Bobby Jim")
+
+
+def test_get_structurer__list_of_dataclasses():
+    structure_guests = get_structurer(typing.List[Guest])
+    assert structure_guests([{"first_name": "Bobby Jim"}, {}]) == [
+        Guest("Bobby Jim"),
+        Guest(),
+    ]
+
+
+def test_get_structurer__recursive_dataclass():
+    value = {"text": "Hello", "replies": [{"text": "Hi", "replies": []}]}
+    expected = Comment(text="Hello", replies=[Comment(text="Hi", replies=[])])
+    assert get_structurer(Comment)(value) == expected
+
+
+def test_structure__optional_dataclass():
+    assert structure({"first_name": "Bobby Jim"}, typing.Optional[Guest]) == Guest(
+        "Bobby Jim"
+    )
+    assert structure(None, typing.Optional[Guest]) is None
+
+
+def test_structure__dict():
+    assert structure({"a": "1", "b": 2}, typing.Dict[str, int]) == {"a": 1, "b": 2}
+
+
+def test_structure__variadic_tuple():
+    assert structure(["1", 2, 3], typing.Tuple[int, ...]) == (1, 2, 3)
@@ -0,0 +1,126 @@
+import dataclasses
+import ipaddress
+import json
+import pathlib
+import typing
+
+import pytest
+
+from dataclass_structor import (
+    register_structure_hook,
+    register_unstructure_hook,
+    structure,
+    structure_json,
+    structure_lazy,
+    unstructure,
+    unstructure_json,
+)
+from dataclass_structor.structure import _STRUCTURE_HOOKS, clear_structurer_cache
+from dataclass_structor.unstructure import (
+    _UNSTRUCTURE_HOOKS,
+    _UNSTRUCTURER_CACHE_DEPENDENTS,
+    _UNSTRUCTURERS_BY_TYPE,
+)
+
+
+class Money:
+    def __init__(self, cents: int):
+        self.cents = cents
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.cents == other.cents
+
+
+class Dollars(Money):
+    pass
+
+
+@dataclasses.dataclass
+class Server:
+    address: ipaddress.IPv4Address
+    root: pathlib.Path
+    price: typing.Optional[Dollars] = None
+
+
+def _structure_money(value, goal_type):
+    if not isinstance(value, str) or not value.startswith("$"):
+        raise ValueError(f"Could not structure {value} into {goal_type}")
+    return goal_type(round(float(value[1:]) * 100))
+
+
+@pytest.fixture(autouse=True)
+def hooks():
+    register_structure_hook(ipaddress.IPv4Address, lambda v, gt: gt(v))
+    register_structure_hook(pathlib.PurePath, lambda v, gt: gt(v))
+    register_structure_hook(Money, _structure_money)
+    register_unstructure_hook(ipaddress.IPv4Address, str)
+    register_unstructure_hook(pathlib.PurePath, str)
+    register_unstructure_hook(Money, lambda v: f"${v.cents / 100:.2f}")
+    yield
+    _STRUCTURE_HOOKS.clear()
+    _UNSTRUCTURE_HOOKS.clear()
+    _UNSTRUCTURERS_BY_TYPE.clear()
+    for clear_cache in _UNSTRUCTURER_CACHE_DEPENDENTS:
+        clear_cache()
+    clear_structurer_cache()
+
+
+def test_hooks__structure_and_unstructure():
+    value = {"address": "127.0.0.1", "root": "/srv", "price": "$1.50"}
+    expected = Server(
+        ipaddress.IPv4Address("127.0.0.1"), pathlib.Path("/srv"), Dollars(150)
+    )
+    assert structure(value, Server) == expected
+    assert unstructure(expected) == value
+
+
+def test_hooks__subclasses_use_the_hook_of_their_base():
+    assert structure("/srv", pathlib.PosixPath) == pathlib.PosixPath("/srv")
+    assert unstructure(pathlib.PurePosixPath("/srv")) == "/srv"
+
+
+def test_hooks__subclass_hook_takes_precedence():
+    register_unstructure_hook(Dollars, lambda v: v.cents)
+    assert unstructure(Dollars(150)) == 150
+    assert unstructure(Money(150)) == "$1.50"
+
+
+def test_hooks__union_members():
+    union = typing.Union[int, Dollars]
+    assert structure("$2.00", union) == Dollars(200)
+    assert structure(2, union) == 2
+
+
+def test_hooks__errors():
+    with pytest.raises(ValueError):
+        structure("2.00", Dollars)
+
+
+def test_hooks__json():
+    server = Server(ipaddress.IPv4Address("10.0.0.1"), pathlib.Path("/srv"))
+    text = unstructure_json(server)
+    assert text == '{"address": "10.0.0.1", "root": "/srv", "price": null}'
+    assert structure_json(text, Server) == server
+
+
+def test_hooks__json_subclasses_of_natives():
+    class Secret(str):
+        pass
+
+    class Tags(list):
+        pass
+
+    register_unstructure_hook(Secret, lambda v: "*" * len(v))
+    register_unstructure_hook(Tags, sorted)
+    value = {"password": Secret("hunter2"), "tags": Tags(["b", "a"]), "n": 1}
+    assert unstructure_json(value) == (
+        '{"password": "*******", "tags": ["a", "b"], "n": 1}'
+    )
+    assert json.loads(unstructure_json(value)) == unstructure(value)
+
+
+def test_hooks__override_built_in_dataclasses():
+    register_structure_hook(Server, lambda v, gt: "hooked")
+    assert structure({}, Server) == "hooked"
+    assert structure_lazy({}, Server) == "hooked"
+    assert structure_json("{}", Server) == "hooked"
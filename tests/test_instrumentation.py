@@ -0,0 +1,97 @@
+import dataclasses
+import typing
+
+import pytest
+
+from dataclass_structor import (
+    add_stats_callback,
+    disable_stats,
+    enable_stats,
+    get_structurer,
+    remove_stats_callback,
+    reset_stats,
+    stats,
+    structure,
+)
+from dataclass_structor.structure import _STRUCTURER_WRAPPERS
+
+from ._fixtures import DataClassGuest
+
+
+@dataclasses.dataclass
+class StatsInvite:
+    guests: typing.List[DataClassGuest]
+    code: typing.Union[int, DataClassGuest]
+
+
+def test_stats__counts_calls_time_and_failures():
+    enable_stats()
+    reset_stats()
+    try:
+        structure({"guests": [{"first_name": "Bobby Jim"}], "code": 5}, StatsInvite)
+        with pytest.raises(ValueError):
+            structure({"guests": [], "code": 5, "extra": 1}, StatsInvite)
+    finally:
+        disable_stats()
+
+    type_stats = stats()["types"]
+    assert type_stats[StatsInvite].calls == 2
+    assert type_stats[StatsInvite].failures == 1
+    assert type_stats[StatsInvite].time > 0
+    assert type_stats[DataClassGuest].calls == 1
+    assert type_stats[typing.Union[int, DataClassGuest]].union_attempts == 2
+    assert type_stats[int].union_attempts == 0
+
+
+def test_stats__counts_union_attempts():
+    union = typing.Union[int, float, str]
+    enable_stats()
+    reset_stats()
+    try:
+        structure("Potato", union)
+    finally:
+        disable_stats()
+
+    # Strings can be converted to floats and ints, so those are attempted first.
+    assert stats()["types"][union].union_attempts == 3
+    assert stats()["types"][float].failures == 1
+
+
+def test_stats__callbacks():
+    calls = []
+
+    def callback(goal_type, _elapsed, failed):
+        calls.append((goal_type, failed))
+
+    add_stats_callback(callback)
+    enable_stats()
+    try:
+        structure(1, int)
+        try:
+            structure("x", int)
+        except ValueError:
+            pass
+    finally:
+        disable_stats()
+        remove_stats_callback(callback)
+
+    assert calls == [(int, False), (int, True)]
+
+
+def test_stats__disabled_structurers_are_not_wrapped():
+    enable_stats()
+    instrumented = get_structurer(int)
+    disable_stats()
+
+    assert not _STRUCTURER_WRAPPERS
+    assert get_structurer(int) is not instrumented
+    reset_stats()
+    structure(1, int)
+    assert int not in stats()["types"]
+
+
+def test_stats__cache_hit_rates():
+    get_structurer(int)
+    cache_stats = stats()["caches"]["structurers"]
+    assert cache_stats["hits"] >= 1
+    assert 0 < cache_stats["hit_rate"] <= 1
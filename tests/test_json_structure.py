@@ -0,0 +1,107 @@
+import dataclasses
+import datetime
+import json
+import typing
+
+import pytest  # pylint: disable=import-error
+
+from dataclass_structor import ValidationError, structure, structure_json
+
+from ._fixtures import DataClassGuest as Guest, SlottedGuest, SoundsEnum
+
+
+@dataclasses.dataclass
+class Invite:
+    email: str
+    sent: datetime.date
+    guests: typing.List[Guest]
+    sounds: typing.Dict[str, SoundsEnum]
+    plus_one: typing.Optional[Guest] = None
+
+
+@dataclasses.dataclass
+class Comment:
+    text: str
+    replies: typing.List["Comment"]
+    parent: typing.Optional["Comment"] = None
+
+
+INVITE_JSON = """
+{
+  "email": "billy@joel.example.com",
+  "sent": "2018-08-28",
+  "guests": [{"first_name": "Bobby Jim"}, {"first_name": null}],
+  "sounds": {"cat": "CAT"},
+  "plus_one": null
+}
+"""
+
+
+def test_structure_json__primative():
+    assert structure_json('"2018-08-28"', datetime.date) == datetime.date(2018, 8, 28)
+    assert structure_json(b" 1 ", int) == 1
+    assert structure_json("null", typing.Optional[int]) is None
+
+
+def test_structure_json__nested():
+    expected = structure(json.loads(INVITE_JSON), Invite)
+    assert structure_json(INVITE_JSON, Invite) == expected
+    assert structure_json(INVITE_JSON.encode("utf-16"), Invite) == expected
+
+
+def test_structure_json__scalar_collections():
+    assert structure_json("[1, 2]", typing.List[int]) == [1, 2]
+    assert structure_json('["1", "2"]', typing.Tuple[int, ...]) == (1, 2)
+    assert structure_json('{"cat": "CAT"}', typing.Dict[str, SoundsEnum]) == {
+        "cat": SoundsEnum.CAT
+    }
+    with pytest.raises(ValidationError) as exinfo:
+        structure_json('{"timestamps": [1, "two"]}', typing.Dict[str, typing.List[int]])
+    assert exinfo.value.path == "/timestamps/1"
+
+
+def test_structure_json__list_of_slotted_classes():
+    data = '[{"first_name": "Bobby Jim"}]'
+    assert structure_json(data, typing.List[SlottedGuest]) == [
+        SlottedGuest("Bobby Jim")
+    ]
+
+
+def test_structure_json__recursive():
+    data = '{"text": "Hi", "replies": [{"text": "Yo", "replies": []}]}'
+    expected = Comment(text="Hi", replies=[Comment(text="Yo", replies=[])])
+    assert structure_json(data, Comment) == expected
+
+
+def test_structure_json__invalid_json():
+    with pytest.raises(json.JSONDecodeError):
+        structure_json('{"email": "x", "guests": [}', Invite)
+    with pytest.raises(json.JSONDecodeError):
+        structure_json("[] []", typing.List[int])
+
+
+def test_structure_json__unknown_field():
+    with pytest.raises(ValidationError) as exinfo:
+        structure_json('{"text": "Hi", "replies": [], "likes": 1}', Comment)
+    assert exinfo.value.path == "/likes"
+
+    data = '{"text": "Hi", "replies": [{"text": "Yo", "replies": [], "likes": 1}]}'
+    with pytest.raises(ValidationError) as exinfo:
+        structure_json(data, Comment)
+    assert exinfo.value.path == "/replies/0/likes"
+
+
+def test_structure_json__error_paths_match_structure():
+    value = json.loads(INVITE_JSON)
+    value["guests"][1]["last_name"] = "Joel"
+    value["sounds"]["dog"] = "WOOF"
+    for data, path in [
+        (json.dumps(value), "/guests/1/last_name"),
+        (json.dumps({**value, "guests": []}), "/sounds/dog"),
+    ]:
+        with pytest.raises(ValidationError) as exinfo:
+            structure_json(data, Invite)
+        assert exinfo.value.path == path
+        with pytest.raises(ValidationError) as structure_exinfo:
+            structure(json.loads(data), Invite)
+        assert str(exinfo.value) == str(structure_exinfo.value)
@@ -0,0 +1,67 @@
+import dataclasses
+import datetime
+import decimal
+import io
+import json
+import typing
+import uuid
+
+import pytest  # pylint: disable=import-error
+
+from dataclass_structor import dump_json, unstructure, unstructure_json
+from dataclass_structor import json_unstructure
+
+from ._fixtures import AnimalEnum, DataClassGuest as Guest, SlottedGuest
+
+
+@dataclasses.dataclass
+class Invite:
+    id: uuid.UUID
+    sent: datetime.datetime
+    cost: decimal.Decimal
+    animal: AnimalEnum
+    guests: typing.List[Guest]
+    slotted_guests: typing.Tuple[SlottedGuest, ...]
+    tags: typing.Set[str]
+
+
+INVITE = Invite(
+    id=uuid.UUID("d1337d56-4e6a-4cf7-8f7a-730bf4ea3fac"),
+    sent=datetime.datetime(2018, 2, 1, 2, 2, 2),
+    cost=decimal.Decimal("1.50"),
+    animal=AnimalEnum.CAT,
+    guests=[Guest("Bobby Jim"), Guest()],
+    slotted_guests=(SlottedGuest("Billy Joel"),),
+    tags={"fancy"},
+)
+
+
+def test_unstructure_json__matches_unstructure():
+    expected = unstructure(INVITE)
+    expected["slotted_guests"] = list(expected["slotted_guests"])
+    expected["tags"] = list(expected["tags"])
+    assert json.loads(unstructure_json(INVITE)) == expected
+
+
+def test_unstructure_json__encoder_arguments():
+    assert unstructure_json({"b": 1, "a": Guest()}, sort_keys=True) == (
+        '{"a": {"first_name": null}, "b": 1}'
+    )
+
+
+def test_unstructure_json__unknown_type():
+    with pytest.raises(ValueError):
+        unstructure_json(object())
+
+
+def test_dump_json__text_file():
+    fileobj = io.StringIO()
+    dump_json(INVITE, fileobj)
+    assert fileobj.getvalue() == unstructure_json(INVITE)
+
+
+def test_dump_json__binary_file_in_chunks(monkeypatch):
+    monkeypatch.setattr(json_unstructure, "WRITE_BUFFER_SIZE", 8)
+    fileobj = io.BytesIO()
+    dump_json([INVITE] * 3, fileobj)
+    assert fileobj.getvalue().decode() == unstructure_json([INVITE] * 3)
@@ -0,0 +1,136 @@
+import io
+
+import pytest  # pylint: disable=import-error
+
+from dataclass_structor import IndexedJSONLines, JSONLinesError, iter_structure
+
+from ._fixtures import DataClassGuest as Guest
+
+LINES = '{"first_name": "Bobby Jim"}\n\n{"first_name": null}\n'
+BAD_LINES = '{"first_name": "Bobby Jim"}\n{"first_name":\n{"last_name": "Joel"}\n{}\n'
+
+
+def test_iter_structure__file_object():
+    result = iter_structure(io.StringIO(LINES), Guest)
+    assert list(result) == [Guest("Bobby Jim"), Guest(None)]
+
+
+def test_iter_structure__path(tmp_path):
+    path = tmp_path / "guests.jsonl"
+    path.write_text(LINES)
+    assert list(iter_structure(path, Guest)) == [Guest("Bobby Jim"), Guest(None)]
+    assert list(iter_structure(str(path), Guest)) == [Guest("Bobby Jim"), Guest(None)]
+
+
+def test_iter_structure__bad_line_raises():
+    result = iter_structure(io.BytesIO(BAD_LINES.encode()), Guest)
+    assert next(result) == Guest("Bobby Jim")
+    with pytest.raises(JSONLinesError) as exinfo:
+        next(result)
+    assert exinfo.value.line_number == 2
+    assert "Could not structure line 2" in str(exinfo.value)
+
+
+def test_iter_structure__skip_errors():
+    result = iter_structure(io.StringIO(BAD_LINES), Guest, skip_errors=True)
+    assert list(result) == [Guest("Bobby Jim"), Guest()]
+
+
+def test_iter_structure__collect_bad_lines():
+    bad_lines = []
+    result = iter_structure(io.StringIO(BAD_LINES), Guest, bad_lines=bad_lines)
+    assert list(result) == [Guest("Bobby Jim"), Guest()]
+    assert [error.line_number for error in bad_lines] == [2, 3]
+    assert bad_lines[1].line == '{"last_name": "Joel"}\n'
+
+
+KEYED_LINES = (
+    '{"first_name": "Bobby Jim"}\n  \n{"first_name": "Jo"}\n{"first_name": null}'
+)
+
+
+def test_indexed_json_lines__positions(tmp_path):
+    path = tmp_path / "guests.jsonl"
+    path.write_text(KEYED_LINES)
+    with IndexedJSONLines(path, Guest) as guests:
+        assert len(guests) == 3
+        assert guests[1] == Guest("Jo")
+        assert guests[-1] == Guest(None)
+        assert list(guests) == [Guest("Bobby Jim"), Guest("Jo"), Guest(None)]
+        with pytest.raises(IndexError):
+            guests[3]  # pylint: disable=pointless-statement
+        assert guests[1:] == [Guest("Jo"), Guest(None)]
+        assert guests[::-2] == [Guest(None), Guest("Bobby Jim")]
+        assert guests[5:] == []
+
+
+def test_indexed_json_lines__keys(tmp_path):
+    path = tmp_path / "guests.jsonl"
+    path.write_text(KEYED_LINES)
+    with IndexedJSONLines(path, Guest, key="first_name") as guests:
+        assert guests.get("Jo") == Guest("Jo")
+        assert guests.get(None) == Guest(None)
+        assert guests.get("Missing") is None
+
+
+def test_indexed_json_lines__saved_index(tmp_path):
+    path = tmp_path / "guests.jsonl"
+    index_path = tmp_path / "guests.index"
+    path.write_text(KEYED_LINES)
+    with IndexedJSONLines(path, Guest, key="first_name", index_path=index_path):
+        pass
+    assert index_path.exists()
+
+    with IndexedJSONLines(
+        path, Guest, key="first_name", index_path=index_path
+    ) as guests:
+        assert guests.get("Jo") == Guest("Jo")
+
+    # The index is found again once the file changes.
+    path.write_text('{"first_name": "Al"}\n' + KEYED_LINES)
+    with IndexedJSONLines(
+        path, Guest, key="first_name", index_path=index_path
+    ) as guests:
+        assert len(guests) == 4
+        assert guests.get("Jo") == Guest("Jo")
+        assert guests[0] == Guest("Al")
+
+
+def test_indexed_json_lines__bad_line(tmp_path):
+    path = tmp_path / "guests.jsonl"
+    path.write_text(BAD_LINES)
+    with IndexedJSONLines(path, Guest) as guests:
+        assert guests[0] == Guest("Bobby Jim")
+        with pytest.raises(JSONLinesError) as exinfo:
+            guests[1]  # pylint: disable=pointless-statement
+        assert exinfo.value.line_number == 2
+
+    path.write_text("\n" + BAD_LINES.replace("\n", "\n\n"))
+    with IndexedJSONLines(path, Guest) as guests:
+        with pytest.raises(JSONLinesError) as exinfo:
+            guests[1]  # pylint: disable=pointless-statement
+        assert exinfo.value.line_number == 4
+
+
+def test_indexed_json_lines__empty_file(tmp_path):
+    path = tmp_path / "guests.jsonl"
+    path.write_text("")
+    with IndexedJSONLines(path, Guest) as guests:
+        assert len(guests) == 0
+
+
+def test_indexed_json_lines__closed_when_keys_are_missing(tmp_path, monkeypatch):
+    closed = []
+    close = IndexedJSONLines.close
+
+    def spy_close(self):
+        closed.append(self)
+        close(self)
+
+    monkeypatch.setattr(IndexedJSONLines, "close", spy_close)
+    path = tmp_path / "guests.jsonl"
+    path.write_text('{"first_name": "Bobby Jim"}\n\n{}\n')
+    with pytest.raises(JSONLinesError) as exinfo:
+        IndexedJSONLines(path, Guest, key="first_name")
+    assert exinfo.value.line_number == 3
+    assert len(closed) == 1
@@ -0,0 +1,165 @@
+import dataclasses
+import sys
+import threading
+import typing
+from pickle import dumps, loads
+
+import pytest  # pylint: disable=import-error
+
+from dataclass_structor import (
+    ValidationError,
+    compact_type,
+    structure,
+    structure_lazy,
+    unstructure,
+)
+
+from ._fixtures import DataClassGuest as Guest
+
+
+@dataclasses.dataclass
+class Invite:
+    email: str
+    guests: typing.List[Guest]
+    host: typing.Optional[Guest] = None
+    tags: typing.List[str] = dataclasses.field(default_factory=list)
+
+
+@dataclasses.dataclass(frozen=True)
+class Card:
+    text: str
+    signed_by: typing.Tuple[str, ...]
+
+
+@dataclasses.dataclass
+class SlottedInvite:
+    __slots__ = ("email", "guests")
+    email: str
+    guests: typing.List[Guest]
+
+
+INVITE_VALUE = {
+    "email": "billy@joel.example.com",
+    "guests": [{"first_name": "Bobby Jim"}],
+    "host": {"first_name": "Billy"},
+}
+
+
+def test_structure_lazy__nested_fields_are_structured_on_access():
+    invite = structure_lazy(INVITE_VALUE, Invite)
+    assert isinstance(invite, Invite)
+    assert "guests" not in vars(invite)
+    assert invite.email == "billy@joel.example.com"
+
+    guests = invite.guests
+    assert guests == [Guest(first_name="Bobby Jim")]
+    assert invite.guests is guests
+    assert invite.tags == []
+
+
+def test_structure_lazy__equals_structure():
+    invite = structure_lazy(INVITE_VALUE, Invite)
+    assert invite == structure(INVITE_VALUE, Invite)
+    assert structure(INVITE_VALUE, Invite) == invite
+    assert repr(invite) == repr(structure(INVITE_VALUE, Invite))
+    assert unstructure(invite) == unstructure(structure(INVITE_VALUE, Invite))
+
+
+def test_structure_lazy__vars_hold_only_fields():
+    invite = structure_lazy(INVITE_VALUE, Invite)
+    assert set(vars(invite)) == {"email", "tags"}
+    invite.guests  # pylint: disable=pointless-statement
+    assert set(vars(invite)) == {"email", "guests", "tags"}
+
+
+def _access_guests(invite, barrier, results):
+    barrier.wait()
+    results.append(invite.guests)
+
+
+def test_structure_lazy__first_access_from_threads():
+    value = dict(INVITE_VALUE, guests=[{"first_name": "Bobby Jim"}] * 100)
+    switch_interval = sys.getswitchinterval()
+    # Switch threads often so that they race to structure the guests.
+    sys.setswitchinterval(1e-6)
+    try:
+        for _ in range(100):
+            invite = structure_lazy(value, Invite)
+            barrier = threading.Barrier(4)
+            results: typing.List[typing.List[Guest]] = []
+            threads = [
+                threading.Thread(target=_access_guests, args=(invite, barrier, results))
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert len(results) == 4
+            assert all(guests is invite.guests for guests in results)
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+
+def test_structure_lazy__assign_before_access():
+    invite = structure_lazy(INVITE_VALUE, Invite)
+    invite.guests = []
+    assert invite.guests == []
+
+
+def test_structure_lazy__frozen():
+    card = structure_lazy({"text": "Hi", "signed_by": ["Bobby Jim"]}, Card)
+    assert card.signed_by == ("Bobby Jim",)
+    assert hash(card) == hash(Card(text="Hi", signed_by=("Bobby Jim",)))
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        card.text = "Bye"
+
+
+def test_structure_lazy__list_of_dataclasses():
+    invites = structure_lazy([INVITE_VALUE, None], typing.List[typing.Optional[Invite]])
+    assert invites == [structure(INVITE_VALUE, Invite), None]
+
+
+def test_structure_lazy__unknown_field():
+    with pytest.raises(ValidationError) as exinfo:
+        structure_lazy({"email": "x", "guests": [], "colour": "red"}, Invite)
+    assert exinfo.value.path == "/colour"
+
+
+def test_structure_lazy__missing_field():
+    with pytest.raises(TypeError):
+        structure_lazy({"email": "x"}, Invite)
+
+
+def test_structure_lazy__failed_access_can_be_retried():
+    invite = structure_lazy({"email": "x", "guests": [{"last_name": "Joel"}]}, Invite)
+    for _ in range(2):
+        with pytest.raises(ValidationError) as exinfo:
+            invite.guests  # pylint: disable=pointless-statement
+        assert exinfo.value.path == "/guests/0/last_name"
+    invite.guests = []
+    assert invite.guests == []
+
+
+def test_structure_lazy__errors_in_lists():
+    with pytest.raises(ValidationError) as exinfo:
+        structure_lazy([INVITE_VALUE, {"email": [], "guests": []}], typing.List[Invite])
+    assert exinfo.value.path == "/1/email"
+
+
+def test_structure_lazy__slots():
+    value = {"email": "x", "guests": [{"first_name": "Bobby Jim"}]}
+    for goal_type in (SlottedInvite, compact_type(Invite)):
+        invite = structure_lazy(value, goal_type)
+        assert isinstance(invite, goal_type)
+        assert "guests" not in vars(invite)
+        assert invite.email == "x"
+        assert invite.guests == structure(value, goal_type).guests
+        assert invite == structure(value, goal_type)
+
+
+def test_structure_lazy__pickle():
+    invite = structure_lazy(INVITE_VALUE, Invite)
+    unpickled = loads(dumps(invite))
+    assert type(unpickled) is Invite  # pylint: disable=unidiomatic-typecheck
+    assert unpickled == structure(INVITE_VALUE, Invite)
@@ -0,0 +1,56 @@
+import datetime
+import decimal
+import uuid
+
+import pytest
+
+from dataclass_structor import (
+    parse_cache_info,
+    set_parse_cache_size,
+    stats,
+    structure,
+    structure_many,
+)
+
+
+def test_parse_cache__reuses_parsed_values():
+    set_parse_cache_size(uuid.UUID, 2)
+    try:
+        values = ["00000000-0000-0000-0000-000000000001"] * 3
+        first, second, third = structure_many(values, uuid.UUID)
+        assert first == uuid.UUID(int=1)
+        assert first is second is third
+
+        info = parse_cache_info()[uuid.UUID]
+        assert (info.hits, info.misses, info.maxsize) == (2, 1, 2)
+        assert stats()["caches"]["parsed_UUID"]["hits"] == 2
+    finally:
+        set_parse_cache_size(uuid.UUID, 0)
+
+    assert uuid.UUID not in parse_cache_info()
+
+
+def test_parse_cache__is_bounded():
+    set_parse_cache_size(datetime.date, 1)
+    try:
+        structure_many(["2018-10-01", "2018-10-02", "2018-10-01"], datetime.date)
+        info = parse_cache_info()[datetime.date]
+        assert (info.hits, info.misses, info.currsize) == (0, 3, 1)
+    finally:
+        set_parse_cache_size(datetime.date, 0)
+
+
+def test_parse_cache__errors_are_not_cached():
+    set_parse_cache_size(decimal.Decimal, 10)
+    try:
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                structure("Tomato", decimal.Decimal)
+        assert structure("1.5", decimal.Decimal) == decimal.Decimal("1.5")
+    finally:
+        set_parse_cache_size(decimal.Decimal, 0)
+
+
+def test_parse_cache__unsupported_type():
+    with pytest.raises(ValueError):
+        set_parse_cache_size(str, 10)
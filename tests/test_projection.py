@@ -0,0 +1,86 @@
+import dataclasses
+import pickle
+import typing
+
+import pytest
+
+from dataclass_structor import UNSELECTED, get_structurer, structure, structure_many
+
+from ._fixtures import Line, SlottedGuest
+
+
+@dataclasses.dataclass
+class Customer:
+    id: str
+    name: str
+    guest: typing.Optional[SlottedGuest] = None
+
+
+@dataclasses.dataclass
+class Order:
+    id: str
+    customer: typing.Optional[Customer]
+    lines: typing.List[Line]
+    total: float = 0.0
+    tags: typing.List[str] = dataclasses.field(default_factory=list)
+
+
+VALUE = {
+    "id": "1",
+    "customer": {"id": "c", "name": "Bobby Jim", "guest": {"first_name": "Jo"}},
+    "lines": [{"sku": "a", "quantity": 1}, {"sku": "b", "quantity": 2}],
+    "total": 1.5,
+    "tags": ["gift"],
+    "unknown": object(),
+}
+
+
+def test_projection__nested_fields():
+    order = structure(VALUE, Order, fields={"customer": {"id"}, "total": True})
+    assert order == Order(
+        id=UNSELECTED,
+        customer=Customer(id="c", name=UNSELECTED),
+        lines=UNSELECTED,
+        total=1.5,
+        tags=[],
+    )
+
+
+def test_projection__dotted_paths():
+    order = structure(VALUE, Order, fields=["id", "lines.sku", "customer.guest"])
+    assert order.id == "1"
+    assert order.lines == [Line(sku="a", quantity=UNSELECTED), Line("b", UNSELECTED)]
+    assert order.customer.guest == SlottedGuest("Jo")
+    assert order.customer.name is UNSELECTED
+    assert order.total == 0.0
+
+
+def test_projection__whole_field_wins():
+    structurer = get_structurer(Order, fields=["customer.id", "customer"])
+    assert structurer is get_structurer(Order, fields={"customer": True})
+    assert structurer(VALUE).customer.name == "Bobby Jim"
+
+
+def test_projection__missing_and_none_values():
+    order = structure({"customer": None}, Order, fields={"customer.id", "total"})
+    assert order.customer is None
+    assert order.total == 0.0
+    assert structure(None, Order, fields={"id"}) is None
+
+
+def test_projection__structure_many():
+    orders = structure_many([VALUE] * 3, Order, fields={"id"})
+    assert [order.id for order in orders] == ["1", "1", "1"]
+
+
+def test_projection__errors():
+    with pytest.raises(ValueError):
+        structure(VALUE, Order, fields={"colour"})
+    with pytest.raises(ValueError):
+        structure(VALUE, Order, fields={"tags.name"})
+    with pytest.raises(ValueError):
+        structure({"total": "Tomato"}, Order, fields={"total"})
+
+
+def test_projection__unselected_pickles():
+    assert pickle.loads(pickle.dumps(UNSELECTED)) is UNSELECTED
@@ -0,0 +1,73 @@
+import dataclasses
+import typing
+
+import pytest  # pylint: disable=import-error
+
+from dataclass_structor import register_tagged_union, structure
+
+Literal = getattr(typing, "Literal", None)  # pylint: disable=invalid-name
+requires_literal = pytest.mark.skipif(
+    Literal is None, reason="typing.Literal requires Python 3.8"
+)
+
+
+@dataclasses.dataclass
+class Cat:
+    kind: "Literal['cat']"
+    lives: int
+
+
+@dataclasses.dataclass
+class Dog:
+    kind: "Literal['dog']"
+    lives: int
+
+
+@dataclasses.dataclass
+class Circle:
+    shape: str
+    radius: float
+
+
+@dataclasses.dataclass
+class Square:
+    shape: str
+    side: float
+
+
+@requires_literal
+def test_structure__tagged_union__literal_tags():
+    assert structure({"kind": "cat", "lives": 9}, typing.Union[Dog, Cat]) == Cat(
+        kind="cat", lives=9
+    )
+    assert structure({"kind": "dog", "lives": 1}, typing.Union[Cat, Dog]) == Dog(
+        kind="dog", lives=1
+    )
+
+
+@requires_literal
+def test_structure__tagged_union__unknown_tag():
+    assert structure({"kind": "cow", "lives": 1}, typing.Union[Cat, Dog]) is None
+
+
+@requires_literal
+def test_structure__literal():
+    assert structure("cat", Literal["cat"]) == "cat"
+    with pytest.raises(ValueError):
+        structure("dog", Literal["cat"])
+
+
+def test_structure__tagged_union__registered_tags():
+    shapes = typing.Union[Circle, Square]
+    register_tagged_union(shapes, "shape", {"circle": Circle, "square": Square})
+    assert structure({"shape": "square", "side": 2.0}, shapes) == Square(
+        shape="square", side=2.0
+    )
+    assert structure({"shape": "circle", "radius": 1.0}, shapes) == Circle(
+        shape="circle", radius=1.0
+    )
+
+
+def test_register_tagged_union__without_literal_tags():
+    with pytest.raises(ValueError):
+        register_tagged_union(typing.Union[Circle, Square], "shape")
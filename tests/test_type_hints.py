@@ -0,0 +1,70 @@
+import dataclasses
+import gc
+import typing
+import weakref
+
+from dataclass_structor import (
+    get_structurer,
+    invalidate_type_hints,
+    resolve_type_hints,
+    structure,
+)
+from dataclass_structor.structure import _TYPES_WITH_HINTS
+
+from ._fixtures import DataClassGuest, SlottedGuest
+
+
+def test_resolve_type_hints__dataclass():
+    expected = {"first_name": typing.Optional[str]}
+    assert resolve_type_hints(DataClassGuest) == expected
+    assert resolve_type_hints(DataClassGuest) is resolve_type_hints(DataClassGuest)
+
+
+def test_resolve_type_hints__slotted_class_uses_constructor():
+    expected = {"first_name": typing.Optional[str]}
+    assert resolve_type_hints(SlottedGuest) == expected
+    assert resolve_type_hints(SlottedGuest) is resolve_type_hints(SlottedGuest)
+
+
+def test_invalidate_type_hints__single_type():
+    hints = resolve_type_hints(DataClassGuest)
+    structurer = get_structurer(DataClassGuest)
+    invalidate_type_hints(DataClassGuest)
+    assert resolve_type_hints(DataClassGuest) is not hints
+    assert get_structurer(DataClassGuest) is not structurer
+
+
+def test_invalidate_type_hints__all_types():
+    resolve_type_hints(DataClassGuest)
+    invalidate_type_hints()
+    assert DataClassGuest not in _TYPES_WITH_HINTS
+
+
+def test_resolve_type_hints__dynamic_classes_can_be_collected():
+    dynamic = dataclasses.make_dataclass("Dynamic", [("name", str)])
+    assert structure({"name": "x"}, dynamic) == dynamic(name="x")
+    assert dynamic in _TYPES_WITH_HINTS
+    size = len(_TYPES_WITH_HINTS)
+
+    invalidate_type_hints(dynamic)  # Drops the compiled structurers too.
+    resolve_type_hints(dynamic)
+    del dynamic
+    gc.collect()
+    assert len(_TYPES_WITH_HINTS) == size - 1
+
+    # The hints of a class which refers to itself refer to the class. This is a
+    # bare forward reference, since typing keeps generic aliases such as
+    # `List["Node"]` in caches of its own.
+    node = dataclasses.make_dataclass("Node", [("parent", "Node")])
+    node.__module__ = __name__
+    globals()["Node"] = node
+    try:
+        assert resolve_type_hints(node) == {"parent": node}
+    finally:
+        del globals()["Node"]
+    assert node in _TYPES_WITH_HINTS
+    node_ref = weakref.ref(node)
+
+    del node
+    gc.collect()
+    assert node_ref() is None
@@ -29,3 +29,10 @@ def test_structure__union__more_specific_types__datetime():
     datetime_obj = datetime(2018, 9, 1, 0, 57, 11, tzinfo=timezone.utc)
     datetime_str = "2018-09-01T00:57:11+00:00"
     assert structure(datetime_str, Union[str, datetime]) == datetime_obj
+
+
+def test_structure__union__tries_members_by_value_type():
+    assert structure(1, Union[datetime, int]) == 1
+    assert structure("1", Union[datetime, int, str]) == 1
+    assert structure(1.5, Union[int, float]) == 1.5
+    assert structure([1], Union[int, str]) is None
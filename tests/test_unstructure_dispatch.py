@@ -0,0 +1,61 @@
+import dataclasses
+import datetime
+import gc
+import importlib
+import weakref
+
+from dataclass_structor import unstructure, unstructure_json
+
+from ._fixtures import DataClassGuest as Guest
+
+# The module is shadowed by the function of the same name in the package.
+unstructure_module = importlib.import_module("dataclass_structor.unstructure")
+
+
+@dataclasses.dataclass
+class VipGuest(Guest):
+    table: int = 1
+
+
+class SingleSlot:  # pylint: disable=single-string-used-for-slots
+    __slots__ = "name"
+
+    def __init__(self, name):
+        self.name = name
+
+
+class MyDate(datetime.date):
+    pass
+
+
+def test_unstructure__same_type_many_times():
+    guests = [Guest(first_name=str(i)) for i in range(3)]
+    assert unstructure(guests) == [{"first_name": str(i)} for i in range(3)]
+    assert unstructure(guests) == [{"first_name": str(i)} for i in range(3)]
+
+
+def test_unstructure__dataclass_subclass():
+    expected = {"first_name": "Bobby Jim", "table": 3}
+    assert unstructure(VipGuest(first_name="Bobby Jim", table=3)) == expected
+    assert unstructure(Guest(first_name="Bobby Jim")) == {"first_name": "Bobby Jim"}
+
+
+def test_unstructure__slots_as_a_string():
+    assert unstructure(SingleSlot("Bobby Jim")) == {"name": "Bobby Jim"}
+
+
+def test_unstructure__date_subclass():
+    assert unstructure(MyDate(2018, 8, 28)) == "2018-08-28"
+
+
+def test_unstructure__dynamic_classes_can_be_collected(monkeypatch):
+    monkeypatch.setattr(unstructure_module, "UNSTRUCTURER_CACHE_SIZE", 2)
+    dynamic_refs = []
+    for i in range(4):
+        dynamic = dataclasses.make_dataclass("Dynamic", [("name", str)])
+        assert unstructure(dynamic(str(i))) == {"name": str(i)}
+        assert unstructure_json(dynamic(str(i))) == f'{{"name": "{i}"}}'
+        dynamic_refs.append(weakref.ref(dynamic))
+    del dynamic
+    gc.collect()
+    assert [dynamic_ref() for dynamic_ref in dynamic_refs[:2]] == [None, None]
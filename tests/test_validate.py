@@ -0,0 +1,100 @@
+import dataclasses
+import datetime
+import typing
+
+import pytest
+
+from dataclass_structor import ValidationError, structure, validate
+
+from ._fixtures import AnimalEnum, SlottedGuest
+
+
+@dataclasses.dataclass
+class Line:
+    sku: str
+    quantity: int
+    animal: typing.Optional[AnimalEnum] = None
+
+
+@dataclasses.dataclass
+class Order:
+    placed: datetime.date
+    lines: typing.List[Line]
+    notes: typing.Dict[str, int] = dataclasses.field(default_factory=dict)
+    size: typing.Tuple[int, int] = (1, 1)
+    code: typing.Union[int, datetime.date, None] = None
+
+
+@dataclasses.dataclass
+class Tree:
+    name: str
+    children: typing.List["Tree"]
+
+
+def _paths(errors):
+    return [error.path for error in errors]
+
+
+def test_validate__valid_values():
+    value = {
+        "placed": "2018-10-02",
+        "lines": [{"sku": "a", "quantity": 1, "animal": "ANT"}],
+        "notes": {"a": 1},
+        "size": [2, 3],
+        "code": 4,
+    }
+    assert validate(value, Order) == []
+    assert validate(None, Order) == []
+    assert validate("2018-10-02", datetime.date) == []
+    assert validate({"first_name": "Bobby Jim"}, SlottedGuest) == []
+    structure(value, Order)
+
+
+def test_validate__collects_every_error():
+    value = {
+        "placed": "Tomato",
+        "lines": [
+            {"sku": "a", "quantity": 1},
+            {"sku": "b", "quantity": "many", "colour": "red"},
+            {"quantity": 1, "animal": "COW"},
+        ],
+        "notes": {"a/b": "x"},
+        "size": [1],
+        "code": "Potato",
+    }
+    errors = validate(value, Order)
+    assert _paths(errors) == [
+        "/placed",
+        "/lines/1/quantity",
+        "/lines/1/colour",
+        "/lines/2/animal",
+        "/lines/2/sku",
+        "/notes/a~1b",
+        "/size",
+        "/code",
+    ]
+    assert all(isinstance(error, ValidationError) for error in errors)
+    assert errors[4].message == f"Missing a required field of {Line}"
+    assert str(errors[2]) == f"/lines/1/colour: Not a field of {Line}"
+
+
+def test_validate__root_errors():
+    (error,) = validate("Tomato", datetime.date)
+    assert error.path == ""
+    with pytest.raises(ValueError):
+        structure("Tomato", datetime.date)
+
+
+def test_validate__recursive_types():
+    value = {"name": "a", "children": [{"name": "b", "children": [{"name": 1.5}]}]}
+    assert _paths(validate(value, Tree)) == [
+        "/children/0/children/0/name",
+        "/children/0/children/0/children",
+    ]
+
+
+def test_validate__unions():
+    union = typing.Union[int, datetime.date]
+    assert validate("2018-10-02", union) == []
+    assert validate(5, union) == []
+    assert _paths(validate([1], union)) == [""]
@@ -0,0 +1,90 @@
+import dataclasses
+import json
+import sys
+import typing
+
+from dataclass_structor import (
+    invalidate_type_hints,
+    register,
+    save_warmup_plan,
+    structure,
+    warmup,
+)
+from dataclass_structor.structure import _TYPES_WITH_HINTS
+from dataclass_structor.unstructure import _UNSTRUCTURERS_BY_TYPE
+from dataclass_structor.warmup import PLAN_FILE_NAME, _REGISTERED_TYPES, _load_plan
+
+from ._fixtures import DataClassGuest, SlottedGuest
+
+
+@dataclasses.dataclass
+class WarmInvite:
+    guests: typing.List[DataClassGuest]
+    host: typing.Optional[SlottedGuest] = None
+
+
+def _unregister():
+    del _REGISTERED_TYPES[:]
+    invalidate_type_hints()
+    _UNSTRUCTURERS_BY_TYPE.pop(WarmInvite, None)
+    _UNSTRUCTURERS_BY_TYPE.pop(DataClassGuest, None)
+    _UNSTRUCTURERS_BY_TYPE.pop(SlottedGuest, None)
+
+
+def test_register__returns_the_type_for_use_as_a_decorator():
+    try:
+        assert register(WarmInvite, DataClassGuest) is WarmInvite
+        register(WarmInvite)
+        assert _REGISTERED_TYPES == [WarmInvite, DataClassGuest]
+    finally:
+        _unregister()
+
+
+def test_warmup__compiles_nested_types():
+    _unregister()
+    try:
+        register(WarmInvite)
+        warmup()
+        for goal_type in (WarmInvite, DataClassGuest, SlottedGuest):
+            assert goal_type in _TYPES_WITH_HINTS
+            assert goal_type in _UNSTRUCTURERS_BY_TYPE
+    finally:
+        _unregister()
+
+
+def test_warmup__plan_lists_classes_used_by_the_last_process(tmp_path):
+    _unregister()
+    structure({"guests": []}, WarmInvite)
+    save_warmup_plan(tmp_path)
+
+    assert WarmInvite in list(_load_plan(tmp_path))
+    warmup(tmp_path)
+    assert DataClassGuest in _TYPES_WITH_HINTS
+    _unregister()
+
+
+def test_warmup__plan_skips_changed_classes(tmp_path):
+    save_warmup_plan(tmp_path)
+    plan_path = tmp_path / PLAN_FILE_NAME
+    plan = [
+        {"module": __name__, "qualname": "WarmInvite", "fingerprint": "changed"},
+        {"module": "not_a_module", "qualname": "Missing", "fingerprint": ""},
+    ]
+    plan_path.write_text(json.dumps(plan))
+
+    assert not list(_load_plan(tmp_path))
+
+
+def test_warmup__plan_does_not_import_modules(tmp_path, monkeypatch):
+    (tmp_path / "unimported_plan_module.py").write_text("class Guest:\n    pass\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    plan = [{"module": "unimported_plan_module", "qualname": "Guest"}]
+    (tmp_path / PLAN_FILE_NAME).write_text(json.dumps(plan))
+
+    assert not list(_load_plan(tmp_path))
+    assert "unimported_plan_module" not in sys.modules
+
+
+def test_warmup__missing_plan(tmp_path):
+    warmup(tmp_path / "missing")
+    assert (tmp_path / "missing" / PLAN_FILE_NAME).exists()